@@ -4,17 +4,27 @@ Flask Web Application for AWS AI for Bharat Tracking System
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, send_from_directory, session, stream_with_context, Response
 from datetime import datetime, timedelta
 from functools import wraps
+from typing import NamedTuple
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import itertools
 import json
+import logging
 import os
+import queue
+import threading
+import time
 import uuid
 from werkzeug.utils import secure_filename
 import requests
-from bs4 import BeautifulSoup
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from urllib.parse import quote, urlparse
+from psycopg2.extras import RealDictCursor
 from database import (
     db_manager, UserPII, FormResponse, AWSTeamBuilding,
-    ProjectSubmission, Verification, MasterLogs, KiroSubmission,
+    ProjectSubmission, Verification, MasterLogs, KiroSubmission, GitHubRepoETag,
     RBACUser, RBACPermission, RBACUserPermission
 )
 from import_utils import parse_master_workbook, parse_user_pii_workbook
@@ -27,8 +37,33 @@ from database_advanced import (
     bulk_upsert_advanced_hands_on_lab_completion
 )
 from google_sheets_utils import GoogleSheetsExporter
+from cache_utils import blog_metrics_cache, dashboard_cache, github_etag_cache, github_repo_cache, ttl_cached
+from http_utils import github_rate_limiter, github_session, github_tokens, read_limited, scraper_session, GITHUB_MAX_WORKERS, SCRAPER_MAX_WORKERS, SCRAPER_TIMEOUT
+from html_utils import COMMENT_BUTTON_LABEL, LIKE_BUTTON_LABEL, extract_action_count, parse_html
+from json_utils import OrJSONProvider, coalesce_events, ndjson_line
+
+# Selenium is only needed to scrape builder.aws.com blog metrics
+try:
+    from browser_utils import CHROME_POOL
+    _SELENIUM_AVAILABLE = True
+    _SELENIUM_IMPORT_ERROR = None
+except ImportError as e:
+    CHROME_POOL = None
+    _SELENIUM_AVAILABLE = False
+    _SELENIUM_IMPORT_ERROR = str(e)
+
+# INFO by default so logger.debug() calls on hot paths are skipped before any formatting.
+# Records are handed to a queue and written to stderr by a listener thread, so
+# worker threads logging errors don't contend on the stream lock.
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
+app.json = OrJSONProvider(app)
 app.secret_key = 'aws-ai-bharat-secret-key-change-in-production'
 
 # Upload configuration
@@ -249,48 +284,69 @@ def logout():
 # ============================================
 # Routes - Dashboard
 # ============================================
-@app.route('/')
-@login_required
-@permission_required('index')
-def index():
-    """Main dashboard"""
-    try:
-        # Get recent activity logs
-        recent_logs = MasterLogs.get_all(limit=10)
-        
-        # Get statistics using SQL COUNT queries for accuracy
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
+# Tables at or above this many rows use the planner's row estimate for
+# dashboard cards instead of an exact COUNT(*)
+APPROX_COUNT_THRESHOLD = 100000
+
+
+def _count_rows(cursor, table_name):
+    """Count rows in a table for a dashboard card
+    
+    Large tables use pg_class.reltuples, which is O(1) but only as fresh as the
+    last ANALYZE/autovacuum; small tables (or never-analyzed ones, where
+    reltuples is -1) fall back to an exact COUNT(*).
+    """
+    cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", (table_name,))
+    row = cursor.fetchone()
+    estimate = row[0] if row else None
+    if estimate is not None and estimate >= APPROX_COUNT_THRESHOLD:
+        return estimate
+    
+    cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+    return cursor.fetchone()[0]
+
+
+@ttl_cached(dashboard_cache, 'dashboard_stats')
+def _get_dashboard_stats():
+    """Get dashboard card counts (cached briefly)"""
+    with db_manager.pooled_cursor() as cursor:
         
         # Count total registrations (from user_pii table)
-        cursor.execute("SELECT COUNT(*) FROM user_pii")
-        total_registration = cursor.fetchone()[0]
+        total_registration = _count_rows(cursor, 'user_pii')
         
         # Count total form submissions (from form_response table)
-        cursor.execute("SELECT COUNT(*) FROM form_response")
-        total_form_submission = cursor.fetchone()[0]
+        total_form_submission = _count_rows(cursor, 'form_response')
         
         # Count total blog submissions (from project_submission table)
-        cursor.execute("SELECT COUNT(*) FROM project_submission")
-        total_blog_submission = cursor.fetchone()[0]
+        total_blog_submission = _count_rows(cursor, 'project_submission')
         
         # Count total Kiro submissions
-        cursor.execute("SELECT COUNT(*) FROM kiro_submission")
-        total_kiro_submission = cursor.fetchone()[0]
+        total_kiro_submission = _count_rows(cursor, 'kiro_submission')
         
         # Count total Kiro weeks
         cursor.execute("SELECT COUNT(DISTINCT week_number) FROM kiro_submission")
         total_kiro_weeks = cursor.fetchone()[0]
+    
+    return {
+        'total_registration': total_registration,
+        'total_form_submission': total_form_submission,
+        'total_blog_submission': total_blog_submission,
+        'total_kiro_submission': total_kiro_submission,
+        'total_kiro_weeks': total_kiro_weeks
+    }
+
+
+@app.route('/')
+@login_required
+@permission_required('index')
+def index():
+    """Main dashboard"""
+    try:
+        # Get recent activity logs
+        recent_logs = MasterLogs.get_all(limit=10)
         
-        db_manager.return_connection(conn)
-        
-        stats = {
-            'total_registration': total_registration,
-            'total_form_submission': total_form_submission,
-            'total_blog_submission': total_blog_submission,
-            'total_kiro_submission': total_kiro_submission,
-            'total_kiro_weeks': total_kiro_weeks
-        }
+        # Get statistics (shared across requests for a short TTL)
+        stats = _get_dashboard_stats()
         
         return render_template('dashboard.html', recent_logs=recent_logs, stats=stats)
     except Exception as e:
@@ -298,216 +354,239 @@ def index():
         return render_template('dashboard.html', recent_logs=[], stats={})
 
 
+# ============================================
+# Dashboard demographics queries
+# ============================================
+# Each query is independent and cached on its own, so a dashboard panel only
+# waits for the query that feeds it (see get_dashboard_panel()). The aggregate
+# get_demographics() runs them concurrently on separate pooled connections.
+# Breakdowns sharing a base table are computed with GROUPING SETS so the table
+# is read once.
+
+# Gender, occupation, state, city, designation and age distributions from a
+# single pass over user_pii. Each row is tagged with the dimension it belongs
+# to; NULL/empty values are dropped except for age ('Not Specified').
+# Age buckets compare date_of_birth against per-statement cutoff dates rather
+# than running AGE() per row; a generated age_group column is not possible
+# because the bucket depends on CURRENT_DATE, which is not immutable.
+DEMOGRAPHICS_USER_PII_SQL = """
+    SELECT 
+        CASE 
+            WHEN GROUPING(gender) = 0 THEN 'gender'
+            WHEN GROUPING(occupation) = 0 THEN 'occupation'
+            WHEN GROUPING(state) = 0 THEN 'state'
+            WHEN GROUPING(city) = 0 THEN 'city'
+            WHEN GROUPING(designation) = 0 THEN 'designation'
+            ELSE 'age'
+        END as dimension,
+        COALESCE(gender, occupation, state, city, designation, age_group) as value,
+        COUNT(*) as count
+    FROM (
+        SELECT 
+            NULLIF(gender, '') as gender,
+            NULLIF(occupation, '') as occupation,
+            NULLIF(state, '') as state,
+            NULLIF(city, '') as city,
+            NULLIF(designation, '') as designation,
+            CASE 
+                WHEN date_of_birth IS NULL THEN 'Not Specified'
+                WHEN date_of_birth > CURRENT_DATE - INTERVAL '18 years' THEN 'Under 18'
+                WHEN date_of_birth > CURRENT_DATE - INTERVAL '26 years' THEN '18-25'
+                WHEN date_of_birth > CURRENT_DATE - INTERVAL '31 years' THEN '26-30'
+                WHEN date_of_birth > CURRENT_DATE - INTERVAL '36 years' THEN '31-35'
+                WHEN date_of_birth > CURRENT_DATE - INTERVAL '41 years' THEN '36-40'
+                WHEN date_of_birth > CURRENT_DATE - INTERVAL '51 years' THEN '41-50'
+                ELSE 'Above 50'
+            END as age_group
+        FROM user_pii
+    ) as u
+    GROUP BY GROUPING SETS ((gender), (occupation), (state), (city), (designation), (age_group))
+    HAVING COALESCE(gender, occupation, state, city, designation, age_group) IS NOT NULL
+    ORDER BY dimension, count DESC
+"""
+
+# Workshop bookings, time slot distribution and the occupation breakdown by
+# workshop and time slot from a single pass over form_response.
+# effective_time_slot is resolved on write (see migration_add_effective_time_slot.sql)
+DEMOGRAPHICS_FORM_RESPONSE_SQL = """
+    SELECT 
+        CASE GROUPING(fr.form_name, fr.effective_time_slot, COALESCE(NULLIF(u.occupation, ''), 'Unknown'))
+            WHEN 3 THEN 'workshop_bookings'
+            WHEN 5 THEN 'time_slots'
+            ELSE 'workshop_occupation'
+        END as dimension,
+        fr.form_name as workshop,
+        fr.effective_time_slot as time_slot,
+        COALESCE(NULLIF(u.occupation, ''), 'Unknown') as occupation,
+        COUNT(*) as count
+    FROM form_response fr
+    LEFT JOIN user_pii u ON fr.email = u.email
+    GROUP BY GROUPING SETS (
+        (fr.form_name),
+        (fr.effective_time_slot),
+        (fr.form_name, fr.effective_time_slot, COALESCE(NULLIF(u.occupation, ''), 'Unknown'))
+    )
+"""
+
+# registration_daily is maintained by the bump_registration_daily trigger on user_pii
+DEMOGRAPHICS_REGISTRATION_TREND_SQL = """
+    SELECT 
+        TO_CHAR(registration_date, 'YYYY-MM-DD') as date,
+        registration_count as count
+    FROM registration_daily
+    WHERE registration_count > 0
+    ORDER BY registration_date DESC
+    LIMIT 60
+"""
+
+# Display order for the age distribution
+AGE_GROUP_ORDER = ['Under 18', '18-25', '26-30', '31-35', '36-40', '41-50', 'Above 50', 'Not Specified']
+
+# Number of entries kept per user_pii dimension (None keeps all)
+DEMOGRAPHICS_LIMITS = {
+    'gender': None,
+    'occupation': 20,
+    'state': None,
+    'city': 20,
+    'designation': 15,
+}
+
+
+def _run_demographics_query(sql):
+    """Run one demographics query on its own pooled connection and return all rows"""
+    with db_manager.pooled_cursor() as cursor:
+        cursor.execute(sql)
+        return cursor.fetchall()
+
+
+@ttl_cached(dashboard_cache, 'demographics_user_pii')
+def _get_user_pii_demographics():
+    """Gender, occupation, state, city, age and designation distributions (cached briefly)"""
+    user_pii_rows = _run_demographics_query(DEMOGRAPHICS_USER_PII_SQL)
+    
+    # Dispatch user_pii grouping set rows (already ordered by count DESC per dimension)
+    user_pii_data = {dimension: {} for dimension in list(DEMOGRAPHICS_LIMITS) + ['age']}
+    for dimension, value, count in user_pii_rows:
+        limit = DEMOGRAPHICS_LIMITS.get(dimension)
+        if limit is None or len(user_pii_data[dimension]) < limit:
+            user_pii_data[dimension][value] = count
+    
+    age_counts = user_pii_data['age']
+    user_pii_data['age'] = {group: age_counts[group] for group in AGE_GROUP_ORDER if group in age_counts}
+    return user_pii_data
+
+
+@ttl_cached(dashboard_cache, 'demographics_form_response')
+def _get_form_response_demographics():
+    """Workshop bookings, time slots and workshop occupation breakdown (cached briefly)"""
+    form_response_rows = _run_demographics_query(DEMOGRAPHICS_FORM_RESPONSE_SQL)
+    
+    # Dispatch form_response grouping set rows
+    workshop_bookings = {}
+    time_slot_counts = []
+    workshop_occupation_data = []
+    for dimension, workshop, time_slot, occupation, count in form_response_rows:
+        if dimension == 'workshop_bookings':
+            workshop_bookings[workshop] = count
+        elif dimension == 'time_slots':
+            time_slot_counts.append((time_slot, count))
+        elif workshop and workshop.startswith('Workshop '):
+            workshop_occupation_data.append({
+                'workshop': workshop,
+                'time_slot': time_slot,
+                'occupation': occupation,
+                'count': count
+            })
+    
+    time_slot_counts.sort(key=lambda item: item[1], reverse=True)
+    workshop_occupation_data.sort(key=lambda item: (item['workshop'], item['time_slot'], item['occupation']))
+    
+    return {
+        'workshop_bookings': dict(sorted(workshop_bookings.items())),
+        'time_slots': dict(time_slot_counts[:15]),
+        'workshop_occupation_breakdown': workshop_occupation_data
+    }
+
+
+@ttl_cached(dashboard_cache, 'demographics_registration_trend')
+def _get_registration_trend():
+    """Registrations per day for the last 60 registration dates (cached briefly)"""
+    rows = _run_demographics_query(DEMOGRAPHICS_REGISTRATION_TREND_SQL)
+    return {'registration_trend': {row[0]: row[1] for row in rows}}
+
+
+# Dashboard panel name -> loader returning a dict that contains that panel
+DEMOGRAPHICS_PANELS = {
+    'gender': _get_user_pii_demographics,
+    'occupation': _get_user_pii_demographics,
+    'state': _get_user_pii_demographics,
+    'city': _get_user_pii_demographics,
+    'age': _get_user_pii_demographics,
+    'designation': _get_user_pii_demographics,
+    'workshop_bookings': _get_form_response_demographics,
+    'time_slots': _get_form_response_demographics,
+    'workshop_occupation_breakdown': _get_form_response_demographics,
+    'registration_trend': _get_registration_trend,
+}
+
+DEMOGRAPHICS_LOADERS = [
+    _get_user_pii_demographics,
+    _get_form_response_demographics,
+    _get_registration_trend,
+]
+
+
+def _get_demographics_data():
+    """Run every demographics loader and assemble the combined API payload"""
+    # Fan the independent loaders out across pooled connections so the
+    # total wait is the slowest query rather than the sum of all of them
+    with ThreadPoolExecutor(max_workers=len(DEMOGRAPHICS_LOADERS)) as executor:
+        results = list(executor.map(lambda loader: loader(), DEMOGRAPHICS_LOADERS))
+    
+    data = {'success': True}
+    for result in results:
+        data.update(result)
+    return data
+
+
 @app.route('/api/dashboard/demographics')
 @login_required
 @permission_required('index')
 def get_demographics():
-    """Get demographic statistics for dashboard"""
+    """Get all demographic statistics for dashboard
+    
+    Deprecated: the dashboard loads each panel from /api/dashboard/panel/<panel_name>.
+    """
     try:
-        print("=== Demographics API Called ===")
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-        
-        # Gender distribution
-        cursor.execute("""
-            SELECT gender, COUNT(*) as count 
-            FROM user_pii 
-            WHERE gender IS NOT NULL AND gender != ''
-            GROUP BY gender 
-            ORDER BY count DESC
-        """)
-        gender_data = {row[0]: row[1] for row in cursor.fetchall()}
-        print(f"Gender data: {gender_data}")
-        
-        # Occupation distribution
-        cursor.execute("""
-            SELECT occupation, COUNT(*) as count 
-            FROM user_pii 
-            WHERE occupation IS NOT NULL AND occupation != ''
-            GROUP BY occupation 
-            ORDER BY count DESC
-            LIMIT 20
-        """)
-        occupation_data = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        # State distribution
-        cursor.execute("""
-            SELECT state, COUNT(*) as count 
-            FROM user_pii 
-            WHERE state IS NOT NULL AND state != ''
-            GROUP BY state 
-            ORDER BY count DESC
-        """)
-        state_data = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        # City distribution (top 20)
-        cursor.execute("""
-            SELECT city, COUNT(*) as count 
-            FROM user_pii 
-            WHERE city IS NOT NULL AND city != ''
-            GROUP BY city 
-            ORDER BY count DESC
-            LIMIT 20
-        """)
-        city_data = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        # Age distribution (calculated from date_of_birth)
-        # Use a subquery to calculate age groups, then order by the group name
-        cursor.execute("""
-            SELECT age_group, count
-            FROM (
-                SELECT 
-                    CASE 
-                        WHEN date_of_birth IS NULL THEN 'Not Specified'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) < 18 THEN 'Under 18'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) BETWEEN 18 AND 25 THEN '18-25'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) BETWEEN 26 AND 30 THEN '26-30'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) BETWEEN 31 AND 35 THEN '31-35'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) BETWEEN 36 AND 40 THEN '36-40'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) BETWEEN 41 AND 50 THEN '41-50'
-                        ELSE 'Above 50'
-                    END as age_group,
-                    COUNT(*) as count
-                FROM user_pii
-                GROUP BY 
-                    CASE 
-                        WHEN date_of_birth IS NULL THEN 'Not Specified'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) < 18 THEN 'Under 18'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) BETWEEN 18 AND 25 THEN '18-25'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) BETWEEN 26 AND 30 THEN '26-30'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) BETWEEN 31 AND 35 THEN '31-35'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) BETWEEN 36 AND 40 THEN '36-40'
-                        WHEN EXTRACT(YEAR FROM AGE(date_of_birth)) BETWEEN 41 AND 50 THEN '41-50'
-                        ELSE 'Above 50'
-                    END
-            ) as age_groups
-            ORDER BY 
-                CASE age_group
-                    WHEN 'Under 18' THEN 1
-                    WHEN '18-25' THEN 2
-                    WHEN '26-30' THEN 3
-                    WHEN '31-35' THEN 4
-                    WHEN '36-40' THEN 5
-                    WHEN '41-50' THEN 6
-                    WHEN 'Above 50' THEN 7
-                    WHEN 'Not Specified' THEN 8
-                    ELSE 9
-                END
-        """)
-        age_data = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        # Workshop slot bookings (from form_response)
-        cursor.execute("""
-            SELECT form_name, COUNT(*) as count 
-            FROM form_response 
-            GROUP BY form_name 
-            ORDER BY form_name
-        """)
-        workshop_bookings = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        # Time slot distribution
-        cursor.execute("""
-            SELECT slot, COUNT(*) as count
-            FROM (
-                SELECT 
-                    CASE 
-                        WHEN time_slot_range IS NOT NULL AND time_slot_range != '' THEN time_slot_range
-                        WHEN time_slot IS NOT NULL THEN TO_CHAR(time_slot::TIMESTAMP, 'YYYY-MM-DD HH24:MI')
-                        ELSE 'No Time Slot'
-                    END as slot
-                FROM form_response
-            ) as slots
-            GROUP BY slot
-            ORDER BY count DESC
-            LIMIT 15
-        """)
-        time_slot_data = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        # Designation distribution (top 15)
-        cursor.execute("""
-            SELECT designation, COUNT(*) as count 
-            FROM user_pii 
-            WHERE designation IS NOT NULL AND designation != ''
-            GROUP BY designation 
-            ORDER BY count DESC
-            LIMIT 15
-        """)
-        designation_data = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        # Registration trend (by date)
-        cursor.execute("""
-            SELECT 
-                TO_CHAR(registration_date_time, 'YYYY-MM-DD') as date,
-                COUNT(*) as count
-            FROM user_pii
-            WHERE registration_date_time IS NOT NULL
-            GROUP BY date
-            ORDER BY date DESC
-            LIMIT 60
-        """)
-        registration_trend = {row[0]: row[1] for row in cursor.fetchall()}
-        
-        # Occupation breakdown by workshop and time slot
-        cursor.execute("""
-            SELECT 
-                fr.form_name as workshop,
-                COALESCE(
-                    NULLIF(fr.time_slot_range, ''),
-                    CASE 
-                        WHEN fr.time_slot IS NOT NULL 
-                        THEN TO_CHAR(fr.time_slot::TIMESTAMP, 'YYYY-MM-DD HH24:MI')
-                        ELSE 'No Time Slot'
-                    END
-                ) as time_slot,
-                COALESCE(NULLIF(u.occupation, ''), 'Unknown') as occupation,
-                COUNT(*) as count
-            FROM form_response fr
-            LEFT JOIN user_pii u ON fr.email = u.email
-            WHERE fr.form_name LIKE 'Workshop %'
-            GROUP BY fr.form_name, 
-                     COALESCE(
-                         NULLIF(fr.time_slot_range, ''),
-                         CASE 
-                             WHEN fr.time_slot IS NOT NULL 
-                             THEN TO_CHAR(fr.time_slot::TIMESTAMP, 'YYYY-MM-DD HH24:MI')
-                             ELSE 'No Time Slot'
-                         END
-                     ),
-                     COALESCE(NULLIF(u.occupation, ''), 'Unknown')
-            ORDER BY fr.form_name, time_slot, occupation
-        """)
-        workshop_occupation_data = []
-        for row in cursor.fetchall():
-            workshop_occupation_data.append({
-                'workshop': row[0],
-                'time_slot': row[1],
-                'occupation': row[2],
-                'count': row[3]
-            })
-        
-        db_manager.return_connection(conn)
-        
-        result = {
-            'success': True,
-            'gender': gender_data,
-            'occupation': occupation_data,
-            'state': state_data,
-            'city': city_data,
-            'age': age_data,
-            'workshop_bookings': workshop_bookings,
-            'time_slots': time_slot_data,
-            'designation': designation_data,
-            'registration_trend': registration_trend,
-            'workshop_occupation_breakdown': workshop_occupation_data
-        }
-        
-        print(f"Demographics result: {result}")
+        result = _get_demographics_data()
+        logger.debug("Demographics result: %s", result)
         return jsonify(result)
     
     except Exception as e:
-        print(f"ERROR in demographics endpoint: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in demographics endpoint")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/api/dashboard/panel/<panel_name>')
+@login_required
+@permission_required('index')
+def get_dashboard_panel(panel_name):
+    """Get the data for a single dashboard panel"""
+    loader = DEMOGRAPHICS_PANELS.get(panel_name)
+    if loader is None:
+        return jsonify({'success': False, 'error': f'Unknown dashboard panel: {panel_name}'}), 404
+    
+    try:
+        return jsonify({
+            'success': True,
+            panel_name: loader()[panel_name]
+        })
+    
+    except Exception as e:
+        logger.exception("Error in dashboard panel endpoint: %s", panel_name)
         return jsonify({
             'success': False,
             'error': str(e)
@@ -517,17 +596,53 @@ def get_demographics():
 # ============================================
 # Routes - User PII
 # ============================================
+USERS_PAGE_SIZE = 50
+
+
+def _format_user_cursor(user):
+    """Encode a user's (registration_date_time, email) keyset position for a URL"""
+    return f"{user['registration_date_time'].isoformat()}|{user['email']}"
+
+
+def _parse_user_cursor(value):
+    """Decode a cursor from _format_user_cursor; returns None if missing or malformed"""
+    if not value or '|' not in value:
+        return None
+    timestamp, email = value.split('|', 1)
+    try:
+        return (datetime.fromisoformat(timestamp), email)
+    except ValueError:
+        return None
+
+
 @app.route('/users')
 @login_required
 @permission_required('users_list')
 def users_list():
-    """List all users"""
+    """List users, one page at a time"""
+    search = request.args.get('q', '').strip()
+    after = _parse_user_cursor(request.args.get('after'))
+    before = None if after else _parse_user_cursor(request.args.get('before'))
     try:
-        users = UserPII.list_all()
-        return render_template('users_list.html', users=users)
+        users, has_more = UserPII.list_page(USERS_PAGE_SIZE, after=after, before=before, search=search or None)
+        
+        # Paging backwards: has_more means there is an earlier page, and the
+        # page we came from is always there
+        if before:
+            has_prev, has_next = has_more, True
+        else:
+            has_prev, has_next = after is not None, has_more
+        
+        return render_template(
+            'users_list.html',
+            users=users,
+            search=search,
+            next_cursor=_format_user_cursor(users[-1]) if has_next and users else None,
+            prev_cursor=_format_user_cursor(users[0]) if has_prev and users else None
+        )
     except Exception as e:
         flash(f'Error loading users: {str(e)}', 'error')
-        return render_template('users_list.html', users=[])
+        return render_template('users_list.html', users=[], search=search)
 
 
 @app.route('/users/create', methods=['GET', 'POST'])
@@ -572,31 +687,16 @@ def user_view(email):
             flash('User not found', 'error')
             return redirect(url_for('users_list'))
         
-        # Get activity logs for this user
-        logs = MasterLogs.get_by_record('user_pii', email)
-        
-        # Get booked time slots (form responses)
-        booked_slots = FormResponse.get_by_email(email)
-        
-        # Get blog submissions (project submissions) for this user
-        query = "SELECT * FROM project_submission WHERE email = %s ORDER BY created_at DESC"
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(query, (email,))
-        columns = [desc[0] for desc in cursor.description]
-        rows = cursor.fetchall()
-        db_manager.return_connection(conn)
-        user_blog_submissions = [dict(zip(columns, row)) for row in rows]
-        
-        # Get Kiro submissions for this user
-        kiro_submissions = KiroSubmission.get_by_email(email)
+        # Get activity logs, booked time slots, blog submissions and Kiro
+        # submissions for this user in a single query
+        activity = UserPII.get_activity(email)
         
         return render_template('user_view.html', 
                              user=user, 
-                             logs=logs,
-                             booked_slots=booked_slots,
-                             blog_submissions=user_blog_submissions,
-                             kiro_submissions=kiro_submissions)
+                             logs=activity['logs'],
+                             booked_slots=activity['booked_slots'],
+                             blog_submissions=activity['blog_submissions'],
+                             kiro_submissions=activity['kiro_submissions'])
     except Exception as e:
         flash(f'Error loading user: {str(e)}', 'error')
         return redirect(url_for('users_list'))
@@ -656,65 +756,60 @@ def get_workshop_data(workshop_num):
     try:
         workshop_name = f'Workshop {workshop_num}'
         
-        # Query form responses for this workshop
+        # Group responses by the precomputed effective_time_slot (time_slot_range,
+        # else time_slot to the minute, else 'No Time Slot') and count
+        # occupations per slot in SQL, so only the aggregated result is shipped back
         query = """
-            SELECT fr.email, fr.form_name, fr.name, fr.time_slot, fr.time_slot_range, fr.created_at,
-                   u.name as user_name, u.phone_number, u.designation, u.occupation, u.linkedin
-            FROM form_response fr
-            LEFT JOIN user_pii u ON fr.email = u.email
-            WHERE fr.form_name = %s
-            ORDER BY fr.time_slot, fr.created_at
+            WITH r AS (
+                SELECT 
+                    fr.effective_time_slot as slot,
+                    fr.email, fr.form_name, fr.name, fr.time_slot, fr.time_slot_range, fr.created_at,
+                    u.name as user_name, u.phone_number, u.designation, u.occupation, u.linkedin
+                FROM form_response fr
+                LEFT JOIN user_pii u ON fr.email = u.email
+                WHERE fr.form_name = %s
+            ), slots AS (
+                SELECT 
+                    slot,
+                    COUNT(*) as response_count,
+                    json_agg(json_build_object(
+                        'email', email,
+                        'form_name', form_name,
+                        'name', name,
+                        'time_slot', TO_CHAR(time_slot, 'YYYY-MM-DD HH24:MI:SS'),
+                        'time_slot_range', time_slot_range,
+                        'created_at', TO_CHAR(created_at, 'YYYY-MM-DD HH24:MI:SS'),
+                        'user_name', user_name,
+                        'phone_number', phone_number,
+                        'designation', designation,
+                        'occupation', occupation,
+                        'linkedin', linkedin
+                    ) ORDER BY time_slot, created_at) as responses
+                FROM r
+                GROUP BY slot
+            ), occupations AS (
+                SELECT slot, json_object_agg(occupation, count) as occupation_counts
+                FROM (
+                    SELECT slot, COALESCE(NULLIF(occupation, ''), 'Not Specified') as occupation, COUNT(*) as count
+                    FROM r
+                    GROUP BY 1, 2
+                ) as slot_occupations
+                GROUP BY slot
+            )
+            SELECT s.slot, s.response_count, s.responses, o.occupation_counts
+            FROM slots s
+            JOIN occupations o ON o.slot = s.slot
+            ORDER BY s.slot
         """
+        rows = db_manager.execute_query(query, (workshop_name,))
         
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(query, (workshop_name,))
-        columns = [desc[0] for desc in cursor.description]
-        rows = cursor.fetchall()
-        db_manager.return_connection(conn)
-        
-        # Convert to list of dicts
-        form_responses = []
-        for row in rows:
-            form_responses.append(dict(zip(columns, row)))
-        
-        # Group by time_slot_range (original string) or time_slot
-        grouped_data = {}
-        for response in form_responses:
-            # Use time_slot_range if available, otherwise use time_slot
-            time_slot_key = response.get('time_slot_range')
-            if not time_slot_key:
-                time_slot = response.get('time_slot')
-                if time_slot:
-                    time_slot_key = time_slot.strftime('%Y-%m-%d %H:%M:%S') if isinstance(time_slot, datetime) else str(time_slot)
-                else:
-                    time_slot_key = 'No Time Slot'
-            
-            if time_slot_key not in grouped_data:
-                grouped_data[time_slot_key] = []
-            grouped_data[time_slot_key].append(response)
-        
-        # Calculate occupation breakdown for each time slot
-        occupation_breakdown = {}
-        for time_slot_key, responses in grouped_data.items():
-            occupation_counts = {}
-            for response in responses:
-                occupation = response.get('occupation') or 'Not Specified'
-                occupation_counts[occupation] = occupation_counts.get(occupation, 0) + 1
-            occupation_breakdown[time_slot_key] = occupation_counts
-        
-        # Convert datetime objects to strings for JSON
-        for time_slot, responses in grouped_data.items():
-            for response in responses:
-                if response.get('time_slot') and isinstance(response['time_slot'], datetime):
-                    response['time_slot'] = response['time_slot'].strftime('%Y-%m-%d %H:%M:%S')
-                if response.get('created_at') and isinstance(response['created_at'], datetime):
-                    response['created_at'] = response['created_at'].strftime('%Y-%m-%d %H:%M:%S')
+        grouped_data = {row['slot']: row['responses'] for row in rows}
+        occupation_breakdown = {row['slot']: row['occupation_counts'] for row in rows}
         
         return jsonify({
             'success': True,
             'workshop_name': workshop_name,
-            'total_responses': len(form_responses),
+            'total_responses': sum(row['response_count'] for row in rows),
             'time_slots': grouped_data,
             'occupation_breakdown': occupation_breakdown
         })
@@ -728,17 +823,13 @@ def get_workshop_data(workshop_num):
 
 @app.route('/api/workshops/<int:workshop_num>/export')
 def export_workshop_data(workshop_num):
-    """Export workshop data as CSV"""
+    """Export workshop data as CSV (formatted by Postgres COPY and streamed)"""
     try:
-        from flask import Response
-        import csv
-        import io
-        from datetime import datetime
-        
         workshop_name = f'Workshop {workshop_num}'
         time_slot_filter = request.args.get('time_slot', None)
         
         # Query form responses
+        # Timestamps are formatted in SQL since COPY writes the CSV directly
         # Use time_slot_range for filtering since it stores the display string like "29 Nov, 4:00 - 7:00 PM"
         if time_slot_filter and time_slot_filter != 'No Time Slot':
             # URL decode the time_slot_filter in case it's encoded
@@ -746,7 +837,10 @@ def export_workshop_data(workshop_num):
             time_slot_filter = unquote(time_slot_filter)
             
             query = """
-                SELECT fr.email, fr.form_name, fr.name, fr.time_slot, fr.time_slot_range, fr.created_at,
+                SELECT fr.email, fr.form_name, fr.name,
+                       TO_CHAR(fr.time_slot, 'YYYY-MM-DD HH24:MI:SS') as time_slot,
+                       fr.time_slot_range,
+                       TO_CHAR(fr.created_at, 'YYYY-MM-DD HH24:MI:SS') as created_at,
                        u.name as user_name, u.phone_number, u.designation, u.occupation, u.linkedin
                 FROM form_response fr
                 LEFT JOIN user_pii u ON fr.email = u.email
@@ -757,7 +851,10 @@ def export_workshop_data(workshop_num):
             params = (workshop_name, time_slot_filter)
         else:
             query = """
-                SELECT fr.email, fr.form_name, fr.name, fr.time_slot, fr.time_slot_range, fr.created_at,
+                SELECT fr.email, fr.form_name, fr.name,
+                       TO_CHAR(fr.time_slot, 'YYYY-MM-DD HH24:MI:SS') as time_slot,
+                       fr.time_slot_range,
+                       TO_CHAR(fr.created_at, 'YYYY-MM-DD HH24:MI:SS') as created_at,
                        u.name as user_name, u.phone_number, u.designation, u.occupation, u.linkedin
                 FROM form_response fr
                 LEFT JOIN user_pii u ON fr.email = u.email
@@ -766,40 +863,10 @@ def export_workshop_data(workshop_num):
             """
             params = (workshop_name,)
         
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(query, params)
-        columns = [desc[0] for desc in cursor.description]
-        rows = cursor.fetchall()
-        db_manager.return_connection(conn)
-        
-        # Debug: Log query results
-        print(f"[DEBUG] Export query returned {len(rows)} rows")
-        print(f"[DEBUG] Columns: {columns}")
-        if rows:
-            print(f"[DEBUG] First row sample: {rows[0]}")
-        
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow(columns)
-        
-        # Write data
-        for row in rows:
-            # Convert datetime objects to strings
-            row_data = []
-            for val in row:
-                if isinstance(val, datetime):
-                    row_data.append(val.strftime('%Y-%m-%d %H:%M:%S'))
-                else:
-                    row_data.append(str(val) if val is not None else '')
-            writer.writerow(row_data)
-        
-        csv_content = output.getvalue()
-        print(f"[DEBUG] CSV content length: {len(csv_content)} characters")
-        print(f"[DEBUG] CSV preview (first 500 chars): {csv_content[:500]}")
+        # Pull the first chunk (always contains the header) up front so query
+        # errors still surface as a JSON error response
+        csv_chunks = db_manager.stream_copy_csv(query, params)
+        first_chunk = next(csv_chunks)
         
         # Create response
         filename = f'workshop_{workshop_num}'
@@ -809,13 +876,14 @@ def export_workshop_data(workshop_num):
             filename += f'_{safe_time_slot}'
         filename += '.csv'
         
-        # Use make_response to avoid duplicate headers
-        from flask import make_response
-        response = make_response(output.getvalue())
+        response = Response(stream_with_context(itertools.chain([first_chunk], csv_chunks)), mimetype='text/csv')
         response.headers['Content-Type'] = 'text/csv; charset=utf-8'
         # Properly quote filename to handle special characters
         response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
         
+        # Cancel the COPY if the client disconnects before the stream ends
+        response.call_on_close(csv_chunks.close)
+        
         return response
     
     except Exception as e:
@@ -858,16 +926,42 @@ def team_building_create():
         except Exception as e:
             flash(f'Error creating record: {str(e)}', 'error')
     
-    users = UserPII.list_all()
-    return render_template('team_building_form.html', record=None, users=users)
+    # Users are looked up on demand through /api/users/search
+    return render_template('team_building_form.html', record=None)
+
+
+@app.route('/api/users/search')
+@login_required
+@permission_required('team_building_create')
+def search_users():
+    """Search users by email or name for autocomplete fields"""
+    return _search_users_response()
+
+
+def _search_users_response():
+    """JSON response with up to 20 users matching the q query parameter"""
+    try:
+        term = request.args.get('q', '').strip()
+        if len(term) < 2:
+            return jsonify({'success': True, 'users': []})
+        
+        users = UserPII.search(term, limit=20)
+        return jsonify({'success': True, 'users': users})
+    except Exception as e:
+        return jsonify({'error': str(e), 'success': False}), 500
 
 
 # ============================================
 # Routes - Blog Submission (formerly Project Submission)
 # ============================================
-def scrape_blog_metrics(blog_url):
+# Server-rendered pages that 404 without the status code mention it near the top
+NOT_FOUND_TEXT_RE = re.compile(r"404|not found", re.IGNORECASE)
+NOT_FOUND_TEXT_CHARS = 1000
+
+
+def _scrape_builder_selenium(url):
     """
-    Scrape likes and comments count from a blog URL using Selenium
+    Scrape likes and comments count from a builder.aws.com page (always JS-rendered)
     Returns: (likes: int, comments: int, error: str or None, is_404: bool)
     """
     likes = 0
@@ -875,403 +969,122 @@ def scrape_blog_metrics(blog_url):
     error = None
     is_404 = False
     
-    print(f"[DEBUG] scrape_blog_metrics called for: {blog_url}")
+    logger.debug("Detected builder.aws.com URL, using Selenium")
+    if not _SELENIUM_AVAILABLE:
+        error = f"Selenium not available. Install with: pip install selenium webdriver-manager. Error: {_SELENIUM_IMPORT_ERROR}"
+        logger.error(error)
+        return likes, comments, error, is_404
     
     try:
-        # Use Selenium for builder.aws.com URLs (always JS-rendered)
-        if 'builder.aws.com' in blog_url:
-            print(f"[DEBUG] Detected builder.aws.com URL, using Selenium")
-            try:
-                from selenium import webdriver
-                from selenium.webdriver.chrome.options import Options
-                from selenium.webdriver.chrome.service import Service
-                from selenium.webdriver.common.by import By
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-                from webdriver_manager.chrome import ChromeDriverManager
-                import time
-                
-                print(f"[DEBUG] Selenium imports successful")
-                
-                chrome_options = Options()
-                chrome_options.add_argument('--headless=new')  # Use new headless mode (faster)
-                chrome_options.add_argument('--no-sandbox')
-                chrome_options.add_argument('--disable-dev-shm-usage')
-                chrome_options.add_argument('--disable-gpu')
-                chrome_options.add_argument('--disable-extensions')
-                chrome_options.add_argument('--disable-plugins')
-                chrome_options.add_argument('--disable-background-timer-throttling')
-                chrome_options.add_argument('--disable-backgrounding-occluded-windows')
-                chrome_options.add_argument('--disable-renderer-backgrounding')
-                chrome_options.add_argument('--disable-features=TranslateUI')
-                chrome_options.add_argument('--disable-ipc-flooding-protection')
-                chrome_options.add_argument('--disable-hang-monitor')
-                chrome_options.add_argument('--disable-prompt-on-repost')
-                chrome_options.add_argument('--disable-domain-reliability')
-                chrome_options.add_argument('--disable-component-update')
-                chrome_options.add_argument('--disable-background-networking')
-                chrome_options.add_argument('--disable-sync')
-                chrome_options.add_argument('--disable-default-apps')
-                chrome_options.add_argument('--disable-breakpad')
-                chrome_options.add_argument('--disable-client-side-phishing-detection')
-                chrome_options.add_argument('--disable-crash-reporter')
-                chrome_options.add_argument('--disable-features=AudioServiceOutOfProcess')
-                chrome_options.add_argument('--blink-settings=imagesEnabled=false')  # Disable images
-                chrome_options.page_load_strategy = 'eager'  # Don't wait for all resources
-                
-                # Block images and CSS to speed up loading
-                prefs = {
-                    "profile.managed_default_content_settings.images": 2,  # Block images
-                    "profile.default_content_setting_values.notifications": 2,
-                    "profile.default_content_settings.popups": 0,
-                }
-                chrome_options.add_experimental_option("prefs", prefs)
-                
-                chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-                
-                print(f"[DEBUG] Setting up Chrome driver...")
-                # Use webdriver-manager to automatically handle ChromeDriver
-                driver = None
-                try:
-                    # Try with webdriver-manager first
-                    driver_path = ChromeDriverManager().install()
-                    print(f"[DEBUG] ChromeDriverManager returned path: {driver_path}")
-                    
-                    # Fix: webdriver-manager sometimes returns wrong file, find the actual chromedriver.exe
-                    import os
-                    driver_dir = os.path.dirname(driver_path)
-                    actual_driver = None
-                    
-                    # Look for chromedriver.exe in the directory (recursively)
-                    def find_chromedriver(directory):
-                        """Recursively search for chromedriver.exe"""
-                        if not os.path.isdir(directory):
-                            return None
-                        for root, dirs, files in os.walk(directory):
-                            for file in files:
-                                if file == 'chromedriver.exe':
-                                    full_path = os.path.join(root, file)
-                                    # Verify it's actually an executable (check file size > 1MB)
-                                    try:
-                                        if os.path.getsize(full_path) > 1000000:
-                                            return full_path
-                                    except:
-                                        pass
-                        return None
-                    
-                    # Check if ChromeDriver is in a zip file and extract it
-                    import zipfile
-                    zip_files = [f for f in os.listdir(driver_dir) if f.endswith('.zip')]
-                    if zip_files:
-                        zip_path = os.path.join(driver_dir, zip_files[0])
-                        print(f"[DEBUG] Found zip file: {zip_path}, extracting...")
-                        try:
-                            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                                zip_ref.extractall(driver_dir)
-                            print(f"[DEBUG] Extracted ChromeDriver from zip")
-                        except Exception as e:
-                            print(f"[DEBUG] Failed to extract zip: {e}")
-                    
-                    # Search in driver directory and parent
-                    actual_driver = find_chromedriver(driver_dir)
-                    if not actual_driver:
-                        parent_dir = os.path.dirname(driver_dir)
-                        actual_driver = find_chromedriver(parent_dir)
-                    
-                    # Use actual driver if found, otherwise try the original path
-                    if actual_driver and os.path.exists(actual_driver):
-                        driver_path = actual_driver
-                        print(f"[DEBUG] Found actual ChromeDriver at: {driver_path}")
-                    else:
-                        print(f"[DEBUG] Using ChromeDriverManager path: {driver_path}")
-                        # If the path doesn't exist or is wrong, try to find it
-                        if not os.path.exists(driver_path) or driver_path.endswith('.zip') or 'THIRD_PARTY' in driver_path:
-                            # Search more broadly
-                            wdm_base = os.path.expanduser('~/.wdm')
-                            if os.path.isdir(wdm_base):
-                                actual_driver = find_chromedriver(wdm_base)
-                                if actual_driver:
-                                    driver_path = actual_driver
-                                    print(f"[DEBUG] Found ChromeDriver in .wdm: {driver_path}")
-                    
-                    # Verify the file exists
-                    if not os.path.exists(driver_path):
-                        raise Exception(f"ChromeDriver not found at {driver_path}")
-                    
-                    # Check file size (should be > 0)
-                    file_size = os.path.getsize(driver_path)
-                    print(f"[DEBUG] ChromeDriver file size: {file_size:,} bytes")
-                    if file_size < 1000:  # ChromeDriver should be at least 1KB
-                        raise Exception(f"ChromeDriver file appears corrupted (size: {file_size} bytes)")
-                    
-                    service = Service(driver_path)
-                    driver = webdriver.Chrome(service=service, options=chrome_options)
-                    print(f"[DEBUG] Chrome driver initialized successfully")
-                except Exception as e:
-                    print(f"[WARNING] webdriver-manager failed: {e}")
-                    # Try without webdriver-manager (if ChromeDriver is in PATH)
-                    try:
-                        print(f"[DEBUG] Trying ChromeDriver from PATH...")
-                        driver = webdriver.Chrome(options=chrome_options)
-                        print(f"[DEBUG] Chrome driver initialized from PATH")
-                    except Exception as e2:
-                        print(f"[ERROR] ChromeDriver from PATH also failed: {e2}")
-                        # Last resort: try to find ChromeDriver in common locations
-                        import shutil
-                        chromedriver_path = shutil.which('chromedriver')
-                        if chromedriver_path:
-                            print(f"[DEBUG] Found chromedriver at: {chromedriver_path}")
-                            service = Service(chromedriver_path)
-                            driver = webdriver.Chrome(service=service, options=chrome_options)
-                            print(f"[DEBUG] Chrome driver initialized from which()")
-                        else:
-                            raise Exception(f"Could not find ChromeDriver. Please install it manually or ensure it's in PATH. Error: {e2}")
-                
-                print(f"[DEBUG] Loading page: {blog_url}")
-                driver.get(blog_url)
-                WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                print(f"[DEBUG] Page loaded, waiting for dynamic content...")
-                time.sleep(5)  # Wait longer for dynamic content to load
-                print(f"[DEBUG] Dynamic content wait complete")
-                
-                # Save page source for debugging
-                try:
-                    with open('debug_page_source.html', 'w', encoding='utf-8') as f:
-                        f.write(driver.page_source)
-                    print(f"[DEBUG] Saved page source to debug_page_source.html")
-                except:
-                    pass
-                
-                # Check for 404 page
-                page_title = driver.title.lower()
-                page_source = driver.page_source.lower()
-                
-                # Check for 404 indicators
-                if ('404' in page_title or 
-                    'not found' in page_title or 
-                    '404' in page_source[:2000] or 
-                    'page you\'re looking for can\'t be found' in page_source or
-                    'the page you\'re looking for can\'t be found' in page_source):
-                    is_404 = True
-                    error = "404 Not Found"
-                    driver.quit()
-                    return likes, comments, error, is_404
-                
-                # Initialize likes and comments to None (not 0) so we can distinguish between "not found" and "found 0"
-                likes_found = False
-                comments_found = False
-                
-                # Try to find like and comment elements using Selenium
-                print(f"[DEBUG] Searching for like/comment elements on {blog_url}")
-                try:
-                    # Method 1: Find Like button with exact aria-label and extract from _card-action-text span
-                    print(f"[DEBUG] Method 1: Searching for 'Like this article' button...")
-                    like_buttons = driver.find_elements(By.XPATH, "//button[@aria-label='Like this article']")
-                    if not like_buttons:
-                        # Fallback to contains
-                        like_buttons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'Like this article')]")
-                    
-                    print(f"[DEBUG] Found {len(like_buttons)} Like button(s)")
-                    
-                    # Process each button to find the correct one
-                    for btn in like_buttons:
-                        try:
-                            aria_label = btn.get_attribute('aria-label')
-                            print(f"[DEBUG] Like button - aria-label: '{aria_label}'")
-                            
-                            # Priority 1: Find span with class containing '_card-action-text' (the specific span with the count)
-                            action_text_spans = btn.find_elements(By.CSS_SELECTOR, "span[class*='_card-action-text']")
-                            print(f"[DEBUG] Found {len(action_text_spans)} span(s) with '_card-action-text' class")
-                            
-                            for span in action_text_spans:
-                                span_text = span.text.strip()
-                                span_class = span.get_attribute('class') or ''
-                                print(f"[DEBUG] Like action-text span - text: '{span_text}', class: '{span_class}'")
-                                
-                                # Extract number from this span (even if it's 0)
-                                if span_text.isdigit():
-                                    likes = int(span_text)
-                                    likes_found = True
-                                    print(f"[DEBUG] ✓ Extracted likes from _card-action-text span: {likes}")
-                                    break
-                            
-                            # Priority 2: If not found in _card-action-text, check all spans and look for numeric text
-                            if not likes_found:
-                                spans = btn.find_elements(By.TAG_NAME, "span")
-                                print(f"[DEBUG] Checking all {len(spans)} span(s) in Like button")
-                                for span in spans:
-                                    span_text = span.text.strip()
-                                    span_class = span.get_attribute('class') or ''
-                                    print(f"[DEBUG] Like span - text: '{span_text}', class: '{span_class}'")
-                                    
-                                    # Only accept if it's a pure number (not part of a larger string)
-                                    if span_text.isdigit():
-                                        likes = int(span_text)
-                                        likes_found = True
-                                        print(f"[DEBUG] ✓ Extracted likes from span: {likes}")
-                                        break
-                            
-                            # If we found a value (including 0), break
-                            if likes_found:
-                                print(f"[DEBUG] Final likes value: {likes}")
-                                break
-                        except Exception as e:
-                            print(f"[DEBUG] Error processing Like button: {e}")
-                            import traceback
-                            traceback.print_exc()
-                            continue
-                    
-                    # Method 2: Find Comment button with exact aria-label and extract from _card-action-text span
-                    print(f"[DEBUG] Method 2: Searching for 'Comment on this article' button...")
-                    comment_buttons = driver.find_elements(By.XPATH, "//button[@aria-label='Comment on this article']")
-                    if not comment_buttons:
-                        # Fallback to contains
-                        comment_buttons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'Comment on this article')]")
-                    
-                    print(f"[DEBUG] Found {len(comment_buttons)} Comment button(s)")
-                    
-                    # Process each button to find the correct one
-                    for btn in comment_buttons:
-                        try:
-                            aria_label = btn.get_attribute('aria-label')
-                            print(f"[DEBUG] Comment button - aria-label: '{aria_label}'")
-                            
-                            # Priority 1: Find span with class containing '_card-action-text' (the specific span with the count)
-                            action_text_spans = btn.find_elements(By.CSS_SELECTOR, "span[class*='_card-action-text']")
-                            print(f"[DEBUG] Found {len(action_text_spans)} span(s) with '_card-action-text' class")
-                            
-                            for span in action_text_spans:
-                                span_text = span.text.strip()
-                                span_class = span.get_attribute('class') or ''
-                                print(f"[DEBUG] Comment action-text span - text: '{span_text}', class: '{span_class}'")
-                                
-                                # Extract number from this span (even if it's 0)
-                                if span_text.isdigit():
-                                    comments = int(span_text)
-                                    comments_found = True
-                                    print(f"[DEBUG] ✓ Extracted comments from _card-action-text span: {comments}")
-                                    break
-                            
-                            # Priority 2: If not found in _card-action-text, check all spans and look for numeric text
-                            if not comments_found:
-                                spans = btn.find_elements(By.TAG_NAME, "span")
-                                print(f"[DEBUG] Checking all {len(spans)} span(s) in Comment button")
-                                for span in spans:
-                                    span_text = span.text.strip()
-                                    span_class = span.get_attribute('class') or ''
-                                    print(f"[DEBUG] Comment span - text: '{span_text}', class: '{span_class}'")
-                                    
-                                    # Only accept if it's a pure number (not part of a larger string)
-                                    if span_text.isdigit():
-                                        comments = int(span_text)
-                                        comments_found = True
-                                        print(f"[DEBUG] ✓ Extracted comments from span: {comments}")
-                                        break
-                            
-                            # If we found a value (including 0), break
-                            if comments_found:
-                                print(f"[DEBUG] Final comments value: {comments}")
-                                break
-                        except Exception as e:
-                            print(f"[DEBUG] Error processing Comment button: {e}")
-                            import traceback
-                            traceback.print_exc()
-                            continue
-                    
-                    # If we didn't find values, keep them as 0 (default)
-                    if not likes_found:
-                        print(f"[DEBUG] Like button not found or no numeric value extracted, keeping likes=0")
-                    if not comments_found:
-                        print(f"[DEBUG] Comment button not found or no numeric value extracted, keeping comments=0")
-                            
-                except Exception as e:
-                    print(f"[ERROR] Error finding elements: {e}")
-                    import traceback
-                    traceback.print_exc()
-                
-                # Final validation: ensure we only accept values from the correct span
-                print(f"[DEBUG] Final validation - Likes found: {likes_found}, Comments found: {comments_found}")
-                print(f"[DEBUG] Final results before driver.quit(): Likes={likes}, Comments={comments}")
-                
-                # If we didn't find values using Selenium, don't try BeautifulSoup (it's unreliable)
-                # Keep the default 0 values
-                driver.quit()
-                print(f"[DEBUG] Driver closed")
-                
-            except ImportError as e:
-                error = f"Selenium not available. Install with: pip install selenium webdriver-manager. Error: {str(e)}"
-                print(f"[ERROR] {error}")
-                import traceback
-                traceback.print_exc()
-            except Exception as e:
-                error = f"Selenium error: {str(e)}"
-                print(f"[ERROR] Selenium exception: {error}")
-                import traceback
-                traceback.print_exc()
-                try:
-                    driver.quit()
-                except:
-                    pass
+        # Borrow a warm browser instead of starting Chrome for every URL
+        with CHROME_POOL.get() as browser:
+            return browser.scrape(url)
+    except Exception as e:
+        error = f"Selenium error: {str(e)}"
+        logger.exception("Selenium exception: %s", error)
+    
+    return likes, comments, error, is_404
+
+
+def _scrape_community(url):
+    """
+    Scrape likes and comments count from a server-rendered page (community.aws and others)
+    Returns: (likes: int, comments: int, error: str or None, is_404: bool)
+    """
+    likes = 0
+    comments = 0
+    error = None
+    is_404 = False
+
+    # Stream the body so a huge or slow page can't hold this worker for long
+    with scraper_session.get(url, timeout=SCRAPER_TIMEOUT, stream=True) as response:
+        # Check for 404
+        if response.status_code == 404:
+            is_404 = True
+            error = "404 Not Found"
+            return likes, comments, error, is_404
+
+        response.raise_for_status()
+        body = read_limited(response)
+    tree = parse_html(body)
+
+    # Check for 404 in content
+    if NOT_FOUND_TEXT_RE.search(tree.text_content(), 0, NOT_FOUND_TEXT_CHARS):
+        is_404 = True
+        error = "404 Not Found"
+        return likes, comments, error, is_404
+
+    # Parse likes and comments - prioritize _card-action-text span
+    likes = extract_action_count(tree, LIKE_BUTTON_LABEL) or 0
+    comments = extract_action_count(tree, COMMENT_BUTTON_LABEL) or 0
+    
+    return likes, comments, error, is_404
+
+
+_blog_metrics_inflight = {}  # blog URL -> Future for the scrape in progress
+_blog_metrics_inflight_lock = threading.Lock()
+
+
+def scrape_blog_metrics(blog_url):
+    """
+    Scrape likes and comments count from a blog URL
+    Results are cached per URL for a short while (failed scrapes are not), and
+    concurrent calls for the same URL share one scrape
+    Returns: (likes: int, comments: int, error: str or None, is_404: bool)
+    """
+    result = blog_metrics_cache.get(blog_url)
+    if result is not None:
+        logger.debug("Using cached metrics for: %s", blog_url)
+        return result
+    
+    # Submissions sharing a link are validated concurrently; only the first
+    # caller scrapes, the others wait for its result
+    with _blog_metrics_inflight_lock:
+        # The previous leader may have stored its result since the check above
+        result = blog_metrics_cache.get(blog_url)
+        if result is not None:
+            return result
+        inflight = _blog_metrics_inflight.get(blog_url)
+        if inflight is None:
+            inflight = _blog_metrics_inflight[blog_url] = Future()
+            leader = True
         else:
-            # For community.aws or other sites, use regular requests
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            }
-            
-            response = requests.get(blog_url, headers=headers, timeout=15)
-            
-            # Check for 404
-            if response.status_code == 404:
-                is_404 = True
-                error = "404 Not Found"
-                return likes, comments, error, is_404
-            
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Check for 404 in content
-            page_text = soup.get_text().lower()
-            if '404' in page_text[:1000] or 'not found' in page_text[:1000]:
-                is_404 = True
-                error = "404 Not Found"
-                return likes, comments, error, is_404
-            
-            # Parse likes and comments - prioritize _card-action-text span
-            like_button = soup.find('button', {'aria-label': re.compile(r'Like this article', re.I)})
-            if like_button:
-                # First try to find span with _card-action-text class
-                action_text_span = like_button.find('span', class_=re.compile(r'_card-action-text'))
-                if action_text_span:
-                    text = action_text_span.get_text(strip=True)
-                    if text.isdigit():
-                        likes = int(text)
-                else:
-                    # Fallback to all spans
-                    spans = like_button.find_all('span')
-                    for span in spans:
-                        text = span.get_text(strip=True)
-                        if text.isdigit():
-                            likes = int(text)
-                            break
-            
-            comment_button = soup.find('button', {'aria-label': re.compile(r'Comment on this article', re.I)})
-            if comment_button:
-                # First try to find span with _card-action-text class
-                action_text_span = comment_button.find('span', class_=re.compile(r'_card-action-text'))
-                if action_text_span:
-                    text = action_text_span.get_text(strip=True)
-                    if text.isdigit():
-                        comments = int(text)
-                else:
-                    # Fallback to all spans
-                    spans = comment_button.find_all('span')
-                    for span in spans:
-                        text = span.get_text(strip=True)
-                        if text.isdigit():
-                            comments = int(text)
-                            break
-        
+            leader = False
+    if not leader:
+        logger.debug("Waiting for in-flight scrape of: %s", blog_url)
+        return inflight.result()
+    
+    try:
+        result = _fetch_blog_metrics(blog_url)
+        likes, comments, error, is_404 = result
+        if error is None or is_404:
+            blog_metrics_cache.set(blog_url, result)
+        inflight.set_result(result)
+        return result
+    except BaseException as e:
+        inflight.set_exception(e)
+        raise
+    finally:
+        with _blog_metrics_inflight_lock:
+            del _blog_metrics_inflight[blog_url]
+
+
+def _fetch_blog_metrics(blog_url):
+    """
+    Scrape likes and comments count from a blog URL, bypassing the cache
+    Returns: (likes: int, comments: int, error: str or None, is_404: bool)
+    """
+    likes = 0
+    comments = 0
+    error = None
+    is_404 = False
+    
+    logger.debug("scrape_blog_metrics called for: %s", blog_url)
+    
+    try:
+        if is_builder_link(blog_url):
+            return _scrape_builder_selenium(blog_url)
+        return _scrape_community(blog_url)
     except requests.exceptions.Timeout:
         error = "Request timeout"
     except requests.exceptions.ConnectionError:
@@ -1407,9 +1220,37 @@ def blog_submission_create():
     return render_template('project_submission_form.html', submission=None, users=users)
 
 
+class BlogValidationResult(NamedTuple):
+    """Outcome of validating one blog submission"""
+    workshop_name: str
+    email: str
+    link: str
+    valid: bool
+    reason: str
+    likes: int
+    comments: int
+
+
+# Blog hosts whose pages can be validated (subdomains included)
+BLOG_DOMAINS = ('community.aws', 'builder.aws.com')
+
+
+def is_blog_host(hostname):
+    """Check whether hostname is one of BLOG_DOMAINS or a subdomain of one"""
+    hostname = (hostname or '').lower()
+    return any(hostname == domain or hostname.endswith('.' + domain) for domain in BLOG_DOMAINS)
+
+
+def is_builder_link(url):
+    """Check whether url is a builder.aws.com page (subdomains included), whose metrics need a browser or its API"""
+    hostname = (urlparse(url.strip()).hostname or '').lower()
+    return hostname == 'builder.aws.com' or hostname.endswith('.builder.aws.com')
+
+
 def validate_single_submission(submission):
     """Validate a single blog submission (for parallel processing)
-    Always re-verifies and updates likes/comments even if submission was already valid
+    Always re-verifies likes/comments even if submission was already valid; the
+    returned result is written back in batches by the caller
     """
     link = submission.get('project_link')
     if not link:
@@ -1421,13 +1262,17 @@ def validate_single_submission(submission):
     comments = 0
     
     try:
+        parsed = urlparse(link.strip())
+        # Reject malformed links before paying for DNS/TLS/a browser render
+        if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+            reason = "Invalid URL"
         # Check domain
-        if 'community.aws' in link or 'builder.aws.com' in link:
-            print(f"[DEBUG] Validating link: {link}")
+        elif is_blog_host(parsed.hostname):
+            logger.debug("Validating link: %s", link)
             # Use scrape_blog_metrics which handles Selenium and 404 detection
             scraped_likes, scraped_comments, scrape_error, is_404 = scrape_blog_metrics(link)
             
-            print(f"[DEBUG] Scraped results - Likes: {scraped_likes}, Comments: {scraped_comments}, Error: {scrape_error}, Is_404: {is_404}")
+            logger.debug("Scraped results - Likes: %s, Comments: %s, Error: %s, Is_404: %s", scraped_likes, scraped_comments, scrape_error, is_404)
             
             # Check for 404 first
             if is_404 or (scrape_error and "404" in scrape_error):
@@ -1446,40 +1291,114 @@ def validate_single_submission(submission):
                 else:
                     reason = "Verified"
                 
-                print(f"[DEBUG] Setting - Valid: {is_valid}, Likes: {likes}, Comments: {comments}, Reason: {reason}")
+                logger.debug("Setting - Valid: %s, Likes: %s, Comments: %s, Reason: %s", is_valid, likes, comments, reason)
         else:
             reason = "Invalid Domain"
     except Exception as e:
-        print(f"[ERROR] Error validating link {link}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error validating link %s: %s", link, e)
         reason = f"System Error: {str(e)}"
     
-    # Always update submission (even if it was already valid) to refresh likes/comments
+    # The caller persists the result (see ProjectSubmission.bulk_update_validation)
+    return BlogValidationResult(
+        workshop_name=submission['workshop_name'],
+        email=submission['email'],
+        link=link,
+        valid=is_valid,
+        reason=reason,
+        likes=likes,
+        comments=comments
+    )
+
+
+# Blog validation fans out by domain: community.aws pages are plain HTTP
+# fetches and can run wide, while each builder.aws.com page holds a pooled
+# Chrome instance, so more workers than browsers would only queue threads.
+# COMMUNITY_SCRAPE_WORKERS matches the scraper session's per-host pool size.
+COMMUNITY_SCRAPE_WORKERS = SCRAPER_MAX_WORKERS
+BUILDER_SCRAPE_WORKERS = CHROME_POOL.max_capacity if _SELENIUM_AVAILABLE else 1
+
+# Long-lived pools shared by every validation request, so worker threads (and
+# their warm keep-alive connections) survive from one run to the next
+community_validation_pool = ThreadPoolExecutor(max_workers=COMMUNITY_SCRAPE_WORKERS, thread_name_prefix='validate-community')
+builder_validation_pool = ThreadPoolExecutor(max_workers=BUILDER_SCRAPE_WORKERS, thread_name_prefix='validate-builder')
+atexit.register(community_validation_pool.shutdown, wait=False)
+atexit.register(builder_validation_pool.shutdown, wait=False)
+
+
+def iter_blog_validations(submissions, validate=validate_single_submission, link_key='project_link'):
+    """Validate blog submissions concurrently
+    
+    builder.aws.com links are validated on a pool with as many workers as
+    there are browsers, other links on a wider HTTP pool; both pools are
+    shared across requests. submissions may be any iterable; it is consumed
+    lazily, keeping at most two validations per worker in flight. Yields (submission, future) pairs as each validation
+    completes; the future's result is whatever validate returned.
+    
+    Each link is validated once per call: submissions sharing a link (team
+    submissions, ...) are yielded with the same future, whose result was
+    built from the first of them, so callers take the submission's own
+    identifying fields from submission.
+    """
+    max_pending = 2 * (COMMUNITY_SCRAPE_WORKERS + BUILDER_SCRAPE_WORKERS)
+    submissions = iter(submissions)
+    pending = {}  # Future -> submissions waiting for it
+    futures_by_link = {}  # Link -> its validation in this call
+    completed = queue.Queue()  # Futures, in the order they finish
     try:
-        ProjectSubmission.update(
-            submission['workshop_name'],
-            submission['email'],
-            valid=is_valid,
-            validation_reason=reason,
-            likes=likes,
-            comments=comments
-        )
-        print(f"[DEBUG] Updated submission - {submission['email']}: Valid={is_valid}, Likes={likes}, Comments={comments}")
+        while True:
+            for submission in submissions:
+                link = submission[link_key]
+                future = futures_by_link.get(link)
+                if future is not None:
+                    if future in pending:
+                        pending[future].append(submission)
+                    else:
+                        # Validated (and yielded) earlier in this call
+                        yield submission, future
+                    continue
+                if is_builder_link(link):
+                    executor = builder_validation_pool
+                else:
+                    executor = community_validation_pool
+                future = futures_by_link[link] = executor.submit(validate, submission)
+                pending[future] = [submission]
+                future.add_done_callback(completed.put)
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                return
+            
+            future = completed.get()
+            for submission in pending.pop(future):
+                yield submission, future
+    finally:
+        # Don't start queued validations nobody will read (e.g. client disconnected)
+        for future in pending:
+            future.cancel()
+
+
+# Validation results are written back in batches of this size
+VALIDATION_WRITE_BATCH_SIZE = 100
+
+
+def ndjson_stream(lines):
+    """Stream newline-delimited JSON lines, asking proxies not to buffer them"""
+    response = Response(stream_with_context(lines), mimetype='application/x-ndjson')
+    response.headers['X-Accel-Buffering'] = 'no'
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def _flush_blog_validations(pending):
+    """Persist collected blog validation results and clear the list"""
+    if not pending:
+        return
+    try:
+        ProjectSubmission.bulk_update_validation(pending)
+        logger.debug("Updated %d blog submissions", len(pending))
     except Exception as e:
-        print(f"[ERROR] Failed to update submission: {e}")
-        import traceback
-        traceback.print_exc()
-    
-    return {
-        'workshop_name': submission['workshop_name'],
-        'email': submission['email'],
-        'link': link,
-        'valid': is_valid,
-        'reason': reason,
-        'likes': likes,
-        'comments': comments
-    }
+        logger.exception("Failed to update blog submissions: %s", e)
+    pending.clear()
 
 
 @app.route('/blog-submissions/validate', methods=['POST'])
@@ -1489,10 +1408,7 @@ def blog_submissions_validate():
     """Validate blog submissions with parallel processing - re-verifies ALL submissions to update likes/comments"""
     try:
         # Get ALL submissions (not just invalid ones) to re-verify and update likes/comments
-        submissions = ProjectSubmission.list_all()
-        submissions_to_validate = [s for s in submissions if s.get('project_link')]
-        
-        if not submissions_to_validate:
+        if ProjectSubmission.count_with_links() == 0:
             flash('No submissions with links to validate.', 'info')
             return redirect(url_for('blog_submissions_list'))
         
@@ -1500,31 +1416,27 @@ def blog_submissions_validate():
         failed_count = 0
         updated_count = 0
         
-        # Use ThreadPoolExecutor with 20 workers for parallel processing (increased for faster validation)
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            # Submit all validation tasks
-            future_to_submission = {
-                executor.submit(validate_single_submission, submission): submission 
-                for submission in submissions_to_validate
-            }
-            
-            # Process results as they complete
-            for future in as_completed(future_to_submission):
-                try:
-                    result = future.result()
-                    if result:
-                        if result['valid']:
-                            validated_count += 1
-                            # Check if likes or comments were updated
-                            if result.get('likes', 0) > 0 or result.get('comments', 0) > 0:
-                                updated_count += 1
-                        else:
-                            failed_count += 1
-                except Exception as e:
-                    print(f"[ERROR] Error processing submission: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    failed_count += 1
+        # Process results as they complete
+        pending_updates = []
+        for submission, future in iter_blog_validations(ProjectSubmission.iter_with_links()):
+            try:
+                result = future.result()
+                if result:
+                    # Submissions sharing a link share one result
+                    result = result._replace(workshop_name=submission['workshop_name'], email=submission['email'])
+                    # Always update submission (even if it was already valid) to refresh likes/comments
+                    pending_updates.append(result)
+                    if result.valid:
+                        validated_count += 1
+                        # Check if likes or comments were updated
+                        if result.likes > 0 or result.comments > 0:
+                            updated_count += 1
+                    else:
+                        failed_count += 1
+            except Exception as e:
+                logger.exception("Error processing submission: %s", e)
+                failed_count += 1
+        _flush_blog_validations(pending_updates)
         
         if validated_count > 0:
             flash(f'Successfully validated {validated_count} submissions. Updated likes/comments for {updated_count} submissions.', 'success')
@@ -1548,13 +1460,16 @@ def blog_submissions_validate_stream():
     """Stream validation progress with parallel processing - re-verifies ALL submissions to update likes/comments"""
     def generate():
         try:
-            # Get ALL submissions (not just invalid ones) to re-verify and update likes/comments
-            submissions = ProjectSubmission.list_all()
-            submissions_to_validate = [s for s in submissions if s.get('project_link')]
-            total_count = len(submissions_to_validate)
+            # Send a first event before touching the database so the client
+            # gets a response immediately
+            yield {'current': 0, 'total': 0, 'status': 'Loading submissions...'}
+            
+            # Get ALL submissions (not just invalid ones) to re-verify and update likes/comments;
+            # rows are read in batches as validation proceeds
+            total_count = ProjectSubmission.count_with_links()
             
             if total_count == 0:
-                yield json.dumps({'current': 0, 'total': 0, 'status': 'No submissions with links to validate'}) + '\n'
+                yield {'current': 0, 'total': 0, 'status': 'No submissions with links to validate'}
                 return
 
             validated_count = 0
@@ -1562,66 +1477,72 @@ def blog_submissions_validate_stream():
             processed_count = 0
             updated_count = 0
             
-            # Use ThreadPoolExecutor with 10 workers for parallel processing
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                # Submit all validation tasks
-                future_to_submission = {
-                    executor.submit(validate_single_submission, submission): submission 
-                    for submission in submissions_to_validate
-                }
-                
-                # Process results as they complete
-                for future in as_completed(future_to_submission):
+            # Process results as they complete; writes are batched and flushed
+            # in the finally so a client disconnect keeps what was validated
+            pending_updates = []
+            try:
+                for submission, future in iter_blog_validations(ProjectSubmission.iter_with_links()):
                     try:
                         result = future.result()
                         processed_count += 1
                         
                         if result:
-                            if result['valid']:
+                            # Submissions sharing a link share one result
+                            result = result._replace(workshop_name=submission['workshop_name'], email=submission['email'])
+                            # Always update submission (even if it was already valid) to refresh likes/comments
+                            pending_updates.append(result)
+                            if len(pending_updates) >= VALIDATION_WRITE_BATCH_SIZE:
+                                _flush_blog_validations(pending_updates)
+                            
+                            if result.valid:
                                 validated_count += 1
                                 # Check if likes or comments were updated
-                                if result.get('likes', 0) > 0 or result.get('comments', 0) > 0:
+                                if result.likes > 0 or result.comments > 0:
                                     updated_count += 1
-                                    status_msg = f'Processed {processed_count}/{total_count}: {result["link"][:50]}... (Likes: {result.get("likes", 0)}, Comments: {result.get("comments", 0)})'
-                                else:
-                                    status_msg = f'Processed {processed_count}/{total_count}: {result["link"][:50]}... ({result["reason"]})'
                             else:
                                 failed_count += 1
-                                status_msg = f'Processed {processed_count}/{total_count}: {result["link"][:50]}... ({result["reason"]})'
                             
-                            # Yield progress with detailed counts
-                            yield json.dumps({
+                            # Yield progress with detailed counts; the page builds
+                            # the status line from the result fields
+                            yield {
                                 'current': processed_count,
                                 'total': total_count,
                                 'validated': validated_count,
                                 'failed': failed_count,
                                 'updated': updated_count,
-                                'status': status_msg
-                            }) + '\n'
+                                'link': result.link,
+                                'valid': result.valid,
+                                'reason': result.reason,
+                                'likes': result.likes,
+                                'comments': result.comments
+                            }
                     except Exception as e:
+                        logger.exception("Error processing submission %s", submission.get('project_link'))
                         processed_count += 1
                         failed_count += 1
-                        yield json.dumps({
+                        yield {
                             'current': processed_count,
                             'total': total_count,
                             'validated': validated_count,
                             'failed': failed_count,
                             'updated': updated_count,
                             'status': f'Error processing: {str(e)}'
-                        }) + '\n'
+                        }
+            finally:
+                _flush_blog_validations(pending_updates)
             
             # Final summary
-            yield json.dumps({
+            yield {
                 'current': total_count,
                 'total': total_count,
                 'status': 'Complete',
                 'summary': f'Validated: {validated_count}, Failed: {failed_count}, Updated likes/comments: {updated_count}'
-            }) + '\n'
+            }
             
         except Exception as e:
-            yield json.dumps({'error': str(e)}) + '\n'
+            yield {'error': str(e)}
 
-    return Response(stream_with_context(generate()), mimetype='application/json')
+    return ndjson_stream(coalesce_events(generate()))
 
 
 # ============================================
@@ -1638,15 +1559,8 @@ def blog_submissions_validate_stream():
 def kiro_submissions_list():
     """List all Kiro submissions grouped by week"""
     try:
-        weeks = KiroSubmission.get_weeks()
-        weeks_data = []
-        for week in weeks:
-            submissions = KiroSubmission.get_by_week(week)
-            weeks_data.append({
-                'week_number': week,
-                'submissions': submissions,
-                'count': len(submissions)
-            })
+        # The list page only shows per-week counts; rows are loaded on the week page
+        weeks_data = KiroSubmission.get_week_counts()
         return render_template('kiro_submissions_list.html', weeks_data=weeks_data)
     except Exception as e:
         flash(f'Error loading Kiro submissions: {str(e)}', 'error')
@@ -1693,8 +1607,8 @@ def kiro_submission_create():
         except Exception as e:
             flash(f'Error saving submission: {str(e)}', 'error')
     
-    # GET request - show form
-    users = UserPII.list_all()
+    # GET request - show form; users are looked up on demand through
+    # /api/kiro-submissions/users/search
     submission = None
     if week_number and email:
         submission = KiroSubmission.get(week_number, email)
@@ -1705,10 +1619,17 @@ def kiro_submission_create():
     return render_template('kiro_submission_form.html', 
                          submission=submission,
                          week_number=week_number,
-                         users=users,
                          existing_weeks=existing_weeks)
 
 
+@app.route('/api/kiro-submissions/users/search')
+@login_required
+@permission_required('kiro_submission_create')
+def kiro_search_users():
+    """Search users by email or name for the Kiro submission form"""
+    return _search_users_response()
+
+
 @app.route('/kiro-submissions/edit/<int:week_number>/<email>')
 @login_required
 @permission_required('kiro_submission_create')
@@ -1720,12 +1641,10 @@ def kiro_submission_edit(week_number, email):
             flash('Submission not found', 'error')
             return redirect(url_for('kiro_submissions_list'))
         
-        users = UserPII.list_all()
         existing_weeks = KiroSubmission.get_weeks()
         return render_template('kiro_submission_form.html',
                              submission=submission,
                              week_number=week_number,
-                             users=users,
                              existing_weeks=existing_weeks)
     except Exception as e:
         flash(f'Error loading submission: {str(e)}', 'error')
@@ -1746,111 +1665,206 @@ def kiro_submission_delete(week_number, email):
         return redirect(url_for('kiro_submissions_week', week_number=week_number))
 
 
+# owner and repo of a GitHub repository URL, with or without scheme/www, a
+# .git suffix, or a trailing path (/tree/branch, ...), query or fragment
+GITHUB_REPO_URL_RE = re.compile(
+    r'^(?:https?://)?(?:www\.)?github\.com/([^/\s?#]+)/([^/\s?#]+?)(?:\.git)?(?:[/?#].*)?$',
+    re.IGNORECASE
+)
+
+
+def github_repo_key(github_url):
+    """Normalized (owner, repo) of a GitHub URL, or the stripped URL if it doesn't parse"""
+    match = GITHUB_REPO_URL_RE.match(github_url.strip())
+    if not match:
+        return github_url.strip()
+    # GitHub owner and repository names are case-insensitive
+    return match.group(1).lower(), match.group(2).lower()
+
+
+# Reasons of definitive verify_github_repo results, which are cached per
+# repository; rate limits, timeouts and other errors are retried next time
+GITHUB_CACHEABLE_REASONS = ('Valid', 'Invalid', 'Repository not found')
+
+# Below this many remaining requests a token (or the unauthenticated quota)
+# is rested until its window resets, before GitHub starts refusing requests
+GITHUB_LOW_REMAINING = 10
+
+_github_repo_inflight = {}  # (owner, repo) -> Future for the check in progress
+_github_repo_inflight_lock = threading.Lock()
+
+
 def verify_github_repo(github_url, max_retries=3):
     """
     Verify GitHub repository and check for .kiro/ folder
-    Handles rate limits with retry logic and exponential backoff
+    Results are cached per repository for a while, and concurrent calls for the
+    same repository (e.g. submissions sharing a link) share one check
     Returns: (is_valid: bool, reason: str)
     """
-    import time
-    import re
-    from urllib.parse import urlparse
+    return _verify_github_repo(github_url, max_retries)[0]
+
+
+def _verify_github_repo(github_url, max_retries=3):
+    """
+    verify_github_repo, also telling whether this call sent a GitHub request
+    Returns: ((is_valid: bool, reason: str), requested: bool)
+    """
+    # Parse GitHub URL to extract owner and repo
+    # Support formats:
+    # - https://github.com/owner/repo
+    # - https://github.com/owner/repo/
+    # - github.com/owner/repo
+    # - https://github.com/owner/repo.git
+    # - https://github.com/owner/repo/tree/branch
+    github_url = github_url.strip()
+    match = GITHUB_REPO_URL_RE.match(github_url)
+    if not match:
+        return (False, f"Invalid GitHub URL format. Expected owner/repo, got: {github_url}"), False
+    
+    owner, repo = match.group(1), match.group(2)
+    # GitHub owner and repository names are case-insensitive
+    repo_key = (owner.lower(), repo.lower())
     
+    result = github_repo_cache.get(repo_key)
+    if result is not None:
+        logger.debug("Using cached GitHub result for: %s/%s", owner, repo)
+        return result, False
+    
+    with _github_repo_inflight_lock:
+        inflight = _github_repo_inflight.get(repo_key)
+        if inflight is None:
+            inflight = _github_repo_inflight[repo_key] = Future()
+            leader = True
+        else:
+            leader = False
+    if not leader:
+        logger.debug("Waiting for in-flight GitHub check of: %s/%s", owner, repo)
+        return inflight.result(), False
+    
+    try:
+        result = _check_github_repo(github_url, owner, repo, max_retries)
+        if result[1].startswith(GITHUB_CACHEABLE_REASONS):
+            github_repo_cache.set(repo_key, result)
+        inflight.set_result(result)
+        return result, True
+    except BaseException as e:
+        inflight.set_exception(e)
+        raise
+    finally:
+        with _github_repo_inflight_lock:
+            del _github_repo_inflight[repo_key]
+
+
+def _note_github_rate_limit(response, github_token):
+    """Align request pacing with a response's rate limit headers
+    Rests the token (or the unauthenticated quota) when it is nearly used up
+    """
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    reset = response.headers.get('X-RateLimit-Reset')
+    if remaining is None or not reset:
+        return
+    # With a single quota the bucket follows GitHub's own count: the requests
+    # left above the reserve are spread over the rest of the window, so pacing
+    # slows down well before the quota runs out
+    if len(github_tokens) <= 1:
+        github_rate_limiter.sync(int(remaining), int(reset), reserve=GITHUB_LOW_REMAINING)
+    if int(remaining) >= GITHUB_LOW_REMAINING:
+        return
+    if github_token:
+        github_tokens.mark_limited(github_token, int(reset))
+    else:
+        github_rate_limiter.pause_until(int(reset))
+
+
+def _check_github_repo(github_url, owner, repo, max_retries):
+    """
+    Check a GitHub repository for a .kiro/ folder through the GitHub API, bypassing the cache
+    Handles rate limits with retry logic and exponential backoff
+    Returns: (is_valid: bool, reason: str)
+    """
     is_valid = False
     reason = "Unknown Error"
     
     try:
-        # Parse GitHub URL to extract owner and repo
-        # Support formats:
-        # - https://github.com/owner/repo
-        # - https://github.com/owner/repo/
-        # - github.com/owner/repo
-        # - https://github.com/owner/repo.git
-        # - https://github.com/owner/repo/tree/branch
-        
-        # Normalize URL - remove fragments and query params, strip whitespace
-        github_url = github_url.strip()
-        if not github_url.startswith('http'):
-            github_url = 'https://' + github_url
-        
-        parsed = urlparse(github_url)
-        # Get path and remove leading/trailing slashes, then split
-        path = parsed.path.strip('/')
-        path_parts = [p for p in path.split('/') if p]
-        
-        # Remove .git suffix if present
-        if path_parts and path_parts[-1].endswith('.git'):
-            path_parts[-1] = path_parts[-1][:-4]
-        
-        # Remove 'tree', 'blob', or branch names if present (keep only owner/repo)
-        if len(path_parts) > 2:
-            # If we have more than 2 parts, it might be owner/repo/tree/branch
-            # Just take the first two parts (owner and repo)
-            path_parts = path_parts[:2]
-        
-        if len(path_parts) < 2:
-            return False, f"Invalid GitHub URL format. Expected owner/repo, got: {github_url}"
-        
-        owner = path_parts[0]
-        repo = path_parts[1]
-        
         # URL encode owner and repo to handle special characters
-        from urllib.parse import quote
         owner_encoded = quote(owner, safe='')
         repo_encoded = quote(repo, safe='')
         
         # Use GitHub API to check repository and list contents
         api_url = f"https://api.github.com/repos/{owner_encoded}/{repo_encoded}/contents"
         
-        # Debug logging
-        print(f"[DEBUG] Parsed GitHub URL: {github_url}")
-        print(f"[DEBUG] Owner: {owner}, Repo: {repo}")
-        print(f"[DEBUG] API URL: {api_url}")
+        logger.debug("Parsed GitHub URL %s: owner=%s repo=%s api=%s", github_url, owner, repo, api_url)
         
-        headers = {
-            'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'AWS-AI-for-Bharat'
-        }
+        # Accept/User-Agent are set on github_session
+        headers = {}
         
-        # Optional: Add GitHub token for higher rate limits
-        github_token = os.getenv('GITHUB_TOKEN')
+        # Optional: Add GitHub token for higher rate limits (rotated over GITHUB_TOKENS)
+        github_token = github_tokens.next_token()
         if github_token:
             headers['Authorization'] = f'token {github_token}'
         
+        # Conditional requests (If-None-Match) answer 304 for an unchanged root,
+        # which GitHub doesn't count against the rate limit
+        etag_key = (owner.lower(), repo.lower())
+        cached_listing = github_etag_cache.get(etag_key)
+        if cached_listing:
+            headers['If-None-Match'] = cached_listing[0]
+        
         # Retry logic with exponential backoff for rate limits
+        switched_token = False
         for attempt in range(max_retries):
             try:
-                # Add small delay between requests to avoid hitting rate limits
-                if attempt > 0:
+                # Add small delay between requests to avoid hitting rate limits,
+                # unless retrying straight away with a fresh token
+                if attempt > 0 and not switched_token:
                     wait_time = min(2 ** attempt, 60)  # Exponential backoff, max 60 seconds
-                    print(f"[INFO] Waiting {wait_time}s before retry {attempt + 1}/{max_retries} for {github_url}")
+                    logger.info("Waiting %ss before retry %d/%d for %s", wait_time, attempt + 1, max_retries, github_url)
                     time.sleep(wait_time)
+                switched_token = False
+                
+                github_rate_limiter.acquire()
+                response = github_session.get(api_url, headers=headers, timeout=15)
+                _note_github_rate_limit(response, github_token)
                 
-                response = requests.get(api_url, headers=headers, timeout=15)
+                # Repository root unchanged since the last validation
+                if response.status_code == 304 and cached_listing:
+                    return cached_listing[1]
                 
                 # Debug: Log response details for 404 errors
-                if response.status_code == 404:
-                    print(f"[DEBUG] 404 Response for {api_url}")
-                    print(f"[DEBUG] Response headers: {dict(response.headers)}")
+                if response.status_code == 404 and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("404 Response for %s, headers: %s", api_url, dict(response.headers))
                     try:
-                        error_data = response.json()
-                        print(f"[DEBUG] Error response: {error_data}")
-                        if 'message' in error_data:
-                            print(f"[DEBUG] GitHub API message: {error_data['message']}")
-                    except:
-                        print(f"[DEBUG] Response text: {response.text[:200]}")
+                        logger.debug("Error response: %s", response.json())
+                    except ValueError:
+                        logger.debug("Response text: %s", response.text[:200])
                 
                 # Check rate limit headers
                 rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
                 rate_limit_reset = response.headers.get('X-RateLimit-Reset')
                 
+                rate_limited = response.status_code == 429 or (
+                    response.status_code == 403
+                    and ('rate limit' in response.text.lower() or rate_limit_remaining == '0')
+                )
+                if rate_limited and github_token and attempt < max_retries - 1:
+                    # Park this token until its limit resets and retry at once with
+                    # another one, if any is left
+                    github_tokens.mark_limited(github_token, int(rate_limit_reset) if rate_limit_reset else time.time() + 60)
+                    next_token = github_tokens.next_available_token()
+                    if next_token:
+                        logger.warning("Rate limit hit for a GitHub token, retrying %s with another token", github_url)
+                        github_token = next_token
+                        headers['Authorization'] = f'token {github_token}'
+                        switched_token = True
+                        continue
+                
                 if response.status_code == 429:
                     # Rate limit exceeded
                     if rate_limit_reset:
                         reset_time = int(rate_limit_reset)
                         wait_seconds = max(0, reset_time - int(time.time()))
                         if attempt < max_retries - 1:
-                            print(f"[WARN] Rate limit exceeded for {github_url}. Waiting {wait_seconds}s until reset...")
+                            logger.warning("Rate limit exceeded for %s. Waiting %ss until reset...", github_url, wait_seconds)
                             time.sleep(min(wait_seconds + 1, 300))  # Wait up to 5 minutes
                             continue
                         else:
@@ -1858,7 +1872,7 @@ def verify_github_repo(github_url, max_retries=3):
                     else:
                         if attempt < max_retries - 1:
                             wait_time = 60  # Wait 1 minute if no reset time available
-                            print(f"[WARN] Rate limit exceeded for {github_url}. Waiting {wait_time}s...")
+                            logger.warning("Rate limit exceeded for %s. Waiting %ss...", github_url, wait_time)
                             time.sleep(wait_time)
                             continue
                         else:
@@ -1883,7 +1897,7 @@ def verify_github_repo(github_url, max_retries=3):
                     if 'rate limit' in response.text.lower() or rate_limit_remaining == '0':
                         if attempt < max_retries - 1:
                             wait_time = 60
-                            print(f"[WARN] Rate limit issue for {github_url}. Waiting {wait_time}s...")
+                            logger.warning("Rate limit issue for %s. Waiting %ss...", github_url, wait_time)
                             time.sleep(wait_time)
                             continue
                         else:
@@ -1906,61 +1920,98 @@ def verify_github_repo(github_url, max_retries=3):
                 if not isinstance(contents, list):
                     return False, "Invalid repository structure"
                 
-                # Check if any folder starts with ".kiro"
-                found_kiro_folder = False
-                kiro_folder_name = None
-                
-                def check_for_kiro_folder(items, depth=0, max_depth=2):
-                    """Recursively check for .kiro folder (limit depth to avoid too many API calls)"""
-                    nonlocal found_kiro_folder, kiro_folder_name
-                    if depth > max_depth or found_kiro_folder:
-                        return
-                    
-                    for item in items:
-                        if item.get('type') == 'dir':
-                            folder_name = item.get('name', '')
-                            if folder_name.startswith('.kiro'):
-                                found_kiro_folder = True
-                                kiro_folder_name = folder_name
-                                return
+                # Check if any root folder starts with ".kiro" (e.g. ".kiro-specs");
+                # the folder names are also listed in the reason when none does
+                folder_names = [item.get('name', '') for item in contents if item.get('type') == 'dir']
+                kiro_folder_name = next((name for name in folder_names if name.startswith('.kiro')), None)
                 
-                check_for_kiro_folder(contents)
-                
-                if found_kiro_folder:
+                if kiro_folder_name:
                     is_valid = True
                     reason = f"Valid - Found folder: {kiro_folder_name}"
                 else:
-                    # List all folder names for debugging
-                    folder_names = [item.get('name') for item in contents if item.get('type') == 'dir']
                     if folder_names:
                         reason = f"Invalid - No folder starting with '.kiro' found. Available folders: {', '.join(folder_names[:10])}"
                     else:
                         reason = "Invalid - No folders found in repository root"
                 
+                if response.headers.get('ETag'):
+                    github_etag_cache.set(etag_key, (response.headers['ETag'], (is_valid, reason)))
+                
                 # Success - break out of retry loop
                 break
                 
             except requests.exceptions.Timeout:
                 if attempt < max_retries - 1:
-                    print(f"[WARN] Timeout for {github_url}, retrying...")
+                    logger.warning("Timeout for %s, retrying...", github_url)
                     continue
                 return False, "Request timeout - GitHub API unreachable"
             except requests.exceptions.RequestException as e:
                 if attempt < max_retries - 1:
-                    print(f"[WARN] Request error for {github_url}: {e}, retrying...")
+                    logger.warning("Request error for %s: %s, retrying...", github_url, e)
                     time.sleep(2 ** attempt)
                     continue
                 return False, f"Network error: {str(e)}"
         
     except Exception as e:
-        print(f"[ERROR] Error verifying GitHub repo {github_url}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error verifying GitHub repo %s: %s", github_url, e)
         return False, f"System Error: {str(e)}"
     
     return is_valid, reason
 
 
+KIRO_VALIDATION_WRITE_BATCH_SIZE = 50
+
+
+def iter_grouped_results(future_to_group):
+    """Yield (item, future) for every item of each group as the group's future completes"""
+    for future in as_completed(future_to_group):
+        for item in future_to_group[future]:
+            yield item, future
+
+
+def _flush_kiro_validations(pending, bulk_update):
+    """Persist collected kiro validation results with bulk_update and clear the list"""
+    if not pending:
+        return
+    try:
+        bulk_update(pending)
+        logger.debug("Updated %d kiro submissions", len(pending))
+    except Exception as e:
+        logger.exception("Failed to update kiro submissions: %s", e)
+    pending.clear()
+
+
+def _load_github_etags(repo_keys):
+    """Seed github_etag_cache with the ETags stored for repo_keys
+    
+    Entries already in memory are newer than the stored ones and are kept.
+    Returns a dict of (owner, repo) -> ETag in effect for the run.
+    """
+    missing = [key for key in repo_keys if github_etag_cache.get(key) is None]
+    try:
+        for key, entry in GitHubRepoETag.get_many(missing).items():
+            github_etag_cache.set(key, entry)
+    except Exception as e:
+        logger.exception("Failed to load stored GitHub ETags: %s", e)
+    etags = {}
+    for key in repo_keys:
+        entry = github_etag_cache.get(key)
+        if entry:
+            etags[key] = entry[0]
+    return etags
+
+
+def _store_github_etags(entries):
+    """Persist new (owner, repo) -> (ETag, verdict) entries for the next run"""
+    if not entries:
+        return
+    try:
+        GitHubRepoETag.bulk_upsert(entries)
+        logger.debug("Stored ETags for %d GitHub repositories", len(entries))
+    except Exception as e:
+        logger.exception("Failed to store GitHub ETags: %s", e)
+
+
 def validate_single_kiro_github(submission):
     """Validate a single kiro GitHub submission (for parallel processing)
     Checks if repository exists and contains a folder starting with .kiro/
@@ -1969,28 +2020,25 @@ def validate_single_kiro_github(submission):
     if not github_link:
         return None
     
-    is_valid, reason = verify_github_repo(github_link)
+    sent_listing = github_etag_cache.get(github_repo_key(github_link))
+    verdict, requested = _verify_github_repo(github_link)
+    is_valid, reason = verdict
     
-    # Update submission
-    try:
-        KiroSubmission.update(
-            submission['week_number'],
-            submission['email'],
-            github_valid=is_valid,
-            github_validation_reason=reason
-        )
-        print(f"[DEBUG] Updated kiro GitHub submission - {submission['email']}: Valid={is_valid}, Reason={reason}")
-    except Exception as e:
-        print(f"[ERROR] Failed to update kiro GitHub submission: {e}")
-        import traceback
-        traceback.print_exc()
+    # ETag of the repository root listing the verdict is based on, if any
+    cached_listing = github_etag_cache.get(github_repo_key(github_link))
     
+    # The caller persists results in batches via _flush_kiro_validations
     return {
         'week_number': submission['week_number'],
         'email': submission['email'],
         'link': github_link,
         'valid': is_valid,
-        'reason': reason
+        'reason': reason,
+        'etag': cached_listing[0] if cached_listing else None,
+        # False when the verdict came from github_repo_cache or another check
+        'requested': requested,
+        # On a 304 _check_github_repo hands back the stored verdict object itself
+        'not_modified': requested and sent_listing is not None and verdict is sent_listing[1]
     }
 
 
@@ -2008,13 +2056,17 @@ def validate_single_kiro_submission(submission):
     comments = 0
     
     try:
+        parsed = urlparse(link.strip())
+        # Reject malformed links and other hosts before any fetch or browser render
+        if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+            reason = "Invalid URL"
         # Check domain
-        if 'community.aws' in link or 'builder.aws.com' in link:
-            print(f"[DEBUG] Validating kiro blog link: {link}")
+        elif is_blog_host(parsed.hostname):
+            logger.debug("Validating kiro blog link: %s", link)
             # Use scrape_blog_metrics which handles Selenium and 404 detection
             scraped_likes, scraped_comments, scrape_error, is_404 = scrape_blog_metrics(link)
             
-            print(f"[DEBUG] Scraped results - Likes: {scraped_likes}, Comments: {scraped_comments}, Error: {scrape_error}, Is_404: {is_404}")
+            logger.debug("Scraped results - Likes: %s, Comments: %s, Error: %s, Is_404: %s", scraped_likes, scraped_comments, scrape_error, is_404)
             
             # Check for 404 first
             if is_404 or (scrape_error and "404" in scrape_error):
@@ -2033,31 +2085,15 @@ def validate_single_kiro_submission(submission):
                 else:
                     reason = "Verified"
                 
-                print(f"[DEBUG] Setting - Valid: {is_valid}, Likes: {likes}, Comments: {comments}, Reason: {reason}")
+                logger.debug("Setting - Valid: %s, Likes: %s, Comments: %s, Reason: %s", is_valid, likes, comments, reason)
         else:
             reason = "Invalid Domain"
     except Exception as e:
-        print(f"[ERROR] Error validating link {link}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error validating link %s: %s", link, e)
         reason = f"System Error: {str(e)}"
     
-    # Always update submission (even if it was already valid) to refresh likes/comments
-    try:
-        KiroSubmission.update(
-            submission['week_number'],
-            submission['email'],
-            valid=is_valid,
-            validation_reason=reason,
-            likes=likes,
-            comments=comments
-        )
-        print(f"[DEBUG] Updated kiro submission - {submission['email']}: Valid={is_valid}, Likes={likes}, Comments={comments}")
-    except Exception as e:
-        print(f"[ERROR] Failed to update kiro submission: {e}")
-        import traceback
-        traceback.print_exc()
-    
+    # The caller always persists the result (even if the submission was already
+    # valid) to refresh likes/comments, in batches via _flush_kiro_validations
     return {
         'week_number': submission['week_number'],
         'email': submission['email'],
@@ -2075,43 +2111,30 @@ def validate_single_kiro_submission(submission):
 def kiro_submissions_statistics(week_number):
     """Get Kiro submission statistics for a specific week"""
     try:
-        # Blog statistics
-        blog_query = """
-            SELECT 
-                COUNT(*) as total_count,
-                COUNT(CASE WHEN valid = true THEN 1 END) as valid_count,
-                COUNT(CASE WHEN valid = false OR valid IS NULL THEN 1 END) as invalid_count
-            FROM kiro_submission
-            WHERE week_number = %s AND blog_link IS NOT NULL AND blog_link != ''
-        """
-        blog_result = db_manager.execute_query(blog_query, (week_number,))
-        
-        # GitHub statistics
-        github_query = """
+        # Blog and GitHub statistics in one pass over the week's rows
+        stats_query = """
             SELECT 
-                COUNT(*) as total_count,
-                COUNT(CASE WHEN github_valid = true THEN 1 END) as valid_count,
-                COUNT(CASE WHEN github_valid = false OR github_valid IS NULL THEN 1 END) as invalid_count
+                COUNT(*) FILTER (WHERE blog_link IS NOT NULL AND blog_link != '') as blog_total,
+                COUNT(*) FILTER (WHERE blog_link IS NOT NULL AND blog_link != '' AND valid = true) as blog_valid,
+                COUNT(*) FILTER (WHERE github_link IS NOT NULL AND github_link != '') as github_total,
+                COUNT(*) FILTER (WHERE github_link IS NOT NULL AND github_link != '' AND github_valid = true) as github_valid
             FROM kiro_submission
-            WHERE week_number = %s AND github_link IS NOT NULL AND github_link != ''
+            WHERE week_number = %s
         """
-        github_result = db_manager.execute_query(github_query, (week_number,))
-        
-        blog_stats = blog_result[0] if blog_result else {'total_count': 0, 'valid_count': 0, 'invalid_count': 0}
-        github_stats = github_result[0] if github_result else {'total_count': 0, 'valid_count': 0, 'invalid_count': 0}
+        stats = db_manager.execute_query(stats_query, (week_number,))[0]
         
         return jsonify({
             'success': True,
             'week_number': week_number,
             'blog': {
-                'total': blog_stats.get('total_count', 0),
-                'valid': blog_stats.get('valid_count', 0),
-                'invalid': blog_stats.get('invalid_count', 0)
+                'total': stats['blog_total'],
+                'valid': stats['blog_valid'],
+                'invalid': stats['blog_total'] - stats['blog_valid']
             },
             'github': {
-                'total': github_stats.get('total_count', 0),
-                'valid': github_stats.get('valid_count', 0),
-                'invalid': github_stats.get('invalid_count', 0)
+                'total': stats['github_total'],
+                'valid': stats['github_valid'],
+                'invalid': stats['github_total'] - stats['github_valid']
             }
         })
     except Exception as e:
@@ -2134,97 +2157,58 @@ def kiro_submissions_top_participants(week_number):
         if limit < 1 or limit > 1000:
             limit = 10
         
-        print(f"[DEBUG] Top Participants Download - Week: {week_number}, Limit: {limit}, Request args: {dict(request.args)}")
-        
-        # Get top participants
-        participants = KiroSubmission.get_top_participants(week_number, limit)
-        
-        print(f"[DEBUG] Retrieved {len(participants)} participants")
-        
-        # Create CSV
-        import csv
-        from io import StringIO
-        
-        output = StringIO()
-        writer = csv.writer(output)
-        
-        # Write header
-        writer.writerow([
-            'Rank',
-            'Email',
-            'Name',
-            'Phone Number',
-            'LinkedIn',
-            'Country',
-            'State',
-            'City',
-            'Gender',
-            'Designation',
-            'Occupation',
-            'Class/Stream',
-            'Degree Passout Year',
-            'Date of Birth',
-            'Participated in Academy 1.0',
-            'Registration Date Time',
-            'GitHub Link',
-            'Blog Link',
-            'Likes',
-            'Comments',
-            'Total Engagement',
-            'GitHub Valid',
-            'Blog Valid',
-            'Created At',
-            'Updated At'
-        ])
-        
-        # Write data rows
-        for idx, participant in enumerate(participants, start=1):
-            total_engagement = (participant.get('likes') or 0) + (participant.get('comments') or 0)
-            date_of_birth = participant.get('date_of_birth')
-            if date_of_birth:
-                if hasattr(date_of_birth, 'strftime'):
-                    date_of_birth_str = date_of_birth.strftime('%Y-%m-%d')
-                else:
-                    date_of_birth_str = str(date_of_birth)
-            else:
-                date_of_birth_str = ''
-            
-            writer.writerow([
-                idx,
-                participant.get('email', ''),
-                participant.get('name', ''),
-                participant.get('phone_number', ''),
-                participant.get('linkedin', ''),
-                participant.get('country', ''),
-                participant.get('state', ''),
-                participant.get('city', ''),
-                participant.get('gender', ''),
-                participant.get('designation', ''),
-                participant.get('occupation', ''),
-                participant.get('class_stream', ''),
-                participant.get('degree_passout_year', ''),
-                date_of_birth_str,
-                'Yes' if participant.get('participated_in_academy_1_0') else 'No',
-                participant.get('registration_date_time', '').strftime('%Y-%m-%d %H:%M:%S') if participant.get('registration_date_time') else '',
-                participant.get('github_link', ''),
-                participant.get('blog_link', ''),
-                participant.get('likes', 0),
-                participant.get('comments', 0),
-                total_engagement,
-                'Yes' if participant.get('github_valid') else 'No',
-                'Yes' if participant.get('valid') else 'No',
-                participant.get('created_at', '').strftime('%Y-%m-%d %H:%M:%S') if participant.get('created_at') else '',
-                participant.get('updated_at', '').strftime('%Y-%m-%d %H:%M:%S') if participant.get('updated_at') else ''
-            ])
+        logger.debug("Top Participants Download - Week: %s, Limit: %s, Request args: %s", week_number, limit, dict(request.args))
+        
+        # Top participants by valid GitHub and engagement (likes + comments), as in
+        # KiroSubmission.get_top_participants. Values and headers are formatted in
+        # SQL since COPY writes the CSV directly. The ORDER BY repeats the ranking
+        # so the rows can be read in order from idx_kiro_submission_top_participants
+        # and the scan stops after limit rows.
+        engagement = "(COALESCE(ks.likes, 0) + COALESCE(ks.comments, 0))"
+        query = f"""
+            SELECT ROW_NUMBER() OVER (ORDER BY {engagement} DESC, ks.likes DESC, ks.comments DESC) as "Rank",
+                   ks.email as "Email",
+                   u.name as "Name",
+                   u.phone_number as "Phone Number",
+                   u.linkedin as "LinkedIn",
+                   u.country as "Country",
+                   u.state as "State",
+                   u.city as "City",
+                   u.gender as "Gender",
+                   u.designation as "Designation",
+                   u.occupation as "Occupation",
+                   u.class_stream as "Class/Stream",
+                   u.degree_passout_year as "Degree Passout Year",
+                   TO_CHAR(u.date_of_birth, 'YYYY-MM-DD') as "Date of Birth",
+                   CASE WHEN u.participated_in_academy_1_0 THEN 'Yes' ELSE 'No' END as "Participated in Academy 1.0",
+                   TO_CHAR(u.registration_date_time, 'YYYY-MM-DD HH24:MI:SS') as "Registration Date Time",
+                   ks.github_link as "GitHub Link",
+                   ks.blog_link as "Blog Link",
+                   ks.likes as "Likes",
+                   ks.comments as "Comments",
+                   {engagement} as "Total Engagement",
+                   CASE WHEN ks.github_valid THEN 'Yes' ELSE 'No' END as "GitHub Valid",
+                   CASE WHEN ks.valid THEN 'Yes' ELSE 'No' END as "Blog Valid",
+                   TO_CHAR(ks.created_at, 'YYYY-MM-DD HH24:MI:SS') as "Created At",
+                   TO_CHAR(ks.updated_at, 'YYYY-MM-DD HH24:MI:SS') as "Updated At"
+            FROM kiro_submission ks
+            LEFT JOIN user_pii u ON ks.email = u.email
+            WHERE ks.week_number = %s
+                AND ks.github_valid = TRUE
+                AND {engagement} > 0
+            ORDER BY {engagement} DESC, ks.likes DESC, ks.comments DESC
+            LIMIT %s
+        """
         
-        # Prepare response
-        csv_content = output.getvalue()
-        output.close()
+        # Pull the first chunk (always contains the header) up front so query
+        # errors still surface through the error handler below
+        csv_chunks = db_manager.stream_copy_csv(query, (week_number, limit))
+        first_chunk = next(csv_chunks)
         
         filename = f'kiro_week_{week_number}_top_{limit}_participants.csv'
         
         response = Response(
-            csv_content,
+            stream_with_context(itertools.chain([first_chunk], csv_chunks)),
             mimetype='text/csv',
             headers={
                 'Content-Disposition': f'attachment; filename="{filename}"',
@@ -2232,6 +2216,9 @@ def kiro_submissions_top_participants(week_number):
             }
         )
         
+        # Cancel the COPY if the client disconnects before the stream ends
+        response.call_on_close(csv_chunks.close)
+        
         return response
         
     except Exception as e:
@@ -2245,60 +2232,45 @@ def kiro_submissions_top_participants(week_number):
 def get_kiro_dashboard_stats():
     """Get overall Kiro challenge statistics for dashboard"""
     try:
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-        
-        # Overall statistics
-        cursor.execute("""
-            SELECT 
-                COUNT(*) as total_submissions,
-                COUNT(DISTINCT week_number) as total_weeks,
-                COUNT(DISTINCT email) as unique_participants,
-                COUNT(CASE WHEN blog_link IS NOT NULL AND blog_link != '' THEN 1 END) as total_blogs,
-                COUNT(CASE WHEN blog_link IS NOT NULL AND blog_link != '' AND valid = true THEN 1 END) as valid_blogs,
-                COUNT(CASE WHEN github_link IS NOT NULL AND github_link != '' THEN 1 END) as total_github,
-                COUNT(CASE WHEN github_link IS NOT NULL AND github_link != '' AND github_valid = true THEN 1 END) as valid_github
-            FROM kiro_submission
-        """)
-        overall_stats = cursor.fetchone()
-        
-        # Week-by-week breakdown
-        cursor.execute("""
-            SELECT 
-                week_number,
-                COUNT(*) as total_submissions,
-                COUNT(CASE WHEN blog_link IS NOT NULL AND blog_link != '' THEN 1 END) as blog_count,
-                COUNT(CASE WHEN blog_link IS NOT NULL AND blog_link != '' AND valid = true THEN 1 END) as valid_blog_count,
-                COUNT(CASE WHEN github_link IS NOT NULL AND github_link != '' THEN 1 END) as github_count,
-                COUNT(CASE WHEN github_link IS NOT NULL AND github_link != '' AND github_valid = true THEN 1 END) as valid_github_count
-            FROM kiro_submission
-            GROUP BY week_number
-            ORDER BY week_number ASC
-        """)
-        
-        weeks_data = []
-        for row in cursor.fetchall():
-            weeks_data.append({
-                'week_number': row[0],
-                'total_submissions': row[1],
-                'blog_count': row[2],
-                'valid_blog_count': row[3],
-                'github_count': row[4],
-                'valid_github_count': row[5]
-            })
-        
-        db_manager.return_connection(conn)
+        with db_manager.pooled_cursor(cursor_factory=RealDictCursor) as cursor:
+        
+            # Week-by-week breakdown; kiro_week_stats is maintained by the
+            # bump_kiro_week_stats trigger on kiro_submission. Participants can
+            # submit in several weeks, so they are counted from kiro_submission
+            # (an index-only scan on idx_kiro_submission_email) in the same
+            # round-trip; the count is repeated on every week row.
+            cursor.execute("""
+                SELECT 
+                    w.week_number,
+                    w.submission_count as total_submissions,
+                    w.blog_count,
+                    w.valid_blog_count,
+                    w.github_count,
+                    w.valid_github_count,
+                    p.unique_participants
+                FROM kiro_week_stats w
+                CROSS JOIN (
+                    SELECT COUNT(DISTINCT email) as unique_participants FROM kiro_submission
+                ) p
+                WHERE w.submission_count > 0
+                ORDER BY w.week_number ASC
+            """)
+            weeks_data = cursor.fetchall()
+        
+        unique_participants = 0
+        for week in weeks_data:
+            unique_participants = week.pop('unique_participants')
         
         return jsonify({
             'success': True,
             'overall': {
-                'total_submissions': overall_stats[0] if overall_stats else 0,
-                'total_weeks': overall_stats[1] if overall_stats else 0,
-                'unique_participants': overall_stats[2] if overall_stats else 0,
-                'total_blogs': overall_stats[3] if overall_stats else 0,
-                'valid_blogs': overall_stats[4] if overall_stats else 0,
-                'total_github': overall_stats[5] if overall_stats else 0,
-                'valid_github': overall_stats[6] if overall_stats else 0
+                'total_submissions': sum(week['total_submissions'] for week in weeks_data),
+                'total_weeks': len(weeks_data),
+                'unique_participants': unique_participants,
+                'total_blogs': sum(week['blog_count'] for week in weeks_data),
+                'valid_blogs': sum(week['valid_blog_count'] for week in weeks_data),
+                'total_github': sum(week['github_count'] for week in weeks_data),
+                'valid_github': sum(week['valid_github_count'] for week in weeks_data)
             },
             'weeks': weeks_data
         })
@@ -2316,7 +2288,7 @@ def kiro_submissions_validate_stream():
             # Get week_number from query params
             week_number = request.args.get('week_number', type=int)
             if not week_number:
-                yield json.dumps({'error': 'Week number is required'}) + '\n'
+                yield {'error': 'Week number is required'}
                 return
             
             # Get ALL submissions for this week (not just invalid ones) to re-verify and update likes/comments
@@ -2324,11 +2296,11 @@ def kiro_submissions_validate_stream():
             submissions_to_validate = [s for s in submissions if s.get('blog_link')]
             
             if not submissions_to_validate:
-                yield json.dumps({
+                yield {
                     'current': 0,
                     'total': 0,
                     'status': 'No blog links found to validate'
-                }) + '\n'
+                }
                 return
             
             total_count = len(submissions_to_validate)
@@ -2336,22 +2308,22 @@ def kiro_submissions_validate_stream():
             failed_count = 0
             processed_count = 0
             updated_count = 0
+            pending_updates = []
             
-            # Use ThreadPoolExecutor with 10 workers for parallel processing
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                # Submit all validation tasks
-                future_to_submission = {
-                    executor.submit(validate_single_kiro_submission, submission): submission 
-                    for submission in submissions_to_validate
-                }
-                
+            try:
                 # Process results as they complete
-                for future in as_completed(future_to_submission):
+                for submission, future in iter_blog_validations(submissions_to_validate, validate_single_kiro_submission, 'blog_link'):
                     try:
                         result = future.result()
                         processed_count += 1
                         
                         if result:
+                            # Submissions sharing a link share one result
+                            result = dict(result, week_number=submission['week_number'], email=submission['email'])
+                            pending_updates.append(result)
+                            if len(pending_updates) >= KIRO_VALIDATION_WRITE_BATCH_SIZE:
+                                _flush_kiro_validations(pending_updates, KiroSubmission.bulk_update_validation)
+                            
                             if result['valid']:
                                 validated_count += 1
                                 # Check if likes or comments were updated
@@ -2365,38 +2337,41 @@ def kiro_submissions_validate_stream():
                                 status_msg = f'Processed {processed_count}/{total_count}: {result["link"][:50]}... ({result["reason"]})'
                             
                             # Yield progress with detailed counts
-                            yield json.dumps({
+                            yield {
                                 'current': processed_count,
                                 'total': total_count,
                                 'validated': validated_count,
                                 'failed': failed_count,
                                 'updated': updated_count,
                                 'status': status_msg
-                            }) + '\n'
+                            }
                     except Exception as e:
+                        logger.exception("Error processing Kiro submission %s", submission.get('blog_link'))
                         processed_count += 1
                         failed_count += 1
-                        yield json.dumps({
+                        yield {
                             'current': processed_count,
                             'total': total_count,
                             'validated': validated_count,
                             'failed': failed_count,
                             'updated': updated_count,
                             'status': f'Error processing: {str(e)}'
-                        }) + '\n'
+                        }
+            finally:
+                _flush_kiro_validations(pending_updates, KiroSubmission.bulk_update_validation)
             
             # Final summary
-            yield json.dumps({
+            yield {
                 'current': total_count,
                 'total': total_count,
                 'status': 'Complete',
                 'summary': f'Validated: {validated_count}, Failed: {failed_count}, Updated likes/comments: {updated_count}'
-            }) + '\n'
+            }
             
         except Exception as e:
-            yield json.dumps({'error': str(e)}) + '\n'
+            yield {'error': str(e)}
 
-    return Response(stream_with_context(generate()), mimetype='application/json')
+    return ndjson_stream(coalesce_events(generate()))
 
 
 @app.route('/api/kiro-submissions/validate-github-stream')
@@ -2404,16 +2379,15 @@ def kiro_submissions_validate_stream():
 @permission_required('kiro_submission_create')
 def kiro_submissions_validate_github_stream():
     """Stream validation progress for kiro GitHub submissions
-    Uses fewer workers and adds delays to respect GitHub API rate limits
+    Uses fewer workers without a token; requests are paced to the GitHub API
+    rate limits by github_rate_limiter
     """
-    import time
-    
     def generate():
         try:
             # Get week_number from query params
             week_number = request.args.get('week_number', type=int)
             if not week_number:
-                yield json.dumps({'error': 'Week number is required'}) + '\n'
+                yield {'error': 'Week number is required'}
                 return
             
             # Get ALL submissions for this week with GitHub links
@@ -2421,52 +2395,90 @@ def kiro_submissions_validate_github_stream():
             submissions_to_validate = [s for s in submissions if s.get('github_link')]
             
             if not submissions_to_validate:
-                yield json.dumps({
+                yield {
                     'current': 0,
                     'total': 0,
                     'status': 'No GitHub links found to validate'
-                }) + '\n'
+                }
                 return
             
             total_count = len(submissions_to_validate)
             validated_count = 0
             failed_count = 0
+            unchanged_count = 0
+            cached_count = 0
             processed_count = 0
+            pending_updates = []
+            pending_etags = {}
+            
+            # Group submissions by repository; submissions linking the same
+            # repository (forks of a template, ...) share one check
+            submissions_by_repo = {}
+            for submission in submissions_to_validate:
+                submissions_by_repo.setdefault(github_repo_key(submission['github_link']), []).append(submission)
+            
+            # Load the ETags stored by earlier runs so unchanged repositories are
+            # answered with a 304, which doesn't count against the rate limit
+            previous_etags = _load_github_etags([key for key in submissions_by_repo if isinstance(key, tuple)])
             
             # Use appropriate number of workers based on token availability
             # Without token: 60 requests/hour = 1 per minute (use 1 worker)
-            # With token: 5000 requests/hour = ~83 per minute (use 10 workers like blog validation)
-            github_token = os.getenv('GITHUB_TOKEN')
-            max_workers = 10 if github_token else 1
+            # With token: 5000 requests/hour = ~83 per minute (use GITHUB_MAX_WORKERS,
+            # one per keep-alive connection of github_session)
+            github_token = len(github_tokens) > 0
+            max_workers = GITHUB_MAX_WORKERS if github_token else 1
             
             if github_token:
-                yield json.dumps({
+                yield {
                     'current': 0,
                     'total': total_count,
-                    'status': f'Starting validation with {max_workers} workers (GitHub token detected)...'
-                }) + '\n'
+                    'status': f'Starting validation with {max_workers} workers ({len(github_tokens)} GitHub token(s) detected)...'
+                }
             else:
-                yield json.dumps({
+                yield {
                     'current': 0,
                     'total': total_count,
                     'status': f'Starting validation with {max_workers} worker (no token - limited to 60 requests/hour). Add GITHUB_TOKEN to .env for faster validation...'
-                }) + '\n'
+                }
             
-            # Use ThreadPoolExecutor with appropriate workers for GitHub API
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submit all validation tasks
-                future_to_submission = {
-                    executor.submit(validate_single_kiro_github, submission): submission 
-                    for submission in submissions_to_validate
+            # Use a thread per in-flight GitHub request, up to GITHUB_MAX_WORKERS
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='validate-github')
+            future_to_submissions = {}
+            try:
+                # Submit one validation task per repository
+                future_to_submissions = {
+                    executor.submit(validate_single_kiro_github, submissions[0]): submissions
+                    for submissions in submissions_by_repo.values()
                 }
                 
                 # Process results as they complete
-                for future in as_completed(future_to_submission):
+                for submission, future in iter_grouped_results(future_to_submissions):
                     try:
                         result = future.result()
                         processed_count += 1
                         
                         if result:
+                            result = dict(
+                                result,
+                                week_number=submission['week_number'],
+                                email=submission['email'],
+                                link=submission['github_link']
+                            )
+                            pending_updates.append(result)
+                            if len(pending_updates) >= KIRO_VALIDATION_WRITE_BATCH_SIZE:
+                                _flush_kiro_validations(pending_updates, KiroSubmission.bulk_update_github_validation)
+                            
+                            # Cache hits sent no request, so they are not 304s
+                            if not result['requested']:
+                                cached_count += 1
+                            elif result['not_modified']:
+                                unchanged_count += 1
+                            
+                            repo_key = github_repo_key(submission['github_link'])
+                            if (result['etag'] and result['reason'].startswith(GITHUB_CACHEABLE_REASONS)
+                                    and result['etag'] != previous_etags.get(repo_key)):
+                                pending_etags[repo_key] = (result['etag'], (result['valid'], result['reason']))
+                            
                             if result['valid']:
                                 validated_count += 1
                                 status_msg = f'Processed {processed_count}/{total_count}: {result["link"][:50]}... ({result["reason"]})'
@@ -2479,67 +2491,75 @@ def kiro_submissions_validate_github_stream():
                                     status_msg = f'Processed {processed_count}/{total_count}: {result["link"][:50]}... ({result["reason"]})'
                             
                             # Yield progress with detailed counts
-                            yield json.dumps({
+                            yield {
                                 'current': processed_count,
                                 'total': total_count,
                                 'validated': validated_count,
                                 'failed': failed_count,
+                                'unchanged': unchanged_count,
+                                'cached': cached_count,
                                 'status': status_msg
-                            }) + '\n'
-                            
-                            # Add small delay between requests only if no token (to respect rate limits)
-                            # With token, we can process faster (5000/hour = ~83/min, so 10 workers is safe)
-                            if not github_token and processed_count < total_count:
-                                time.sleep(1)  # 1 second delay without token to respect 60/hour limit
-                            # No delay needed with token - 10 workers can handle 5000/hour easily
+                            }
                                 
                     except Exception as e:
+                        logger.exception("Error processing Kiro submission %s", submission.get('github_link'))
                         processed_count += 1
                         failed_count += 1
                         error_msg = str(e)
                         if 'rate limit' in error_msg.lower() or '429' in error_msg:
                             error_msg = 'Rate limit exceeded. Please wait and try again, or add GITHUB_TOKEN to .env'
-                        yield json.dumps({
+                        yield {
                             'current': processed_count,
                             'total': total_count,
                             'validated': validated_count,
                             'failed': failed_count,
                             'status': f'Error processing: {error_msg}'
-                        }) + '\n'
+                        }
+            finally:
+                # If the client went away, drop queued checks instead of waiting for them
+                for future in future_to_submissions:
+                    future.cancel()
+                executor.shutdown(wait=False)
+                _flush_kiro_validations(pending_updates, KiroSubmission.bulk_update_github_validation)
+                _store_github_etags(pending_etags)
             
             # Final summary
-            yield json.dumps({
+            yield {
                 'current': total_count,
                 'total': total_count,
                 'status': 'Complete',
-                'summary': f'Validated: {validated_count}, Failed: {failed_count}'
-            }) + '\n'
+                'summary': f'Validated: {validated_count}, Failed: {failed_count}, Unchanged since last run (304): {unchanged_count}, Reused cached results: {cached_count}'
+            }
             
         except Exception as e:
-            yield json.dumps({'error': str(e)}) + '\n'
+            yield {'error': str(e)}
 
-    return Response(stream_with_context(generate()), mimetype='application/json')
+    return ndjson_stream(coalesce_events(generate()))
 
 
 # ============================================
 # Routes - Master Logs
 # ============================================
+# Largest number of log rows a single request may ask for
+MAX_LOG_LIMIT = 1000
+
+
+def _log_filter_args():
+    """Read the table/operation filters and the row limit (clamped to 1..MAX_LOG_LIMIT) from the query string"""
+    table_filter = request.args.get('table', '')
+    operation_filter = request.args.get('operation', '')
+    limit = request.args.get('limit', 100, type=int)
+    return table_filter, operation_filter, min(max(limit, 1), MAX_LOG_LIMIT)
+
+
 @app.route('/logs')
 @login_required
 @permission_required('logs_list')
 def logs_list():
     """View master logs"""
     try:
-        table_filter = request.args.get('table', '')
-        operation_filter = request.args.get('operation', '')
-        limit = int(request.args.get('limit', 100))
-        
-        if table_filter:
-            logs = MasterLogs.get_by_table(table_filter, limit=limit)
-        elif operation_filter:
-            logs = MasterLogs.get_by_operation(operation_filter, limit=limit)
-        else:
-            logs = MasterLogs.get_all(limit=limit)
+        table_filter, operation_filter, limit = _log_filter_args()
+        logs = MasterLogs.get_filtered(table_filter or None, operation_filter or None, limit)
         
         return render_template('logs_list.html', logs=logs, 
                              table_filter=table_filter, operation_filter=operation_filter)
@@ -2549,26 +2569,29 @@ def logs_list():
 
 
 @app.route('/api/logs')
+@login_required
+@permission_required('logs_list')
 def api_logs():
-    """API endpoint for logs (JSON)"""
+    """API endpoint for logs (JSON array)
+    Clients that send Accept: application/x-ndjson get the logs streamed as
+    one JSON object per line instead
+    """
     try:
-        table_filter = request.args.get('table', '')
-        operation_filter = request.args.get('operation', '')
-        limit = int(request.args.get('limit', 100))
-        
-        if table_filter:
-            logs = MasterLogs.get_by_table(table_filter, limit=limit)
-        elif operation_filter:
-            logs = MasterLogs.get_by_operation(operation_filter, limit=limit)
-        else:
-            logs = MasterLogs.get_all(limit=limit)
+        table_filter, operation_filter, limit = _log_filter_args()
+        if request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson']) != 'application/x-ndjson':
+            # OrJSONProvider emits the timestamps as ISO 8601 strings
+            return jsonify(MasterLogs.get_filtered(table_filter or None, operation_filter or None, limit))
+        
+        logs = MasterLogs.iter_filtered(table_filter or None, operation_filter or None, limit)
         
-        # Convert datetime objects to strings for JSON serialization
-        for log in logs:
-            if log.get('timestamp'):
-                log['timestamp'] = log['timestamp'].isoformat() if hasattr(log['timestamp'], 'isoformat') else str(log['timestamp'])
+        # Run the query now so database errors still get a JSON 500 response
+        try:
+            first = next(logs)
+        except StopIteration:
+            return ndjson_stream(iter(()))
         
-        return jsonify(logs)
+        # orjson emits the timestamps as ISO 8601 strings
+        return ndjson_stream(ndjson_line(log) for log in itertools.chain((first,), logs))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -3072,7 +3095,6 @@ def import_advanced():
                     errors.extend(db_errors)
                 except Exception as db_error:
                     print(f"Database error: {db_error}")
-                    import traceback
                     traceback.print_exc()
                     errors.append(f"Database error: {str(db_error)}")
                     # Don't raise, continue to return partial results
@@ -3092,7 +3114,6 @@ def import_advanced():
             
         except Exception as e:
             print(f"Exception in import processing: {e}")
-            import traceback
             traceback.print_exc()
             response = {
                 'success': False,
@@ -3352,7 +3373,6 @@ def import_master():
             
         except Exception as e:
             print(f"Exception in master import: {e}")
-            import traceback
             traceback.print_exc()
             response = {
                 'success': False,
@@ -3963,11 +3983,9 @@ def export_to_sheet():
             ORDER BY workshop_number, time_slot_number, occupation
         """
         
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        db_manager.return_connection(conn)
+        with db_manager.pooled_cursor() as cursor:
+            cursor.execute(query)
+            rows = cursor.fetchall()
         
         if not rows:
             return jsonify({
@@ -4020,7 +4038,6 @@ def export_to_sheet():
             'error': f'Credentials file not found: {str(e)}'
         }), 500
     except Exception as e:
-        import traceback
         error_trace = traceback.format_exc()
         print(f"Error exporting to Google Sheet: {error_trace}")
         return jsonify({
@@ -0,0 +1,421 @@
+"""
+Browser utilities for AWS AI for Bharat Tracking System
+Pool of headless Chrome instances reused across blog metric scrapes
+"""
+import atexit
+import hashlib
+import logging
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+from html_utils import COMMENT_BUTTON_LABEL, LIKE_BUTTON_LABEL
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================
+# Constants
+# ============================================
+
+# Browsers are restarted after this many pages to bound memory growth
+MAX_USES_PER_INSTANCE = 50
+
+# Span holding the like/comment count inside the article action buttons
+ACTION_TEXT_SELECTOR = "span[class*='_card-action-text']"
+
+# Subresources the scraper never needs (images, styles, fonts, media, trackers)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3",
+    "*googletagmanager*", "*google-analytics*", "*doubleclick*",
+]
+
+# Resolved ChromeDriver path is remembered here across process restarts
+CHROMEDRIVER_PATH_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.chromedriver_path')
+
+# File names of the ChromeDriver executable
+CHROMEDRIVER_NAMES = ('chromedriver', 'chromedriver.exe')
+
+# Maximum number of Chrome instances alive at once
+CHROME_POOL_MAX_CAPACITY = 8
+
+# Runs in the page and returns {title, notFound, likes, comments}. Mirrors
+# html_utils.extract_action_count: a button's action-text span wins over any
+# other numeric span. Arguments: action-text selector, like label, comment
+# label, 404 head window, "can't be found" message pattern.
+EXTRACT_METRICS_SCRIPT = r"""
+const [actionTextSelector, likeLabel, commentLabel, headChars, messagePattern] = arguments;
+const count = (label) => {
+    const buttons = document.querySelectorAll(`button[aria-label*="${label}"]`);
+    for (const selector of [actionTextSelector, 'span']) {
+        for (const button of buttons) {
+            for (const span of button.querySelectorAll(selector)) {
+                const text = span.textContent.trim();
+                if (/^\d+$/.test(text)) return parseInt(text, 10);
+            }
+        }
+    }
+    return null;
+};
+const html = document.documentElement.outerHTML;
+return {
+    title: document.title,
+    notFound: html.slice(0, headChars).includes('404') || new RegExp(messagePattern, 'i').test(html),
+    likes: count(likeLabel),
+    comments: count(commentLabel),
+};
+"""
+
+# How long scrape() polls for the rendered like/comment counts, and how often
+RENDER_TIMEOUT = 12
+RENDER_POLL_INTERVAL = 0.1
+
+# Set SCRAPER_DEBUG_DUMP to save each rendered page under this directory
+SCRAPER_DEBUG_DUMP = bool(os.getenv('SCRAPER_DEBUG_DUMP'))
+SCRAPER_DEBUG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'debug')
+
+# 404 detection: title markers, a marker near the top of the page, and the
+# builder.aws.com "page not found" message anywhere in the page
+NOT_FOUND_TITLE_RE = re.compile(r"404|not found", re.IGNORECASE)
+NOT_FOUND_MESSAGE_RE = re.compile(r"page you['’]re looking for can['’]t be found", re.IGNORECASE)
+NOT_FOUND_HEAD_CHARS = 2000
+
+
+# ============================================
+# ChromeDriver setup
+# ============================================
+
+def _build_chrome_options():
+    """Build the headless Chrome options shared by every pooled browser"""
+    chrome_options = Options()
+    chrome_options.add_argument('--headless=new')  # Use new headless mode (faster)
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-plugins')
+    chrome_options.add_argument('--disable-background-timer-throttling')
+    chrome_options.add_argument('--disable-backgrounding-occluded-windows')
+    chrome_options.add_argument('--disable-renderer-backgrounding')
+    chrome_options.add_argument('--disable-features=TranslateUI')
+    chrome_options.add_argument('--disable-ipc-flooding-protection')
+    chrome_options.add_argument('--disable-hang-monitor')
+    chrome_options.add_argument('--disable-prompt-on-repost')
+    chrome_options.add_argument('--disable-domain-reliability')
+    chrome_options.add_argument('--disable-component-update')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-sync')
+    chrome_options.add_argument('--disable-default-apps')
+    chrome_options.add_argument('--disable-breakpad')
+    chrome_options.add_argument('--disable-client-side-phishing-detection')
+    chrome_options.add_argument('--disable-crash-reporter')
+    chrome_options.add_argument('--disable-features=AudioServiceOutOfProcess')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')  # Disable images
+    chrome_options.add_argument('--disk-cache-size=1048576')  # Keep the per-browser cache small
+    chrome_options.page_load_strategy = 'none'  # get() returns at navigation; scrape() polls for the counts
+
+    # Block images and CSS to speed up loading
+    prefs = {
+        "profile.managed_default_content_settings.images": 2,  # Block images
+        "profile.default_content_setting_values.notifications": 2,
+        "profile.default_content_settings.popups": 0,
+    }
+    chrome_options.add_experimental_option("prefs", prefs)
+
+    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+    return chrome_options
+
+
+def _resolve_chromedriver_path():
+    """Locate the ChromeDriver executable
+    
+    Returns the path to ChromeDriver, or None to let Selenium find it on PATH.
+    """
+    try:
+        driver_path = ChromeDriverManager().install()
+        logger.debug("ChromeDriverManager returned path: %s", driver_path)
+
+        # Some webdriver-manager releases return THIRD_PARTY_NOTICES.chromedriver;
+        # the executable sits next to it
+        if os.path.basename(driver_path) not in CHROMEDRIVER_NAMES:
+            driver_dir = os.path.dirname(driver_path)
+            driver_path = next(
+                (os.path.join(driver_dir, name) for name in CHROMEDRIVER_NAMES
+                 if os.path.isfile(os.path.join(driver_dir, name))),
+                driver_path
+            )
+
+        if not os.path.isfile(driver_path) or os.path.basename(driver_path) not in CHROMEDRIVER_NAMES:
+            raise Exception(f"ChromeDriver not found at {driver_path}")
+        return driver_path
+    except Exception as e:
+        logger.warning("webdriver-manager failed: %s", e)
+        # Try ChromeDriver from PATH
+        chromedriver_path = shutil.which('chromedriver')
+        if chromedriver_path:
+            logger.debug("Found chromedriver at: %s", chromedriver_path)
+        return chromedriver_path
+
+
+def _read_cached_chromedriver_path():
+    """Read the ChromeDriver path saved by a previous run, if it still exists"""
+    try:
+        with open(CHROMEDRIVER_PATH_CACHE_FILE, 'r', encoding='utf-8') as f:
+            driver_path = f.read().strip()
+    except OSError:
+        return None
+    return driver_path if driver_path and os.path.exists(driver_path) else None
+
+
+def _write_cached_chromedriver_path(driver_path):
+    """Save the resolved ChromeDriver path for the next process start"""
+    try:
+        with open(CHROMEDRIVER_PATH_CACHE_FILE, 'w', encoding='utf-8') as f:
+            f.write(driver_path)
+    except OSError as e:
+        logger.warning("Could not cache ChromeDriver path: %s", e)
+
+
+_chromedriver_path = None
+_chromedriver_resolved = False
+_chromedriver_lock = threading.Lock()
+
+
+def get_chromedriver_path():
+    """Resolve the ChromeDriver path once per process
+    
+    The on-disk cache is tried first; discovery only runs on a cache miss.
+    """
+    global _chromedriver_path, _chromedriver_resolved
+    with _chromedriver_lock:
+        if not _chromedriver_resolved:
+            _chromedriver_path = _read_cached_chromedriver_path()
+            if _chromedriver_path:
+                logger.debug("Using cached ChromeDriver path: %s", _chromedriver_path)
+            else:
+                _chromedriver_path = _resolve_chromedriver_path()
+                if _chromedriver_path:
+                    _write_cached_chromedriver_path(_chromedriver_path)
+            _chromedriver_resolved = True
+        return _chromedriver_path
+
+
+def refresh_chromedriver_path(stale_path):
+    """Forget a ChromeDriver path that could not start Chrome and resolve it again
+    
+    A cached driver stops matching Chrome once Chrome updates itself; the
+    cache file is removed so discovery (and its download) runs again. If
+    another thread already refreshed the path, its result is returned.
+    """
+    global _chromedriver_path, _chromedriver_resolved
+    with _chromedriver_lock:
+        if _chromedriver_path == stale_path:
+            try:
+                os.remove(CHROMEDRIVER_PATH_CACHE_FILE)
+            except OSError:
+                pass
+            _chromedriver_path = _resolve_chromedriver_path()
+            if _chromedriver_path:
+                _write_cached_chromedriver_path(_chromedriver_path)
+            _chromedriver_resolved = True
+        return _chromedriver_path
+
+
+def _start_chrome(driver_path):
+    """Start a headless Chrome with the given ChromeDriver (None: from PATH)"""
+    if driver_path:
+        return webdriver.Chrome(service=Service(driver_path), options=_build_chrome_options())
+    return webdriver.Chrome(options=_build_chrome_options())
+
+
+# ============================================
+# Metric extraction
+# ============================================
+
+def _dump_page_source(url, html):
+    """Save a rendered page to a per-URL file under SCRAPER_DEBUG_DIR"""
+    path = os.path.join(SCRAPER_DEBUG_DIR, f"{hashlib.md5(url.encode()).hexdigest()}.html")
+    try:
+        os.makedirs(SCRAPER_DEBUG_DIR, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        logger.debug("Saved page source for %s to %s", url, path)
+    except OSError as e:
+        logger.warning("Could not save page source for %s: %s", url, e)
+
+
+# ============================================
+# Browser pool
+# ============================================
+
+class ChromeBrowserResource:
+    """A headless Chrome instance that can be reused for many scrapes"""
+    
+    def __init__(self):
+        driver_path = get_chromedriver_path()
+        logger.debug("Starting pooled Chrome driver (ChromeDriver: %s)", driver_path or 'PATH')
+        try:
+            self.driver = _start_chrome(driver_path)
+        except SessionNotCreatedException as e:
+            # Usually a cached ChromeDriver left behind by a Chrome update
+            new_path = refresh_chromedriver_path(driver_path)
+            if new_path == driver_path:
+                raise
+            logger.warning("ChromeDriver %s could not start Chrome (%s), retrying with %s", driver_path, e.msg, new_path or 'PATH')
+            self.driver = _start_chrome(new_path)
+        # Abort subresource downloads at the network layer; only the DOM text is scraped
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        self.uses = 0
+        self.dead = False
+    
+    def scrape(self, url):
+        """
+        Load url and scrape its likes and comments count
+        Returns: (likes: int, comments: int, error: str or None, is_404: bool)
+        """
+        self.uses += 1
+        likes = 0
+        comments = 0
+        error = None
+        is_404 = False
+        
+        try:
+            logger.debug("Loading page: %s", url)
+            self.driver.get(url)
+            logger.debug("Navigation started, waiting for dynamic content...")
+            rendered = False
+            try:
+                # Return as soon as both counts render (or the page is a 404). The
+                # pool resets browsers to about:blank, so the previous article's
+                # spans can't satisfy this while the new page is still loading.
+                rendered = WebDriverWait(self.driver, RENDER_TIMEOUT, poll_frequency=RENDER_POLL_INTERVAL).until(
+                    lambda d: len(d.find_elements(By.CSS_SELECTOR, ACTION_TEXT_SELECTOR)) >= 2 or '404' in d.title.lower()
+                )
+            except TimeoutException:
+                logger.debug("Action text not rendered after %ss, continuing", RENDER_TIMEOUT)
+            if not rendered:
+                time.sleep(0.5)  # Small grace period before extraction
+            logger.debug("Dynamic content wait complete")
+
+            if SCRAPER_DEBUG_DUMP:
+                _dump_page_source(url, self.driver.page_source)
+
+            # Read the title, 404 markers and both counts in one WebDriver call
+            logger.debug("Searching for like/comment elements on %s", url)
+            metrics = self.driver.execute_script(
+                EXTRACT_METRICS_SCRIPT,
+                ACTION_TEXT_SELECTOR, LIKE_BUTTON_LABEL, COMMENT_BUTTON_LABEL,
+                NOT_FOUND_HEAD_CHARS, NOT_FOUND_MESSAGE_RE.pattern
+            )
+
+            # Check for 404 indicators
+            if NOT_FOUND_TITLE_RE.search(metrics['title']) or metrics['notFound']:
+                is_404 = True
+                error = "404 Not Found"
+                return likes, comments, error, is_404
+
+            like_count = metrics['likes']
+            comment_count = metrics['comments']
+
+            # If we didn't find values, keep them as 0 (default)
+            if like_count is None:
+                logger.debug("Like button not found or no numeric value extracted, keeping likes=0")
+            else:
+                likes = like_count
+            if comment_count is None:
+                logger.debug("Comment button not found or no numeric value extracted, keeping comments=0")
+            else:
+                comments = comment_count
+
+            logger.debug("Final results: Likes=%s, Comments=%s", likes, comments)
+            return likes, comments, error, is_404
+        except WebDriverException:
+            # The browser may have crashed; retire it instead of reusing it
+            self.dead = True
+            raise
+    
+    def reset(self):
+        """Drop the last page's DOM, scripts and storage before the next checkout"""
+        try:
+            self.driver.execute_script(
+                "window.stop();"
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            self.driver.get("about:blank")
+        except WebDriverException:
+            self.dead = True
+    
+    def check_invalid(self):
+        """Whether this browser should be retired instead of returned to the pool"""
+        return self.dead or self.uses >= MAX_USES_PER_INSTANCE
+    
+    def clean_up(self):
+        """Shut the browser down"""
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class ChromePool:
+    """Thread-safe pool of reusable browser resources
+    
+    At most max_capacity resources exist at once; callers beyond that wait
+    for a resource to be returned. Resources are created on demand, reset()
+    when returned and retired when check_invalid() says so.
+    """
+    
+    def __init__(self, factory, max_capacity: int = CHROME_POOL_MAX_CAPACITY):
+        self._factory = factory
+        self.max_capacity = max_capacity
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_capacity)
+    
+    @contextmanager
+    def get(self):
+        """Borrow a resource for the duration of a with block"""
+        self._slots.acquire()
+        resource = None
+        try:
+            try:
+                resource = self._idle.get_nowait()
+            except queue.Empty:
+                resource = self._factory()
+            yield resource
+        finally:
+            if resource is not None:
+                if not resource.check_invalid():
+                    resource.reset()
+                if resource.check_invalid():
+                    resource.clean_up()
+                else:
+                    self._idle.put(resource)
+            self._slots.release()
+    
+    def close(self):
+        """Shut down all idle resources"""
+        while True:
+            try:
+                self._idle.get_nowait().clean_up()
+            except queue.Empty:
+                break
+
+
+CHROME_POOL = ChromePool(ChromeBrowserResource)
+atexit.register(CHROME_POOL.close)
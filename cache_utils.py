@@ -0,0 +1,92 @@
+"""
+Caching utilities for AWS AI for Bharat Tracking System
+Small in-process TTL cache used to share expensive aggregate queries
+across bursts of dashboard requests
+"""
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable
+
+
+class TTLCache:
+    """Thread-safe key/value cache whose entries expire after a fixed TTL"""
+
+    def __init__(self, ttl: float = 30, maxsize: int = 8):
+        """
+        Initialize the cache
+
+        Args:
+            ttl: Seconds an entry stays valid after it is stored
+            maxsize: Maximum number of entries; the oldest entry is evicted first
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()  # key -> (expires_at, value), oldest first
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or default if it is missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store a value under key"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            elif len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._data.clear()
+
+
+# Cache for dashboard aggregates; cleared by db_manager.commit() on every write
+dashboard_cache = TTLCache(ttl=30, maxsize=8)
+
+# GitHub (owner, repo) -> (ETag, validation result) of the repository root
+# listing, for conditional re-validation. GitHub confirms every hit with a 304,
+# so entries can outlive the weekly validation cycle without going stale; the
+# Kiro GitHub validation also stores them in github_repo_etag across restarts.
+github_etag_cache = TTLCache(ttl=30 * 24 * 3600, maxsize=10000)
+
+# GitHub (owner, repo) -> verify_github_repo result, so repeated links skip the API
+github_repo_cache = TTLCache(ttl=3600, maxsize=4096)
+
+# Scraped blog metrics per URL, so re-validating within the TTL skips the scrape
+blog_metrics_cache = TTLCache(ttl=900, maxsize=10000)
+
+
+def ttl_cached(cache: TTLCache, key: Hashable) -> Callable:
+    """Decorator that caches a zero-argument function's result under key
+
+    Concurrent callers that miss the cache wait for a single computation
+    instead of each running the function.
+    """
+    def decorator(f):
+        lock = threading.Lock()
+
+        @wraps(f)
+        def decorated_function():
+            value = cache.get(key)
+            if value is None:
+                with lock:
+                    value = cache.get(key)
+                    if value is None:
+                        value = f()
+                        cache.set(key, value)
+            return value
+        return decorated_function
+    return decorator
@@ -2,13 +2,17 @@
 Database connection and configuration for AWS AI for Bharat Tracking System
 """
 import os
+import queue
+import threading
+from contextlib import contextmanager
 from typing import Optional
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from dotenv import load_dotenv
 import json
 from datetime import datetime
+from cache_utils import dashboard_cache
 
 # Load environment variables
 load_dotenv()
@@ -34,12 +38,12 @@ class DatabaseManager:
     
     def __init__(self):
         self.config = DatabaseConfig()
-        self.pool: Optional[SimpleConnectionPool] = None
+        self.pool: Optional[ThreadedConnectionPool] = None
     
-    def create_pool(self, min_conn: int = 1, max_conn: int = 10):
-        """Create a connection pool"""
+    def create_pool(self, min_conn: int = 4, max_conn: int = 16):
+        """Create a thread-safe connection pool (sized for concurrent dashboard queries)"""
         try:
-            self.pool = SimpleConnectionPool(
+            self.pool = ThreadedConnectionPool(
                 min_conn,
                 max_conn,
                 host=self.config.host,
@@ -65,12 +69,48 @@ class DatabaseManager:
         if self.pool:
             self.pool.putconn(conn)
     
+    @contextmanager
+    def pooled_cursor(self, cursor_factory=None):
+        """Context manager yielding a cursor on a pooled connection
+        
+        The connection is always returned to the pool, even if the block raises.
+        """
+        conn = self.get_connection()
+        try:
+            yield conn.cursor(cursor_factory=cursor_factory)
+        finally:
+            self.return_connection(conn)
+    
+    def iter_query(self, query: str, params: tuple = None, itersize: int = 200):
+        """Yield the rows of a SELECT query as dicts using a server-side cursor
+        
+        Rows are fetched itersize at a time, so memory stays bounded however
+        many rows match. The connection is held until the generator is
+        exhausted or closed.
+        """
+        conn = self.get_connection()
+        try:
+            # Named cursors are per connection, and this one is not shared
+            cursor = conn.cursor(name='iter_query', cursor_factory=RealDictCursor)
+            cursor.itersize = itersize
+            cursor.execute(query, params)
+            for row in cursor:
+                yield dict(row)
+        finally:
+            conn.rollback()
+            self.return_connection(conn)
+    
     def close_pool(self):
         """Close all connections in the pool"""
         if self.pool:
             self.pool.closeall()
             print("Connection pool closed")
     
+    def commit(self, conn):
+        """Commit a write and drop the dashboard aggregates it may have changed"""
+        conn.commit()
+        dashboard_cache.clear()
+    
     def execute_query(self, query: str, params: tuple = None, fetch: bool = True):
         """Execute a query and return results"""
         conn = None
@@ -80,14 +120,14 @@ class DatabaseManager:
             cursor.execute(query, params)
             
             if fetch:
-                if query.strip().upper().startswith('SELECT'):
+                if query.strip().upper().startswith(('SELECT', 'WITH')):
                     result = cursor.fetchall()
                     return [dict(row) for row in result]
                 else:
-                    conn.commit()
+                    self.commit(conn)
                     return cursor.rowcount
             else:
-                conn.commit()
+                self.commit(conn)
                 return cursor.rowcount
         except Exception as e:
             if conn:
@@ -98,6 +138,74 @@ class DatabaseManager:
             if conn:
                 self.return_connection(conn)
     
+    def stream_copy_csv(self, query: str, params: tuple = None, chunk_size: int = 64 * 1024):
+        """Stream a SELECT query as CSV (with header row) using COPY ... TO STDOUT
+        
+        Postgres formats the CSV; a worker thread runs copy_expert and hands
+        chunks of roughly chunk_size bytes to this generator as they arrive.
+        Closing the generator early cancels the COPY and releases the connection.
+        """
+        chunks = queue.Queue(maxsize=16)
+        cancelled = threading.Event()
+        done = object()
+        
+        def put(item) -> bool:
+            # Give up if the consumer went away instead of blocking forever
+            while not cancelled.is_set():
+                try:
+                    chunks.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        class ChunkWriter:
+            """File-like target for copy_expert that batches rows into chunks"""
+            def __init__(self):
+                self.buffer = bytearray()
+            
+            def write(self, data):
+                self.buffer += data
+                if len(self.buffer) >= chunk_size:
+                    self.flush()
+            
+            def flush(self):
+                if self.buffer:
+                    if not put(bytes(self.buffer)):
+                        raise RuntimeError("CSV stream cancelled")
+                    self.buffer.clear()
+        
+        def copy_worker():
+            conn = None
+            try:
+                conn = self.get_connection()
+                cursor = conn.cursor()
+                select_sql = cursor.mogrify(query, params).decode()
+                writer = ChunkWriter()
+                cursor.copy_expert(f"COPY ({select_sql}) TO STDOUT WITH CSV HEADER", writer)
+                writer.flush()
+                conn.rollback()
+            except Exception as e:
+                if conn:
+                    conn.rollback()
+                put(e)
+            finally:
+                if conn:
+                    self.return_connection(conn)
+                put(done)
+        
+        threading.Thread(target=copy_worker, daemon=True).start()
+        try:
+            while True:
+                item = chunks.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            cancelled.set()
+    
     def initialize_database(self, schema_file: str = 'schema.sql'):
         """Initialize database by running schema SQL file"""
         conn = None
@@ -109,7 +217,7 @@ class DatabaseManager:
                 schema_sql = f.read()
             
             cursor.execute(schema_sql)
-            conn.commit()
+            self.commit(conn)
             print("Database schema initialized successfully")
         except Exception as e:
             if conn:
@@ -125,6 +233,33 @@ class DatabaseManager:
 db_manager = DatabaseManager()
 
 
+def _like_pattern(term: str) -> str:
+    """Build an ILIKE substring pattern with LIKE wildcards in term escaped"""
+    escaped = term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+
+# TIMESTAMP columns of the rows UserPII.get_activity aggregates with json_agg,
+# which renders them as strings
+_ACTIVITY_TIMESTAMP_FIELDS = {
+    'logs': ('timestamp',),
+    'booked_slots': ('time_slot', 'created_at', 'updated_at'),
+    'blog_submissions': ('created_at', 'updated_at'),
+    'kiro_submissions': ('created_at', 'updated_at'),
+}
+
+
+def _parse_json_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a TIMESTAMP as rendered by Postgres JSON functions (2024-05-01T10:30:00.12)"""
+    if not value:
+        return None
+    seconds, _, fraction = value.partition('.')
+    parsed = datetime.strptime(seconds, '%Y-%m-%dT%H:%M:%S')
+    if fraction:
+        parsed = parsed.replace(microsecond=int(fraction.ljust(6, '0')[:6]))
+    return parsed
+
+
 class UserPII:
     """Model for User PII table"""
     
@@ -189,6 +324,102 @@ class UserPII:
         query = "SELECT * FROM user_pii ORDER BY created_at DESC"
         return db_manager.execute_query(query)
     
+    @staticmethod
+    def list_page(limit: int = 50, after: tuple = None, before: tuple = None, search: str = None):
+        """Get one page of user PII records, newest registration first
+        
+        Keyset pagination on (registration_date_time, email): pass the last
+        row's key as after for the next page, or the first row's key as
+        before for the previous page.
+        
+        Returns:
+            (rows, has_more) where has_more tells whether more rows exist
+            beyond this page in the direction being paged
+        """
+        conditions = []
+        params = []
+        
+        if search:
+            pattern = _like_pattern(search)
+            conditions.append("(email ILIKE %s OR name ILIKE %s OR phone_number ILIKE %s OR country ILIKE %s)")
+            params.extend([pattern] * 4)
+        
+        if after:
+            conditions.append("(registration_date_time, email) < (%s, %s)")
+            params.extend(after)
+        elif before:
+            conditions.append("(registration_date_time, email) > (%s, %s)")
+            params.extend(before)
+        
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        direction = "ASC" if before and not after else "DESC"
+        query = f"""
+            SELECT * FROM user_pii
+            {where_clause}
+            ORDER BY registration_date_time {direction}, email {direction}
+            LIMIT %s
+        """
+        params.append(limit + 1)
+        
+        rows = db_manager.execute_query(query, tuple(params))
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if direction == "ASC":
+            rows.reverse()
+        return rows, has_more
+    
+    @staticmethod
+    def search(term: str, limit: int = 20):
+        """Search users by email or name (case-insensitive substring match)"""
+        pattern = _like_pattern(term)
+        query = """
+            SELECT email, name FROM user_pii
+            WHERE email ILIKE %s OR name ILIKE %s
+            ORDER BY email
+            LIMIT %s
+        """
+        return db_manager.execute_query(query, (pattern, pattern, limit))
+    
+    @staticmethod
+    def get_activity(email: str):
+        """Get logs, booked slots, blog submissions and Kiro submissions for a user in one round-trip
+        
+        Returns:
+            dict with 'logs', 'booked_slots', 'blog_submissions' and 'kiro_submissions' lists
+        """
+        query = """
+            WITH l AS (
+                SELECT COALESCE(json_agg(ml ORDER BY ml.timestamp DESC), '[]'::json) AS logs
+                FROM master_logs ml
+                WHERE ml.table_name = 'user_pii' AND ml.record_identifier = %s
+            ), s AS (
+                SELECT COALESCE(json_agg(fr ORDER BY fr.created_at DESC), '[]'::json) AS booked_slots
+                FROM form_response fr
+                WHERE fr.email = %s
+            ), p AS (
+                SELECT COALESCE(json_agg(ps ORDER BY ps.created_at DESC), '[]'::json) AS blog_submissions
+                FROM project_submission ps
+                WHERE ps.email = %s
+            ), k AS (
+                SELECT COALESCE(json_agg(ks ORDER BY ks.week_number ASC), '[]'::json) AS kiro_submissions
+                FROM kiro_submission ks
+                WHERE ks.email = %s
+            )
+            SELECT l.logs, s.booked_slots, p.blog_submissions, k.kiro_submissions
+            FROM l, s, p, k
+        """
+        result = db_manager.execute_query(query, (email, email, email, email))
+        if not result:
+            return {key: [] for key in _ACTIVITY_TIMESTAMP_FIELDS}
+        
+        # Hand the template datetimes, as the per-table queries did
+        activity = result[0]
+        for key, fields in _ACTIVITY_TIMESTAMP_FIELDS.items():
+            for row in activity[key]:
+                for field in fields:
+                    row[field] = _parse_json_timestamp(row.get(field))
+        return activity
+    
     @staticmethod
     def bulk_upsert(records: list):
         """Bulk upsert user PII records (insert or update)"""
@@ -269,7 +500,7 @@ class UserPII:
                     ))
                     inserted += cursor.rowcount
             
-            conn.commit()
+            db_manager.commit(conn)
             return {"inserted": inserted, "updated": updated}
         except Exception as e:
             if conn:
@@ -339,7 +570,7 @@ class FormResponse:
                 ))
                 inserted += cursor.rowcount
             
-            conn.commit()
+            db_manager.commit(conn)
             return {"inserted": inserted, "updated": updated}
         except Exception as e:
             if conn:
@@ -449,7 +680,7 @@ class AWSTeamBuilding:
                     ))
                     inserted += cursor.rowcount
             
-            conn.commit()
+            db_manager.commit(conn)
             return {"inserted": inserted, "updated": updated}
         except Exception as e:
             if conn:
@@ -513,6 +744,84 @@ class ProjectSubmission:
         query = "SELECT * FROM project_submission ORDER BY created_at DESC"
         return db_manager.execute_query(query)
     
+    @staticmethod
+    def count_with_links() -> int:
+        """Count project submissions that have a project link"""
+        query = "SELECT COUNT(*) AS count FROM project_submission WHERE project_link IS NOT NULL AND project_link <> ''"
+        return db_manager.execute_query(query)[0]['count']
+    
+    @staticmethod
+    def iter_with_links(batch_size: int = 500):
+        """Yield project submissions that have a project link
+        
+        Rows are read batch_size at a time, paging on the primary key, so no
+        connection is held while the caller works through a batch. Only the
+        key and project_link columns are returned.
+        """
+        query = """
+            SELECT workshop_name, email, project_link FROM project_submission
+            WHERE project_link IS NOT NULL AND project_link <> ''{after}
+            ORDER BY workshop_name, email
+            LIMIT %s
+        """
+        rows = db_manager.execute_query(query.format(after=''), (batch_size,))
+        while True:
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            last = rows[-1]
+            rows = db_manager.execute_query(
+                query.format(after=' AND (workshop_name, email) > (%s, %s)'),
+                (last['workshop_name'], last['email'], batch_size)
+            )
+    
+    @staticmethod
+    def bulk_update_validation(results: list):
+        """Write validation results for many submissions in one statement
+        
+        Args:
+            results: objects with workshop_name, email, valid, reason, likes and
+                comments attributes (e.g. app_web.BlogValidationResult)
+        
+        Returns:
+            Number of rows updated
+        """
+        if not results:
+            return 0
+        
+        conn = None
+        try:
+            conn = db_manager.get_connection()
+            cursor = conn.cursor()
+            execute_values(
+                cursor,
+                """
+                    UPDATE project_submission AS p SET
+                        valid = v.valid,
+                        validation_reason = v.reason,
+                        likes = v.likes,
+                        comments = v.comments
+                    FROM (VALUES %s) AS v(workshop_name, email, valid, reason, likes, comments)
+                    WHERE p.workshop_name = v.workshop_name AND p.email = v.email
+                """,
+                [
+                    (r.workshop_name, r.email, r.valid, r.reason, r.likes, r.comments)
+                    for r in results
+                ],
+                template="(%s, %s, %s::boolean, %s, %s::integer, %s::integer)",
+                page_size=len(results)
+            )
+            updated = cursor.rowcount
+            db_manager.commit(conn)
+            return updated
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if conn:
+                db_manager.return_connection(conn)
+    
     @staticmethod
     def bulk_upsert(records: list):
         """Bulk upsert project submission records"""
@@ -567,7 +876,7 @@ class ProjectSubmission:
                     ))
                     inserted += cursor.rowcount
             
-            conn.commit()
+            db_manager.commit(conn)
             return {"inserted": inserted, "updated": updated}
         except Exception as e:
             if conn:
@@ -681,6 +990,79 @@ class KiroSubmission:
         query = f"UPDATE kiro_submission SET {', '.join(set_clauses)} WHERE week_number = %s AND email = %s"
         return db_manager.execute_query(query, tuple(params), fetch=False)
     
+    @staticmethod
+    def bulk_update_validation(results: list):
+        """Write blog validation results for many submissions in one statement
+        
+        Args:
+            results: dicts with week_number, email, valid, reason, likes and
+                comments keys (as returned by app_web.validate_single_kiro_submission)
+        
+        Returns:
+            Number of rows updated
+        """
+        return KiroSubmission._bulk_update(
+            """
+                UPDATE kiro_submission AS k SET
+                    valid = v.valid,
+                    validation_reason = v.reason,
+                    likes = v.likes,
+                    comments = v.comments
+                FROM (VALUES %s) AS v(week_number, email, valid, reason, likes, comments)
+                WHERE k.week_number = v.week_number AND k.email = v.email
+            """,
+            [
+                (r['week_number'], r['email'], r['valid'], r['reason'], r['likes'], r['comments'])
+                for r in results
+            ],
+            "(%s::integer, %s, %s::boolean, %s, %s::integer, %s::integer)"
+        )
+    
+    @staticmethod
+    def bulk_update_github_validation(results: list):
+        """Write GitHub validation results for many submissions in one statement
+        
+        Args:
+            results: dicts with week_number, email, valid and reason keys
+                (as returned by app_web.validate_single_kiro_github)
+        
+        Returns:
+            Number of rows updated
+        """
+        return KiroSubmission._bulk_update(
+            """
+                UPDATE kiro_submission AS k SET
+                    github_valid = v.valid,
+                    github_validation_reason = v.reason
+                FROM (VALUES %s) AS v(week_number, email, valid, reason)
+                WHERE k.week_number = v.week_number AND k.email = v.email
+            """,
+            [(r['week_number'], r['email'], r['valid'], r['reason']) for r in results],
+            "(%s::integer, %s, %s::boolean, %s)"
+        )
+    
+    @staticmethod
+    def _bulk_update(query: str, rows: list, template: str):
+        """Run an UPDATE ... FROM (VALUES %s) statement for rows in one round-trip"""
+        if not rows:
+            return 0
+        
+        conn = None
+        try:
+            conn = db_manager.get_connection()
+            cursor = conn.cursor()
+            execute_values(cursor, query, rows, template=template, page_size=len(rows))
+            updated = cursor.rowcount
+            db_manager.commit(conn)
+            return updated
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if conn:
+                db_manager.return_connection(conn)
+    
     @staticmethod
     def delete(week_number: int, email: str):
         """Delete kiro submission"""
@@ -727,6 +1109,17 @@ class KiroSubmission:
         result = db_manager.execute_query(query)
         return [row['week_number'] for row in result] if result else []
     
+    @staticmethod
+    def get_week_counts():
+        """Get the number of submissions per week, ordered by week number"""
+        query = """
+            SELECT week_number, COUNT(*) AS count
+            FROM kiro_submission
+            GROUP BY week_number
+            ORDER BY week_number ASC
+        """
+        return db_manager.execute_query(query)
+    
     @staticmethod
     def get_top_participants(week_number: int, limit: int = 10):
         """Get top participants for a week based on valid GitHub and highest engagement (likes + comments)
@@ -912,7 +1305,7 @@ class KiroSubmission:
                         print(error_msg)
                         raise Exception(error_msg)  # Re-raise to be caught by caller
             
-            conn.commit()
+            db_manager.commit(conn)
             return {'inserted': inserted, 'updated': updated}
         except Exception as e:
             conn.rollback()
@@ -921,6 +1314,72 @@ class KiroSubmission:
             db_manager.return_connection(conn)
 
 
+class GitHubRepoETag:
+    """Model for the GitHub Repo ETag table (per-repository conditional request cache)"""
+    
+    @staticmethod
+    def get_many(repo_keys: list):
+        """Get stored ETags for (owner, repo) keys (lowercased)
+        
+        Returns:
+            dict mapping (owner, repo) -> (etag, (is_valid, reason))
+        """
+        if not repo_keys:
+            return {}
+        query = """
+            SELECT owner, repo, etag, is_valid, reason FROM github_repo_etag
+            WHERE (owner, repo) IN %s
+        """
+        rows = db_manager.execute_query(query, (tuple(repo_keys),))
+        return {
+            (row['owner'], row['repo']): (row['etag'], (row['is_valid'], row['reason']))
+            for row in rows
+        }
+    
+    @staticmethod
+    def bulk_upsert(entries: dict):
+        """Store ETags for many repositories in one statement
+        
+        Args:
+            entries: dict mapping (owner, repo) -> (etag, (is_valid, reason))
+        
+        Returns:
+            Number of rows written
+        """
+        if not entries:
+            return 0
+        
+        conn = None
+        try:
+            conn = db_manager.get_connection()
+            cursor = conn.cursor()
+            execute_values(
+                cursor,
+                """
+                    INSERT INTO github_repo_etag (owner, repo, etag, is_valid, reason)
+                    VALUES %s
+                    ON CONFLICT (owner, repo) DO UPDATE SET
+                        etag = EXCLUDED.etag,
+                        is_valid = EXCLUDED.is_valid,
+                        reason = EXCLUDED.reason,
+                        updated_at = CURRENT_TIMESTAMP
+                """,
+                [(owner, repo, etag, is_valid, reason)
+                 for (owner, repo), (etag, (is_valid, reason)) in entries.items()],
+                page_size=len(entries)
+            )
+            written = cursor.rowcount
+            conn.commit()
+            return written
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if conn:
+                db_manager.return_connection(conn)
+
+
 class MasterLogs:
     """Model for Master Logs table (read-only queries)"""
     
@@ -956,6 +1415,38 @@ class MasterLogs:
         """
         return db_manager.execute_query(query, (operation_type, limit))
     
+    @staticmethod
+    def get_filtered(table_name: str = None, operation_type: str = None, limit: int = 100):
+        """Get the newest logs, optionally filtered by table and/or operation type"""
+        return db_manager.execute_query(*MasterLogs._filtered_query(table_name, operation_type, limit))
+    
+    @staticmethod
+    def iter_filtered(table_name: str = None, operation_type: str = None, limit: int = 100):
+        """Like get_filtered, but yields the rows from a server-side cursor"""
+        return db_manager.iter_query(*MasterLogs._filtered_query(table_name, operation_type, limit))
+    
+    @staticmethod
+    def _filtered_query(table_name: str = None, operation_type: str = None, limit: int = 100):
+        """Build the query and params shared by get_filtered and iter_filtered"""
+        conditions = []
+        params = []
+        if table_name:
+            conditions.append("table_name = %s")
+            params.append(table_name)
+        if operation_type:
+            conditions.append("operation_type = %s")
+            params.append(operation_type)
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit)
+        
+        query = f"""
+            SELECT * FROM master_logs 
+            {where_clause}
+            ORDER BY timestamp DESC 
+            LIMIT %s
+        """
+        return query, tuple(params)
+    
     @staticmethod
     def get_by_date_range(start_date: datetime, end_date: datetime, limit: int = 100):
         """Get logs within a date range"""
@@ -209,7 +209,7 @@ def bulk_upsert_advanced_user_pii(records: list, mode: str = 'upsert', match_fie
                     ))
                     inserted += cursor.rowcount
         
-        conn.commit()
+        db_manager.commit(conn)
         return {"inserted": inserted, "updated": updated}
     except Exception as e:
         if conn:
@@ -309,7 +309,7 @@ def bulk_upsert_advanced_form_response(records: list, mode: str = 'upsert', matc
                     ))
                     inserted += cursor.rowcount
         
-        conn.commit()
+        db_manager.commit(conn)
         return {"inserted": inserted, "updated": updated}
     except Exception as e:
         if conn:
@@ -421,7 +421,7 @@ def bulk_upsert_advanced_project_submission(records: list, mode: str = 'upsert',
                     ))
                     inserted += cursor.rowcount
         
-        conn.commit()
+        db_manager.commit(conn)
         return {"inserted": inserted, "updated": updated}
     except Exception as e:
         if conn:
@@ -523,7 +523,7 @@ def bulk_upsert_advanced_aws_team_building(records: list, mode: str = 'upsert',
                     ))
                     inserted += cursor.rowcount
         
-        conn.commit()
+        db_manager.commit(conn)
         return {"inserted": inserted, "updated": updated}
     except Exception as e:
         if conn:
@@ -643,7 +643,7 @@ def bulk_upsert_advanced_verification(records: list, mode: str = 'upsert', match
                     ))
                     inserted += cursor.rowcount
         
-        conn.commit()
+        db_manager.commit(conn)
         return {"inserted": inserted, "updated": updated}
     except Exception as e:
         if conn:
@@ -771,7 +771,7 @@ def bulk_upsert_advanced_hands_on_lab_completion(records: list, mode: str = 'ups
                     ))
                     inserted += cursor.rowcount
         
-        conn.commit()
+        db_manager.commit(conn)
         return {"inserted": inserted, "updated": updated}
     except Exception as e:
         if conn:
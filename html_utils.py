@@ -0,0 +1,36 @@
+"""
+HTML utilities for AWS AI for Bharat Tracking System
+lxml-based extraction of blog metrics shared by the HTTP and Selenium scrapers
+"""
+import lxml.html
+from lxml import etree
+
+
+# Spans inside an article action button ($label is its aria-label); the
+# _card-action-text span holds the count, any other span is a fallback
+ACTION_TEXT_XPATH = etree.XPath("//button[contains(@aria-label, $label)]//span[contains(@class, '_card-action-text')]")
+ACTION_SPAN_XPATH = etree.XPath("//button[contains(@aria-label, $label)]//span")
+
+# aria-label of the article action buttons
+LIKE_BUTTON_LABEL = 'Like this article'
+COMMENT_BUTTON_LABEL = 'Comment on this article'
+
+
+def parse_html(html):
+    """Parse an HTML document into an lxml tree"""
+    return lxml.html.fromstring(html)
+
+
+def extract_action_count(tree, aria_label):
+    """
+    Extract the count shown in an article action button (Like/Comment)
+
+    Prefers the button's _card-action-text span and falls back to any span
+    whose text is a number. Returns None if no count is found.
+    """
+    for span_xpath in (ACTION_TEXT_XPATH, ACTION_SPAN_XPATH):
+        for span in span_xpath(tree, label=aria_label):
+            text = span.text_content().strip()
+            if text.isdigit():
+                return int(text)
+    return None
@@ -0,0 +1,232 @@
+"""
+HTTP utilities for AWS AI for Bharat Tracking System
+Shared keep-alive requests sessions for outbound scraping and API calls
+"""
+import itertools
+import os
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Browser-like headers sent with every scraping request
+SCRAPER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+}
+
+# (connect, read) timeouts in seconds for scraping requests
+SCRAPER_TIMEOUT = (5, 15)
+
+# Scraped pages are read up to this many bytes, within this many seconds in total
+SCRAPER_MAX_BYTES = 512 * 1024
+SCRAPER_MAX_SECONDS = 20
+
+# Threads that fetch blog pages concurrently; the scraper session keeps this
+# many connections per host so no worker's socket is discarded after use
+SCRAPER_MAX_WORKERS = int(os.getenv('SCRAPER_MAX_WORKERS', '32'))
+
+# Concurrent GitHub API checks when a token is configured; the GitHub session
+# keeps this many connections open
+GITHUB_MAX_WORKERS = 20
+
+# GitHub REST API requests allowed per hour, per token and without a token
+GITHUB_HOURLY_LIMIT = 5000
+GITHUB_UNAUTHENTICATED_HOURLY_LIMIT = 60
+
+# Fastest pace when a rate limit window has quota to spare, below GitHub's
+# secondary limit of 900 REST requests per minute
+GITHUB_MAX_REQUESTS_PER_SECOND = 10
+
+
+def create_session(headers=None, pool_connections=32, pool_maxsize=64, retries=2):
+    """
+    Create a requests session that keeps connections alive across calls
+
+    Args:
+        headers: Default headers sent with every request
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum connections kept open per host; should cover the
+            number of threads sharing the session
+        retries: Retries for connection and read errors (HTTP errors are returned as-is)
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def read_limited(response, max_bytes=SCRAPER_MAX_BYTES, max_seconds=SCRAPER_MAX_SECONDS):
+    """
+    Read at most max_bytes of a streamed response body
+
+    The read timeout only bounds each socket read, so a host that trickles
+    data is also cut off once max_seconds have passed in total.
+
+    Raises:
+        requests.exceptions.Timeout: If the body takes longer than max_seconds
+    """
+    deadline = time.monotonic() + max_seconds
+    body = bytearray()
+    for chunk in response.iter_content(64 * 1024):
+        body += chunk
+        if len(body) >= max_bytes:
+            break
+        if time.monotonic() > deadline:
+            raise requests.exceptions.Timeout(f"Response body not read within {max_seconds}s")
+    return bytes(body[:max_bytes])
+
+
+class GitHubTokenPool:
+    """Round-robin over GitHub API tokens, skipping tokens that hit their rate limit"""
+
+    def __init__(self, tokens):
+        """
+        Initialize the pool
+
+        Args:
+            tokens: GitHub API tokens; blank entries are ignored
+        """
+        self._tokens = [token.strip() for token in tokens if token.strip()]
+        self._cycle = itertools.cycle(self._tokens)
+        self._limited_until = {}  # token -> epoch seconds when its rate limit resets
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def next_available_token(self):
+        """Get the next token that is not rate limited, or None if there is none"""
+        with self._lock:
+            now = time.time()
+            for _ in range(len(self._tokens)):
+                token = next(self._cycle)
+                if self._limited_until.get(token, 0) <= now:
+                    return token
+        return None
+
+    def next_token(self):
+        """
+        Get the next token that is not rate limited; if all of them are, the one
+        whose limit resets first. Returns None if no tokens are configured.
+        """
+        token = self.next_available_token()
+        if token is None and self._tokens:
+            with self._lock:
+                token = min(self._tokens, key=lambda t: self._limited_until.get(t, 0))
+        return token
+
+    def mark_limited(self, token, reset_at):
+        """Skip token until reset_at (epoch seconds, as in X-RateLimit-Reset)"""
+        with self._lock:
+            self._limited_until[token] = reset_at
+
+
+class RateLimiter:
+    """Thread-safe token bucket; acquire() blocks until a request may be sent"""
+
+    def __init__(self, rate, capacity, max_rate=None):
+        """
+        Initialize the limiter with a full bucket
+
+        Args:
+            rate: Requests allowed per second on average
+            capacity: Largest burst of requests allowed at once
+            max_rate: Fastest pace sync() may set (default: no limit)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.max_rate = max_rate
+        self._rate = rate  # Pace set by sync(), in effect until _rate_until
+        self._rate_until = 0.0
+        self._tokens = float(capacity)
+        self._last_refill = time.time()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one request from the bucket, sleeping until one is available"""
+        while True:
+            with self._lock:
+                now = time.time()
+                if now >= self._rate_until:
+                    self._rate = self.rate
+                if now > self._last_refill:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self._rate)
+                    self._last_refill = now
+                # Refill arithmetic can land a hair below 1 after waiting exactly
+                # the computed time; don't sleep again for float rounding
+                if self._tokens >= 1 - 1e-6:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate + max(0, self._last_refill - now)
+                if now < self._rate_until:
+                    # Re-check once the window resets and the default pace applies
+                    wait = min(wait, self._rate_until - now)
+            time.sleep(wait)
+
+    def sync(self, remaining, reset_at, reserve=0):
+        """
+        Follow the server's count of requests left in the current window
+
+        The requests left beyond reserve are spread evenly until reset_at
+        (epoch seconds), so the pace speeds up while the window has quota to
+        spare and slows to a trickle as it runs out.
+        """
+        with self._lock:
+            now = time.time()
+            spare = max(0, remaining - reserve)
+            rate = spare / max(reset_at - now, 1)
+            if self.max_rate:
+                rate = min(rate, self.max_rate)
+            self._rate = max(rate, 1e-6)
+            self._rate_until = reset_at
+            # Never refill here; a burst is only ever earned by waiting
+            self._tokens = min(self._tokens, float(spare))
+            self._last_refill = max(self._last_refill, now)
+
+    def pause_until(self, resume_at):
+        """Empty the bucket and only start refilling it at resume_at (epoch seconds)"""
+        with self._lock:
+            self._tokens = 0
+            self._last_refill = max(self._last_refill, resume_at)
+
+
+# Session shared by the blog metrics scrapers (community.aws, builder.aws.com API)
+scraper_session = create_session(SCRAPER_HEADERS, pool_maxsize=SCRAPER_MAX_WORKERS)
+
+# Session for api.github.com; verify_github_repo does its own retries and backoff.
+# It is shared by every request, so it never stores cookies.
+github_session = create_session(
+    {'Accept': 'application/vnd.github.v3+json', 'User-Agent': 'AWS-AI-for-Bharat'},
+    pool_connections=4,
+    pool_maxsize=GITHUB_MAX_WORKERS,
+    retries=0
+)
+github_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+# Tokens for api.github.com (GITHUB_TOKENS, comma-separated, or a single GITHUB_TOKEN);
+# each one has its own hourly rate limit, so requests rotate over all of them
+github_tokens = GitHubTokenPool((os.getenv('GITHUB_TOKENS') or os.getenv('GITHUB_TOKEN') or '').split(','))
+
+# Paces api.github.com requests to the hourly quota of the configured tokens;
+# bursts are limited to one request per worker
+_github_hourly_limit = GITHUB_HOURLY_LIMIT * len(github_tokens) or GITHUB_UNAUTHENTICATED_HOURLY_LIMIT
+github_rate_limiter = RateLimiter(
+    rate=_github_hourly_limit / 3600,
+    capacity=GITHUB_MAX_WORKERS,
+    max_rate=GITHUB_MAX_REQUESTS_PER_SECOND
+)
@@ -0,0 +1,68 @@
+"""
+JSON utilities for AWS AI for Bharat Tracking System
+orjson-backed serialization for Flask responses
+"""
+import time
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson
+
+    Keys are sorted like Flask's default provider. Types orjson does not handle
+    natively (Decimal, objects with __html__, ...) fall back to
+    DefaultJSONProvider.default. Datetimes are emitted as ISO 8601 strings
+    (Flask's default provider emits RFC 822 dates).
+
+    Calls with json.dumps options, such as Jinja's tojson(indent=2), are
+    passed to DefaultJSONProvider so the options are honored.
+    """
+
+    option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.option),
+            mimetype=self.mimetype
+        )
+
+
+def ndjson_line(obj) -> bytes:
+    """Encode obj as one newline-terminated JSON line for streamed responses"""
+    return orjson.dumps(obj) + b'\n'
+
+
+def coalesce_events(events, max_events: int = 20, max_delay: float = 0.1):
+    """Batch event dicts into NDJSON lines, each holding a JSON array of events
+
+    A line is emitted once max_events have accumulated or max_delay seconds
+    have passed since the previous line, and for whatever remains at the end.
+    The first event is always sent on its own so the client sees it at once.
+    """
+    batch = []
+    last_flush = float('-inf')
+    try:
+        for event in events:
+            batch.append(event)
+            if len(batch) >= max_events or time.monotonic() - last_flush >= max_delay:
+                yield ndjson_line(batch)
+                batch = []
+                last_flush = time.monotonic()
+        if batch:
+            yield ndjson_line(batch)
+    finally:
+        # Run the source generator's cleanup now if the client went away
+        close = getattr(events, 'close', None)
+        if close:
+            close()
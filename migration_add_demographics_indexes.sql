@@ -0,0 +1,22 @@
+-- Migration script to add partial indexes for the dashboard demographics queries
+-- Each index only covers rows the query keeps (non-null, non-empty values),
+-- so the GROUP BY can be answered with an index-only scan.
+-- Run with psql (CONCURRENTLY and VACUUM cannot run inside a transaction block).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_pii_gender
+    ON user_pii(gender) WHERE gender IS NOT NULL AND gender <> '';
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_pii_occupation
+    ON user_pii(occupation) WHERE occupation IS NOT NULL AND occupation <> '';
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_pii_state
+    ON user_pii(state) WHERE state IS NOT NULL AND state <> '';
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_pii_city
+    ON user_pii(city) WHERE city IS NOT NULL AND city <> '';
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_pii_designation
+    ON user_pii(designation) WHERE designation IS NOT NULL AND designation <> '';
+
+-- Refresh the visibility map and planner statistics so index-only scans are chosen
+VACUUM ANALYZE user_pii;
+
+-- To confirm, EXPLAIN ANALYZE a demographics query and look for "Index Only Scan", e.g.:
+-- EXPLAIN ANALYZE SELECT occupation, COUNT(*) FROM user_pii
+--     WHERE occupation IS NOT NULL AND occupation != '' GROUP BY occupation ORDER BY COUNT(*) DESC LIMIT 20;
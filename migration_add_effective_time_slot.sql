@@ -0,0 +1,38 @@
+-- Migration script to precompute the display time slot on form_response
+-- TO_CHAR is not immutable, so the value is maintained by a trigger instead of
+-- a generated column. Dashboard queries group on it directly.
+
+-- Add effective_time_slot column if it doesn't exist
+ALTER TABLE form_response ADD COLUMN IF NOT EXISTS effective_time_slot VARCHAR(255);
+
+-- Resolve time_slot_range / time_slot into a single display value on write
+CREATE OR REPLACE FUNCTION set_form_response_effective_time_slot()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.effective_time_slot = COALESCE(
+        NULLIF(NEW.time_slot_range, ''),
+        CASE
+            WHEN NEW.time_slot IS NOT NULL
+            THEN TO_CHAR(NEW.time_slot::TIMESTAMP, 'YYYY-MM-DD HH24:MI')
+            ELSE 'No Time Slot'
+        END
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS set_form_response_effective_time_slot ON form_response;
+CREATE TRIGGER set_form_response_effective_time_slot BEFORE INSERT OR UPDATE ON form_response
+    FOR EACH ROW EXECUTE FUNCTION set_form_response_effective_time_slot();
+
+-- Backfill existing rows without touching updated_at or flooding master_logs
+ALTER TABLE form_response DISABLE TRIGGER update_form_response_updated_at;
+ALTER TABLE form_response DISABLE TRIGGER log_form_response_activity;
+UPDATE form_response SET effective_time_slot = effective_time_slot;
+ALTER TABLE form_response ENABLE TRIGGER update_form_response_updated_at;
+ALTER TABLE form_response ENABLE TRIGGER log_form_response_activity;
+
+-- Indexes for the workshop occupation breakdown
+CREATE INDEX IF NOT EXISTS idx_form_response_workshop_form_name_email
+    ON form_response(form_name, email) WHERE form_name LIKE 'Workshop %';
+CREATE INDEX IF NOT EXISTS idx_user_pii_email_occupation ON user_pii(email) INCLUDE (occupation);
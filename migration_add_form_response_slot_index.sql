@@ -0,0 +1,13 @@
+-- Migration script to index the workshops page time slot grouping
+-- The page groups on effective_time_slot (see migration_add_effective_time_slot.sql),
+-- so an index on (form_name, effective_time_slot) serves it without a second
+-- trigger-maintained column.
+
+CREATE INDEX IF NOT EXISTS idx_form_response_form_name_effective_time_slot
+    ON form_response(form_name, effective_time_slot);
+
+-- Drop the earlier time_slot_key column and its trigger where they were applied
+DROP INDEX IF EXISTS idx_form_response_form_name_time_slot_key;
+DROP TRIGGER IF EXISTS set_form_response_time_slot_key ON form_response;
+DROP FUNCTION IF EXISTS set_form_response_time_slot_key();
+ALTER TABLE form_response DROP COLUMN IF EXISTS time_slot_key;
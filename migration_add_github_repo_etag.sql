@@ -0,0 +1,14 @@
+-- Migration script to persist GitHub ETags for Kiro GitHub validation
+-- github_repo_etag keeps the last contents listing ETag and verdict per
+-- repository, so re-validation sends conditional requests (304s don't count
+-- against the GitHub rate limit) even after the web process restarts
+
+CREATE TABLE IF NOT EXISTS github_repo_etag (
+    owner VARCHAR(255) NOT NULL,
+    repo VARCHAR(255) NOT NULL,
+    etag VARCHAR(255) NOT NULL,
+    is_valid BOOLEAN NOT NULL,
+    reason TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (owner, repo)
+);
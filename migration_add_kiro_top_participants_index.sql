@@ -0,0 +1,10 @@
+-- Migration script to speed up the Kiro top participants download
+-- The download ranks a week's valid-GitHub submissions by likes + comments;
+-- this index returns them already in rank order so the query stops after LIMIT rows
+
+CREATE INDEX IF NOT EXISTS idx_kiro_submission_top_participants ON kiro_submission (
+    week_number,
+    (COALESCE(likes, 0) + COALESCE(comments, 0)) DESC,
+    likes DESC,
+    comments DESC
+) WHERE github_valid = TRUE;
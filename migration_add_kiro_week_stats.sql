@@ -0,0 +1,79 @@
+-- Migration script to precompute the dashboard Kiro challenge statistics
+-- kiro_week_stats keeps one row of counts per week; a trigger on kiro_submission
+-- keeps them current so the dashboard no longer aggregates the whole table
+
+CREATE TABLE IF NOT EXISTS kiro_week_stats (
+    week_number INTEGER PRIMARY KEY,
+    submission_count BIGINT NOT NULL DEFAULT 0,
+    blog_count BIGINT NOT NULL DEFAULT 0,
+    valid_blog_count BIGINT NOT NULL DEFAULT 0,
+    github_count BIGINT NOT NULL DEFAULT 0,
+    valid_github_count BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION bump_kiro_week_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Re-validations that leave the counted flags unchanged need no bookkeeping
+    IF TG_OP = 'UPDATE' AND
+        (NEW.week_number, COALESCE(NEW.blog_link, '') <> '', NEW.valid IS TRUE,
+         COALESCE(NEW.github_link, '') <> '', NEW.github_valid IS TRUE) =
+        (OLD.week_number, COALESCE(OLD.blog_link, '') <> '', OLD.valid IS TRUE,
+         COALESCE(OLD.github_link, '') <> '', OLD.github_valid IS TRUE) THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE kiro_week_stats SET
+            submission_count = submission_count - 1,
+            blog_count = blog_count - (COALESCE(OLD.blog_link, '') <> '')::INT,
+            valid_blog_count = valid_blog_count - (COALESCE(OLD.blog_link, '') <> '' AND OLD.valid IS TRUE)::INT,
+            github_count = github_count - (COALESCE(OLD.github_link, '') <> '')::INT,
+            valid_github_count = valid_github_count - (COALESCE(OLD.github_link, '') <> '' AND OLD.github_valid IS TRUE)::INT
+        WHERE week_number = OLD.week_number;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO kiro_week_stats (week_number, submission_count, blog_count, valid_blog_count, github_count, valid_github_count)
+        VALUES (
+            NEW.week_number,
+            1,
+            (COALESCE(NEW.blog_link, '') <> '')::INT,
+            (COALESCE(NEW.blog_link, '') <> '' AND NEW.valid IS TRUE)::INT,
+            (COALESCE(NEW.github_link, '') <> '')::INT,
+            (COALESCE(NEW.github_link, '') <> '' AND NEW.github_valid IS TRUE)::INT
+        )
+        ON CONFLICT (week_number) DO UPDATE SET
+            submission_count = kiro_week_stats.submission_count + EXCLUDED.submission_count,
+            blog_count = kiro_week_stats.blog_count + EXCLUDED.blog_count,
+            valid_blog_count = kiro_week_stats.valid_blog_count + EXCLUDED.valid_blog_count,
+            github_count = kiro_week_stats.github_count + EXCLUDED.github_count,
+            valid_github_count = kiro_week_stats.valid_github_count + EXCLUDED.valid_github_count;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bump_kiro_week_stats ON kiro_submission;
+CREATE TRIGGER bump_kiro_week_stats
+    AFTER INSERT OR DELETE OR UPDATE OF week_number, blog_link, valid, github_link, github_valid ON kiro_submission
+    FOR EACH ROW EXECUTE FUNCTION bump_kiro_week_stats();
+
+-- Backfill from existing submissions
+INSERT INTO kiro_week_stats (week_number, submission_count, blog_count, valid_blog_count, github_count, valid_github_count)
+SELECT
+    week_number,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE COALESCE(blog_link, '') <> ''),
+    COUNT(*) FILTER (WHERE COALESCE(blog_link, '') <> '' AND valid IS TRUE),
+    COUNT(*) FILTER (WHERE COALESCE(github_link, '') <> ''),
+    COUNT(*) FILTER (WHERE COALESCE(github_link, '') <> '' AND github_valid IS TRUE)
+FROM kiro_submission
+GROUP BY week_number
+ON CONFLICT (week_number) DO UPDATE SET
+    submission_count = EXCLUDED.submission_count,
+    blog_count = EXCLUDED.blog_count,
+    valid_blog_count = EXCLUDED.valid_blog_count,
+    github_count = EXCLUDED.github_count,
+    valid_github_count = EXCLUDED.valid_github_count;
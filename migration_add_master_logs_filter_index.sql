@@ -0,0 +1,5 @@
+-- Migration script to speed up the logs page when filtering by table and operation
+-- Both filters can now be combined; this index returns the matching rows newest first
+-- Run with psql (CONCURRENTLY cannot run inside a transaction block).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_master_logs_table_op_ts ON master_logs(table_name, operation_type, timestamp DESC);
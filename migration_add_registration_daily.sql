@@ -0,0 +1,42 @@
+-- Migration script to precompute the dashboard registration trend
+-- registration_daily keeps one row per registration date; a trigger on user_pii
+-- keeps the counts current so the dashboard no longer groups the whole table
+
+CREATE TABLE IF NOT EXISTS registration_daily (
+    registration_date DATE PRIMARY KEY,
+    registration_count BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION bump_registration_daily()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.registration_date_time IS NOT NULL THEN
+        UPDATE registration_daily
+        SET registration_count = registration_count - 1
+        WHERE registration_date = OLD.registration_date_time::DATE;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.registration_date_time IS NOT NULL THEN
+        INSERT INTO registration_daily (registration_date, registration_count)
+        VALUES (NEW.registration_date_time::DATE, 1)
+        ON CONFLICT (registration_date)
+        DO UPDATE SET registration_count = registration_daily.registration_count + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS bump_registration_daily ON user_pii;
+CREATE TRIGGER bump_registration_daily
+    AFTER INSERT OR DELETE OR UPDATE OF registration_date_time ON user_pii
+    FOR EACH ROW EXECUTE FUNCTION bump_registration_daily();
+
+-- Backfill from existing registrations
+INSERT INTO registration_daily (registration_date, registration_count)
+SELECT registration_date_time::DATE, COUNT(*)
+FROM user_pii
+WHERE registration_date_time IS NOT NULL
+GROUP BY registration_date_time::DATE
+ON CONFLICT (registration_date)
+DO UPDATE SET registration_count = EXCLUDED.registration_count;
@@ -0,0 +1,8 @@
+-- Migration script to add the users list pagination index
+-- The users page is keyset-paginated on (registration_date_time, email), newest first
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_pii_registration_listing ON user_pii(registration_date_time DESC, email DESC);
+
+-- Range scans on registration_date_time use this index too, so the separate
+-- single-column index is no longer needed where it was created
+DROP INDEX CONCURRENTLY IF EXISTS idx_user_pii_registration_date_time;
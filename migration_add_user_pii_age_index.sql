@@ -0,0 +1,5 @@
+-- Migration script to speed up the dashboard age distribution query
+-- The age buckets depend on CURRENT_DATE, so they cannot be a generated column;
+-- instead the query compares date_of_birth against cutoff dates served by this index
+
+CREATE INDEX IF NOT EXISTS idx_user_pii_date_of_birth ON user_pii(date_of_birth);
@@ -0,0 +1,5 @@
+-- Migration script to add a trigram index for the user search autocomplete
+-- Serves the email/name ILIKE '%term%' lookups behind /api/users/search
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_user_pii_search_trgm ON user_pii USING gin (email gin_trgm_ops, name gin_trgm_ops);
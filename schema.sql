@@ -24,6 +24,23 @@ CREATE TABLE IF NOT EXISTS user_pii (
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Index on date_of_birth for the dashboard age distribution
+CREATE INDEX IF NOT EXISTS idx_user_pii_date_of_birth ON user_pii(date_of_birth);
+
+-- Trigram index for the user search autocomplete (email/name ILIKE)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_user_pii_search_trgm ON user_pii USING gin (email gin_trgm_ops, name gin_trgm_ops);
+
+-- Partial indexes for the dashboard demographics GROUP BY queries
+CREATE INDEX IF NOT EXISTS idx_user_pii_gender ON user_pii(gender) WHERE gender IS NOT NULL AND gender <> '';
+CREATE INDEX IF NOT EXISTS idx_user_pii_occupation ON user_pii(occupation) WHERE occupation IS NOT NULL AND occupation <> '';
+CREATE INDEX IF NOT EXISTS idx_user_pii_state ON user_pii(state) WHERE state IS NOT NULL AND state <> '';
+CREATE INDEX IF NOT EXISTS idx_user_pii_city ON user_pii(city) WHERE city IS NOT NULL AND city <> '';
+CREATE INDEX IF NOT EXISTS idx_user_pii_designation ON user_pii(designation) WHERE designation IS NOT NULL AND designation <> '';
+
+-- Index for the users list keyset pagination (newest registration first)
+CREATE INDEX IF NOT EXISTS idx_user_pii_registration_listing ON user_pii(registration_date_time DESC, email DESC);
+
 -- ============================================
 -- Table 2: Form Response
 -- ============================================
@@ -33,12 +50,19 @@ CREATE TABLE IF NOT EXISTS form_response (
     name VARCHAR(255) NOT NULL,
     time_slot TIMESTAMP,
     time_slot_range VARCHAR(255),
+    effective_time_slot VARCHAR(255), -- Maintained by trigger: time_slot_range, else formatted time_slot
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     PRIMARY KEY (email, form_name),
     FOREIGN KEY (email) REFERENCES user_pii(email) ON DELETE CASCADE ON UPDATE CASCADE
 );
 
+-- Indexes for the workshop occupation breakdown
+CREATE INDEX IF NOT EXISTS idx_form_response_workshop_form_name_email
+    ON form_response(form_name, email) WHERE form_name LIKE 'Workshop %';
+CREATE INDEX IF NOT EXISTS idx_user_pii_email_occupation ON user_pii(email) INCLUDE (occupation);
+CREATE INDEX IF NOT EXISTS idx_form_response_form_name_effective_time_slot ON form_response(form_name, effective_time_slot);
+
 -- ============================================
 -- Table 3: AWS Team Building
 -- ============================================
@@ -112,6 +136,14 @@ CREATE TABLE IF NOT EXISTS kiro_submission (
 CREATE INDEX IF NOT EXISTS idx_kiro_submission_week_number ON kiro_submission(week_number);
 CREATE INDEX IF NOT EXISTS idx_kiro_submission_email ON kiro_submission(email);
 
+-- Partial index for the top participants download (valid GitHub, ranked by engagement)
+CREATE INDEX IF NOT EXISTS idx_kiro_submission_top_participants ON kiro_submission (
+    week_number,
+    (COALESCE(likes, 0) + COALESCE(comments, 0)) DESC,
+    likes DESC,
+    comments DESC
+) WHERE github_valid = TRUE;
+
 -- ============================================
 -- Table 7: Hands-on Lab Completion Proof
 -- ============================================
@@ -156,6 +188,44 @@ CREATE INDEX IF NOT EXISTS idx_master_logs_table_name ON master_logs(table_name)
 CREATE INDEX IF NOT EXISTS idx_master_logs_timestamp ON master_logs(timestamp);
 CREATE INDEX IF NOT EXISTS idx_master_logs_operation ON master_logs(operation_type);
 
+-- Composite index for the logs page filtered by table and operation, newest first
+CREATE INDEX IF NOT EXISTS idx_master_logs_table_op_ts ON master_logs(table_name, operation_type, timestamp DESC);
+
+-- ============================================
+-- Table 9: Registration Daily (Dashboard registration trend summary)
+-- ============================================
+CREATE TABLE IF NOT EXISTS registration_daily (
+    registration_date DATE PRIMARY KEY,
+    registration_count BIGINT NOT NULL DEFAULT 0
+);
+
+-- ============================================
+-- Table 10: Kiro Week Stats (Dashboard Kiro challenge summary)
+-- ============================================
+CREATE TABLE IF NOT EXISTS kiro_week_stats (
+    week_number INTEGER PRIMARY KEY,
+    submission_count BIGINT NOT NULL DEFAULT 0,
+    blog_count BIGINT NOT NULL DEFAULT 0,
+    valid_blog_count BIGINT NOT NULL DEFAULT 0,
+    github_count BIGINT NOT NULL DEFAULT 0,
+    valid_github_count BIGINT NOT NULL DEFAULT 0
+);
+
+-- ============================================
+-- Table 11: GitHub Repo ETag (Kiro GitHub validation cache)
+-- ============================================
+-- Last contents listing ETag and verdict per repository (owner/repo lowercased),
+-- so weekly re-validation can send conditional requests after a restart
+CREATE TABLE IF NOT EXISTS github_repo_etag (
+    owner VARCHAR(255) NOT NULL,
+    repo VARCHAR(255) NOT NULL,
+    etag VARCHAR(255) NOT NULL,
+    is_valid BOOLEAN NOT NULL,
+    reason TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (owner, repo)
+);
+
 -- ============================================
 -- Function: Update updated_at timestamp
 -- ============================================
@@ -189,6 +259,105 @@ CREATE TRIGGER update_kiro_submission_updated_at BEFORE UPDATE ON kiro_submissio
 CREATE TRIGGER update_hands_on_lab_completion_updated_at BEFORE UPDATE ON hands_on_lab_completion
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+-- ============================================
+-- Function: Resolve form_response display time slot
+-- ============================================
+CREATE OR REPLACE FUNCTION set_form_response_effective_time_slot()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.effective_time_slot = COALESCE(
+        NULLIF(NEW.time_slot_range, ''),
+        CASE
+            WHEN NEW.time_slot IS NOT NULL
+            THEN TO_CHAR(NEW.time_slot::TIMESTAMP, 'YYYY-MM-DD HH24:MI')
+            ELSE 'No Time Slot'
+        END
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER set_form_response_effective_time_slot BEFORE INSERT OR UPDATE ON form_response
+    FOR EACH ROW EXECUTE FUNCTION set_form_response_effective_time_slot();
+
+-- ============================================
+-- Function: Maintain registration_daily counts
+-- ============================================
+CREATE OR REPLACE FUNCTION bump_registration_daily()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.registration_date_time IS NOT NULL THEN
+        UPDATE registration_daily
+        SET registration_count = registration_count - 1
+        WHERE registration_date = OLD.registration_date_time::DATE;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.registration_date_time IS NOT NULL THEN
+        INSERT INTO registration_daily (registration_date, registration_count)
+        VALUES (NEW.registration_date_time::DATE, 1)
+        ON CONFLICT (registration_date)
+        DO UPDATE SET registration_count = registration_daily.registration_count + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER bump_registration_daily
+    AFTER INSERT OR DELETE OR UPDATE OF registration_date_time ON user_pii
+    FOR EACH ROW EXECUTE FUNCTION bump_registration_daily();
+
+-- ============================================
+-- Function: Maintain kiro_week_stats counts
+-- ============================================
+CREATE OR REPLACE FUNCTION bump_kiro_week_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Re-validations that leave the counted flags unchanged need no bookkeeping
+    IF TG_OP = 'UPDATE' AND
+        (NEW.week_number, COALESCE(NEW.blog_link, '') <> '', NEW.valid IS TRUE,
+         COALESCE(NEW.github_link, '') <> '', NEW.github_valid IS TRUE) =
+        (OLD.week_number, COALESCE(OLD.blog_link, '') <> '', OLD.valid IS TRUE,
+         COALESCE(OLD.github_link, '') <> '', OLD.github_valid IS TRUE) THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE kiro_week_stats SET
+            submission_count = submission_count - 1,
+            blog_count = blog_count - (COALESCE(OLD.blog_link, '') <> '')::INT,
+            valid_blog_count = valid_blog_count - (COALESCE(OLD.blog_link, '') <> '' AND OLD.valid IS TRUE)::INT,
+            github_count = github_count - (COALESCE(OLD.github_link, '') <> '')::INT,
+            valid_github_count = valid_github_count - (COALESCE(OLD.github_link, '') <> '' AND OLD.github_valid IS TRUE)::INT
+        WHERE week_number = OLD.week_number;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO kiro_week_stats (week_number, submission_count, blog_count, valid_blog_count, github_count, valid_github_count)
+        VALUES (
+            NEW.week_number,
+            1,
+            (COALESCE(NEW.blog_link, '') <> '')::INT,
+            (COALESCE(NEW.blog_link, '') <> '' AND NEW.valid IS TRUE)::INT,
+            (COALESCE(NEW.github_link, '') <> '')::INT,
+            (COALESCE(NEW.github_link, '') <> '' AND NEW.github_valid IS TRUE)::INT
+        )
+        ON CONFLICT (week_number) DO UPDATE SET
+            submission_count = kiro_week_stats.submission_count + EXCLUDED.submission_count,
+            blog_count = kiro_week_stats.blog_count + EXCLUDED.blog_count,
+            valid_blog_count = kiro_week_stats.valid_blog_count + EXCLUDED.valid_blog_count,
+            github_count = kiro_week_stats.github_count + EXCLUDED.github_count,
+            valid_github_count = kiro_week_stats.valid_github_count + EXCLUDED.valid_github_count;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER bump_kiro_week_stats
+    AFTER INSERT OR DELETE OR UPDATE OF week_number, blog_link, valid, github_link, github_valid ON kiro_submission
+    FOR EACH ROW EXECUTE FUNCTION bump_kiro_week_stats();
+
 -- ============================================
 -- Function: Log activity to master_logs
 -- ============================================
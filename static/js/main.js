@@ -153,3 +153,58 @@ function copyToClipboard(text) {
     });
 }
 
+
+// Suggest users in an email input's <datalist> as the user types, searching
+// the server instead of rendering every user into the page. onSelect(user)
+// is called when a suggested email is picked.
+function setupUserAutocomplete(input, datalist, searchUrl, onSelect) {
+    const usersByEmail = {};
+    let debounceTimer = null;
+
+    input.addEventListener('input', function() {
+        const term = input.value.trim();
+
+        if (usersByEmail[term] && onSelect) {
+            onSelect(usersByEmail[term]);
+        }
+
+        clearTimeout(debounceTimer);
+        if (term.length < 2) {
+            return;
+        }
+        debounceTimer = setTimeout(function() {
+            fetch(`${searchUrl}?q=${encodeURIComponent(term)}`)
+                .then(response => response.json())
+                .then(data => {
+                    if (!data.success) {
+                        return;
+                    }
+                    datalist.innerHTML = '';
+                    data.users.forEach(user => {
+                        usersByEmail[user.email] = user;
+                        const option = document.createElement('option');
+                        option.value = user.email;
+                        option.label = `${user.email} - ${user.name}`;
+                        datalist.appendChild(option);
+                    });
+                })
+                .catch(error => console.error('Error searching users:', error));
+        }, 250);
+    });
+}
+
+// Validation streams send NDJSON lines, each holding a JSON array of progress
+// events; returns the events of the given complete lines in order
+function parseProgressLines(lines) {
+    const events = [];
+    for (const line of lines) {
+        if (!line.trim()) continue;
+        try {
+            const parsed = JSON.parse(line);
+            events.push(...(Array.isArray(parsed) ? parsed : [parsed]));
+        } catch (e) {
+            console.error('Error parsing validation progress JSON:', e);
+        }
+    }
+    return events;
+}
@@ -0,0 +1,36 @@
+"""
+Shared fixtures for the AWS AI for Bharat Tracking System tests
+"""
+import os
+import sys
+
+import pytest
+
+# The application modules live in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeClock:
+    """Stand-in for the time module whose clock only moves on sleep()"""
+
+    def __init__(self, start=1_000_000.0):
+        self.now = start
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
@@ -0,0 +1,96 @@
+"""
+Tests for cache_utils: TTLCache expiry/eviction and the ttl_cached decorator
+"""
+import threading
+import time
+
+import pytest
+
+import cache_utils
+from cache_utils import TTLCache, ttl_cached
+
+
+@pytest.fixture
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(cache_utils, 'time', clock)
+    return clock
+
+
+def test_get_returns_default_on_miss():
+    cache = TTLCache()
+    assert cache.get('missing') is None
+    assert cache.get('missing', 'fallback') == 'fallback'
+
+
+def test_entries_expire_after_ttl(fake_time):
+    cache = TTLCache(ttl=10)
+    cache.set('key', 'value')
+    fake_time.advance(9)
+    assert cache.get('key') == 'value'
+    fake_time.advance(1)
+    assert cache.get('key') is None
+
+
+def test_oldest_entry_is_evicted_at_maxsize():
+    cache = TTLCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('c', 3)
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+    assert cache.get('c') == 3
+
+
+def test_setting_existing_key_makes_it_newest():
+    cache = TTLCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.set('a', 10)
+    cache.set('c', 3)
+    assert cache.get('a') == 10
+    assert cache.get('b') is None
+
+
+def test_clear_drops_all_entries():
+    cache = TTLCache()
+    cache.set('a', 1)
+    cache.clear()
+    assert cache.get('a') is None
+
+
+def test_ttl_cached_computes_once():
+    cache = TTLCache()
+    calls = []
+
+    @ttl_cached(cache, 'answer')
+    def compute():
+        calls.append(1)
+        return 42
+
+    assert compute() == 42
+    assert compute() == 42
+    assert len(calls) == 1
+
+
+def test_ttl_cached_concurrent_misses_share_one_computation():
+    cache = TTLCache()
+    calls = []
+    release = threading.Event()
+
+    @ttl_cached(cache, 'slow')
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return 'done'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(compute())) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ['done'] * 5
+    assert len(calls) == 1
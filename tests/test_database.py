@@ -0,0 +1,197 @@
+"""
+Tests for the database models' query building and paging logic
+
+db_manager.execute_query is replaced by in-memory stand-ins, so no
+PostgreSQL is needed.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+import database
+from cache_utils import dashboard_cache
+from database import MasterLogs, ProjectSubmission, UserPII, _like_pattern, _parse_json_timestamp
+
+
+# ============================================
+# Helpers
+# ============================================
+
+def test_like_pattern_wraps_term_in_wildcards():
+    assert _like_pattern('alice') == '%alice%'
+
+
+def test_like_pattern_escapes_like_wildcards():
+    assert _like_pattern('50%_off\\') == '%50\\%\\_off\\\\%'
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2024-05-01T10:30:00', datetime(2024, 5, 1, 10, 30)),
+    ('2024-05-01T10:30:00.12', datetime(2024, 5, 1, 10, 30, 0, 120000)),
+    ('2024-05-01T10:30:00.123456', datetime(2024, 5, 1, 10, 30, 0, 123456)),
+    (None, None),
+])
+def test_parse_json_timestamp(value, expected):
+    assert _parse_json_timestamp(value) == expected
+
+
+# ============================================
+# Writes
+# ============================================
+
+class FakeConnection:
+    def __init__(self):
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_commit_clears_dashboard_cache():
+    dashboard_cache.set('dashboard_stats', {'total_users': 1})
+    conn = FakeConnection()
+    database.db_manager.commit(conn)
+    assert conn.commits == 1
+    assert dashboard_cache.get('dashboard_stats') is None
+
+
+# ============================================
+# Keyset pagination
+# ============================================
+
+def make_users(count):
+    start = datetime(2024, 1, 1)
+    # Pairs of users share a registration time so the email tiebreak matters
+    return [
+        {'email': f'user{i:03d}@example.com', 'registration_date_time': start + timedelta(minutes=i // 2)}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def users(monkeypatch):
+    rows = make_users(25)
+
+    def execute_query(query, params=None, fetch=True):
+        params = list(params or ())
+        limit = params.pop()
+        key = lambda row: (row['registration_date_time'], row['email'])
+        result = rows
+        if '< (%s, %s)' in query:
+            result = [row for row in result if key(row) < tuple(params[-2:])]
+        elif '> (%s, %s)' in query:
+            result = [row for row in result if key(row) > tuple(params[-2:])]
+        result = sorted(result, key=key, reverse='DESC' in query)
+        return [dict(row) for row in result[:limit]]
+
+    monkeypatch.setattr(database.db_manager, 'execute_query', execute_query)
+    return rows
+
+
+def page_key(row):
+    return row['registration_date_time'], row['email']
+
+
+def test_list_page_walks_forward_over_every_user(users):
+    seen = []
+    rows, has_more = UserPII.list_page(limit=10)
+    seen.extend(rows)
+    while has_more:
+        rows, has_more = UserPII.list_page(limit=10, after=page_key(rows[-1]))
+        seen.extend(rows)
+
+    expected = sorted(users, key=page_key, reverse=True)
+    assert [row['email'] for row in seen] == [row['email'] for row in expected]
+
+
+def test_list_page_has_more_is_exact(users):
+    rows, has_more = UserPII.list_page(limit=25)
+    assert len(rows) == 25
+    assert has_more is False
+
+    rows, has_more = UserPII.list_page(limit=24)
+    assert has_more is True
+
+
+def test_list_page_before_returns_previous_page_newest_first(users):
+    first, _ = UserPII.list_page(limit=10)
+    second, _ = UserPII.list_page(limit=10, after=page_key(first[-1]))
+
+    previous, has_more = UserPII.list_page(limit=10, before=page_key(second[0]))
+    assert [row['email'] for row in previous] == [row['email'] for row in first]
+    assert has_more is False
+
+
+@pytest.fixture
+def project_links(monkeypatch):
+    rows = [
+        {'workshop_name': f'Workshop {w}', 'email': f'user{i}@example.com', 'project_link': f'https://community.aws/{w}/{i}'}
+        for w in range(1, 4) for i in range(7)
+    ]
+    calls = []
+
+    def execute_query(query, params=None, fetch=True):
+        calls.append(params)
+        params = list(params)
+        limit = params.pop()
+        key = lambda row: (row['workshop_name'], row['email'])
+        result = sorted(rows, key=key)
+        if '> (%s, %s)' in query:
+            result = [row for row in result if key(row) > tuple(params)]
+        return [dict(row) for row in result[:limit]]
+
+    monkeypatch.setattr(database.db_manager, 'execute_query', execute_query)
+    return rows, calls
+
+
+def test_iter_with_links_yields_every_row_once_in_key_order(project_links):
+    rows, calls = project_links
+    seen = list(ProjectSubmission.iter_with_links(batch_size=5))
+    key = lambda row: (row['workshop_name'], row['email'])
+    assert [key(row) for row in seen] == sorted(key(row) for row in rows)
+    # 21 rows in batches of 5: five batches, the last one short
+    assert len(calls) == 5
+
+
+def test_iter_with_links_stops_after_exact_final_batch(project_links):
+    rows, calls = project_links
+    assert len(list(ProjectSubmission.iter_with_links(batch_size=7))) == 21
+    # A full final batch needs one more (empty) query to know it was the last
+    assert len(calls) == 4
+
+
+# ============================================
+# Master logs filters
+# ============================================
+
+def test_filtered_query_without_filters():
+    query, params = MasterLogs._filtered_query(limit=50)
+    assert 'WHERE' not in query
+    assert params == (50,)
+
+
+def test_filtered_query_combines_filters():
+    query, params = MasterLogs._filtered_query('user_pii', 'UPDATE', 10)
+    assert 'WHERE table_name = %s AND operation_type = %s' in query
+    assert params == ('user_pii', 'UPDATE', 10)
+
+
+# ============================================
+# User activity
+# ============================================
+
+def test_get_activity_returns_datetimes(monkeypatch):
+    activity = {
+        'logs': [{'timestamp': '2024-05-01T10:30:00.5', 'new_values': {'name': 'A'}}],
+        'booked_slots': [{'time_slot': None, 'created_at': '2024-05-01T09:00:00', 'updated_at': '2024-05-01T09:00:00'}],
+        'blog_submissions': [],
+        'kiro_submissions': [{'week_number': 1, 'created_at': '2024-05-02T08:00:00', 'updated_at': '2024-05-02T08:00:00'}],
+    }
+    monkeypatch.setattr(database.db_manager, 'execute_query', lambda query, params=None, fetch=True: [activity])
+
+    result = UserPII.get_activity('a@example.com')
+    assert result['logs'][0]['timestamp'] == datetime(2024, 5, 1, 10, 30, 0, 500000)
+    assert result['logs'][0]['new_values'] == {'name': 'A'}
+    assert result['booked_slots'][0]['time_slot'] is None
+    assert result['booked_slots'][0]['created_at'] == datetime(2024, 5, 1, 9)
+    assert result['kiro_submissions'][0]['created_at'] == datetime(2024, 5, 2, 8)
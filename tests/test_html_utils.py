@@ -0,0 +1,47 @@
+"""
+Tests for html_utils: blog like/comment count extraction
+"""
+from html_utils import COMMENT_BUTTON_LABEL, LIKE_BUTTON_LABEL, extract_action_count, parse_html
+
+
+def page(*buttons):
+    return parse_html('<html><body>' + ''.join(buttons) + '</body></html>')
+
+
+def test_prefers_card_action_text_span():
+    tree = page(
+        f'<button aria-label="{LIKE_BUTTON_LABEL}">'
+        '<span class="icon">7</span><span class="x_card-action-text_y">12</span></button>'
+    )
+    assert extract_action_count(tree, LIKE_BUTTON_LABEL) == 12
+
+
+def test_falls_back_to_any_numeric_span():
+    tree = page(
+        f'<button aria-label="{COMMENT_BUTTON_LABEL}">'
+        '<span>Comments</span><span> 3 </span></button>'
+    )
+    assert extract_action_count(tree, COMMENT_BUTTON_LABEL) == 3
+
+
+def test_matches_label_as_substring():
+    tree = page(
+        f'<button aria-label="{LIKE_BUTTON_LABEL} (liked)">'
+        '<span class="_card-action-text">5</span></button>'
+    )
+    assert extract_action_count(tree, LIKE_BUTTON_LABEL) == 5
+
+
+def test_counts_are_read_per_button():
+    tree = page(
+        f'<button aria-label="{LIKE_BUTTON_LABEL}"><span class="_card-action-text">9</span></button>',
+        f'<button aria-label="{COMMENT_BUTTON_LABEL}"><span class="_card-action-text">4</span></button>'
+    )
+    assert extract_action_count(tree, LIKE_BUTTON_LABEL) == 9
+    assert extract_action_count(tree, COMMENT_BUTTON_LABEL) == 4
+
+
+def test_returns_none_without_a_count():
+    tree = page(f'<button aria-label="{LIKE_BUTTON_LABEL}"><span>Like</span></button>')
+    assert extract_action_count(tree, LIKE_BUTTON_LABEL) is None
+    assert extract_action_count(tree, COMMENT_BUTTON_LABEL) is None
@@ -0,0 +1,158 @@
+"""
+Tests for http_utils: GitHub token rotation, rate limiting and bounded reads
+"""
+import pytest
+import requests
+
+import http_utils
+from http_utils import GitHubTokenPool, RateLimiter, read_limited
+
+
+@pytest.fixture
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(http_utils, 'time', clock)
+    return clock
+
+
+# ============================================
+# GitHubTokenPool
+# ============================================
+
+def test_token_pool_ignores_blank_tokens():
+    pool = GitHubTokenPool(['', ' a ', 'b', '  '])
+    assert len(pool) == 2
+    assert {pool.next_token(), pool.next_token()} == {'a', 'b'}
+
+
+def test_token_pool_rotates_round_robin():
+    pool = GitHubTokenPool(['a', 'b', 'c'])
+    assert [pool.next_token() for _ in range(6)] == ['a', 'b', 'c', 'a', 'b', 'c']
+
+
+def test_token_pool_skips_limited_tokens_until_reset(fake_time):
+    pool = GitHubTokenPool(['a', 'b'])
+    pool.mark_limited('a', fake_time.now + 60)
+    assert [pool.next_available_token() for _ in range(3)] == ['b', 'b', 'b']
+
+    fake_time.advance(60)
+    assert {pool.next_available_token(), pool.next_available_token()} == {'a', 'b'}
+
+
+def test_token_pool_falls_back_to_soonest_reset(fake_time):
+    pool = GitHubTokenPool(['a', 'b'])
+    pool.mark_limited('a', fake_time.now + 120)
+    pool.mark_limited('b', fake_time.now + 30)
+    assert pool.next_available_token() is None
+    assert pool.next_token() == 'b'
+
+
+def test_empty_token_pool():
+    pool = GitHubTokenPool([''])
+    assert len(pool) == 0
+    assert pool.next_available_token() is None
+    assert pool.next_token() is None
+
+
+# ============================================
+# RateLimiter
+# ============================================
+
+def test_rate_limiter_allows_burst_up_to_capacity(fake_time):
+    limiter = RateLimiter(rate=2, capacity=3)
+    for _ in range(3):
+        limiter.acquire()
+    assert fake_time.slept == []
+
+    limiter.acquire()
+    assert sum(fake_time.slept) == pytest.approx(0.5)
+
+
+def test_rate_limiter_refills_over_time(fake_time):
+    limiter = RateLimiter(rate=1, capacity=2)
+    limiter.acquire()
+    limiter.acquire()
+    fake_time.advance(2)
+    limiter.acquire()
+    limiter.acquire()
+    assert fake_time.slept == []
+
+
+def test_sync_spreads_spare_quota_until_reset(fake_time):
+    limiter = RateLimiter(rate=100, capacity=5)
+    for _ in range(5):
+        limiter.acquire()
+
+    # 10 requests above the reserve, 100 seconds left: one every 10 seconds
+    limiter.sync(remaining=20, reset_at=fake_time.now + 100, reserve=10)
+    limiter.acquire()
+    assert sum(fake_time.slept) == pytest.approx(10)
+
+
+def test_sync_never_refills_the_bucket(fake_time):
+    limiter = RateLimiter(rate=1, capacity=5)
+    for _ in range(5):
+        limiter.acquire()
+
+    limiter.sync(remaining=5000, reset_at=fake_time.now + 3600)
+    limiter.acquire()
+    assert sum(fake_time.slept) > 0
+
+
+def test_sync_pace_is_capped_at_max_rate(fake_time):
+    limiter = RateLimiter(rate=1, capacity=1, max_rate=2)
+    limiter.acquire()
+
+    limiter.sync(remaining=10000, reset_at=fake_time.now + 10)
+    limiter.acquire()
+    assert sum(fake_time.slept) == pytest.approx(0.5)
+
+
+def test_default_pace_returns_after_reset(fake_time):
+    limiter = RateLimiter(rate=1, capacity=1)
+    limiter.acquire()
+
+    # Nothing left above the reserve: wait for the window to reset
+    reset_at = fake_time.now + 100
+    limiter.sync(remaining=10, reset_at=reset_at, reserve=10)
+    limiter.acquire()
+    assert fake_time.now == pytest.approx(reset_at)
+
+
+def test_pause_until_blocks_until_resume(fake_time):
+    limiter = RateLimiter(rate=10, capacity=10)
+    resume_at = fake_time.now + 30
+    limiter.pause_until(resume_at)
+    limiter.acquire()
+    assert fake_time.now >= resume_at
+
+
+# ============================================
+# read_limited
+# ============================================
+
+class FakeResponse:
+    def __init__(self, chunks, clock=None, seconds_per_chunk=0):
+        self.chunks = chunks
+        self.clock = clock
+        self.seconds_per_chunk = seconds_per_chunk
+
+    def iter_content(self, chunk_size):
+        for chunk in self.chunks:
+            if self.clock:
+                self.clock.advance(self.seconds_per_chunk)
+            yield chunk
+
+
+def test_read_limited_reads_whole_small_body():
+    assert read_limited(FakeResponse([b'abc', b'def']), max_bytes=100) == b'abcdef'
+
+
+def test_read_limited_truncates_at_max_bytes():
+    response = FakeResponse([b'a' * 6, b'b' * 6, b'c' * 6])
+    assert read_limited(response, max_bytes=8) == b'aaaaaabb'
+
+
+def test_read_limited_times_out_on_slow_body(fake_time):
+    response = FakeResponse([b'a'] * 10, clock=fake_time, seconds_per_chunk=5)
+    with pytest.raises(requests.exceptions.Timeout):
+        read_limited(response, max_bytes=100, max_seconds=12)
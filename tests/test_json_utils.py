@@ -0,0 +1,98 @@
+"""
+Tests for json_utils: the orjson Flask provider and NDJSON event batching
+"""
+from datetime import datetime
+
+import orjson
+import pytest
+from flask import Flask, render_template_string
+
+import json_utils
+from json_utils import OrJSONProvider, coalesce_events, ndjson_line
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    app.json = OrJSONProvider(app)
+    return app
+
+
+@pytest.fixture
+def fake_time(monkeypatch, clock):
+    monkeypatch.setattr(json_utils, 'time', clock)
+    return clock
+
+
+# ============================================
+# OrJSONProvider
+# ============================================
+
+def test_dumps_sorts_keys_and_emits_iso_datetimes(app):
+    dumped = app.json.dumps({'b': 1, 'a': datetime(2024, 5, 1, 10, 30)})
+    assert dumped == '{"a":"2024-05-01T10:30:00","b":1}'
+
+
+def test_dumps_honors_indent(app):
+    assert app.json.dumps({'a': 1}, indent=2) == '{\n  "a": 1\n}'
+
+
+def test_tojson_filter_keeps_indentation(app):
+    with app.app_context():
+        rendered = render_template_string('{{ value | tojson(indent=2) }}', value={'a': 1})
+    assert rendered == '{\n  "a": 1\n}'
+
+
+def test_jsonify_response_body(app):
+    with app.app_context():
+        response = app.json.response({'a': [1, 2]})
+    assert orjson.loads(response.get_data()) == {'a': [1, 2]}
+    assert response.mimetype == 'application/json'
+
+
+# ============================================
+# NDJSON
+# ============================================
+
+def test_ndjson_line_is_newline_terminated_json():
+    line = ndjson_line({'current': 1})
+    assert line.endswith(b'\n')
+    assert orjson.loads(line) == {'current': 1}
+
+
+def test_coalesce_sends_first_event_alone_then_batches():
+    lines = list(coalesce_events(iter(range(7)), max_events=3, max_delay=float('inf')))
+    assert [orjson.loads(line) for line in lines] == [[0], [1, 2, 3], [4, 5, 6]]
+
+
+def test_coalesce_flushes_remainder_at_end():
+    lines = list(coalesce_events(iter(range(5)), max_events=3, max_delay=float('inf')))
+    assert [orjson.loads(line) for line in lines] == [[0], [1, 2, 3], [4]]
+
+
+def test_coalesce_flushes_after_max_delay(fake_time):
+    def events():
+        yield 'a'
+        yield 'b'
+        fake_time.advance(0.2)
+        yield 'c'
+
+    lines = list(coalesce_events(events(), max_events=20, max_delay=0.1))
+    assert [orjson.loads(line) for line in lines] == [['a'], ['b', 'c']]
+
+
+def test_coalesce_closes_source_when_closed_early():
+    closed = []
+
+    def events():
+        try:
+            while True:
+                yield 'event'
+        finally:
+            closed.append(True)
+
+    source = events()
+    batches = coalesce_events(source, max_events=2, max_delay=float('inf'))
+    next(batches)
+    batches.close()
+    assert closed == [True]
@@ -0,0 +1,125 @@
+"""
+Tests for the counter triggers in schema.sql
+
+These need a real PostgreSQL: set TEST_DATABASE_URL to a database the tests
+may create a throwaway schema in, otherwise they are skipped.
+"""
+import os
+import uuid
+
+import pytest
+
+psycopg2 = pytest.importorskip('psycopg2')
+
+TEST_DATABASE_URL = os.getenv('TEST_DATABASE_URL')
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'schema.sql')
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason='TEST_DATABASE_URL is not set')
+
+
+@pytest.fixture
+def cursor():
+    schema = f'test_{uuid.uuid4().hex[:12]}'
+    conn = psycopg2.connect(TEST_DATABASE_URL)
+    conn.autocommit = True
+    cur = conn.cursor()
+    try:
+        cur.execute(f'CREATE SCHEMA {schema}')
+        # public stays on the path so an already installed pg_trgm is found
+        cur.execute(f'SET search_path TO {schema}, public')
+        with open(SCHEMA_PATH, encoding='utf-8') as f:
+            cur.execute(f.read())
+        yield cur
+    finally:
+        cur.execute(f'DROP SCHEMA IF EXISTS {schema} CASCADE')
+        conn.close()
+
+
+def registrations(cur):
+    cur.execute('SELECT registration_date::TEXT, registration_count FROM registration_daily ORDER BY 1')
+    return dict(cur.fetchall())
+
+
+def week_stats(cur, week):
+    cur.execute(
+        'SELECT submission_count, blog_count, valid_blog_count, github_count, valid_github_count '
+        'FROM kiro_week_stats WHERE week_number = %s',
+        (week,)
+    )
+    return cur.fetchone()
+
+
+def add_user(cur, email, registered='2024-05-01 10:00'):
+    cur.execute(
+        'INSERT INTO user_pii (email, name, registration_date_time) VALUES (%s, %s, %s)',
+        (email, email.split('@')[0], registered)
+    )
+
+
+# ============================================
+# registration_daily
+# ============================================
+
+def test_registration_daily_counts_inserts_moves_and_deletes(cursor):
+    add_user(cursor, 'a@example.com', '2024-05-01 10:00')
+    add_user(cursor, 'b@example.com', '2024-05-01 18:00')
+    add_user(cursor, 'c@example.com', '2024-05-02 09:00')
+    assert registrations(cursor) == {'2024-05-01': 2, '2024-05-02': 1}
+
+    cursor.execute("UPDATE user_pii SET registration_date_time = '2024-05-02 12:00' WHERE email = 'a@example.com'")
+    assert registrations(cursor) == {'2024-05-01': 1, '2024-05-02': 2}
+
+    cursor.execute("DELETE FROM user_pii WHERE email = 'c@example.com'")
+    assert registrations(cursor) == {'2024-05-01': 1, '2024-05-02': 1}
+
+
+def test_registration_daily_matches_a_full_count(cursor):
+    for i in range(10):
+        add_user(cursor, f'user{i}@example.com', f'2024-05-0{1 + i % 3} 08:00')
+    cursor.execute("UPDATE user_pii SET name = 'Renamed'")
+    cursor.execute("DELETE FROM user_pii WHERE email IN ('user0@example.com', 'user4@example.com')")
+
+    cursor.execute(
+        'SELECT registration_date_time::DATE::TEXT, COUNT(*) FROM user_pii GROUP BY 1'
+    )
+    expected = dict(cursor.fetchall())
+    assert {day: count for day, count in registrations(cursor).items() if count} == expected
+
+
+# ============================================
+# kiro_week_stats
+# ============================================
+
+def test_kiro_week_stats_follow_submission_changes(cursor):
+    add_user(cursor, 'a@example.com')
+    add_user(cursor, 'b@example.com')
+    cursor.execute(
+        "INSERT INTO kiro_submission (week_number, email, blog_link, github_link) VALUES "
+        "(1, 'a@example.com', 'https://builder.aws.com/a', 'https://github.com/a/x'), "
+        "(1, 'b@example.com', 'https://builder.aws.com/b', NULL)"
+    )
+    assert week_stats(cursor, 1) == (2, 2, 0, 1, 0)
+
+    cursor.execute("UPDATE kiro_submission SET valid = TRUE, github_valid = TRUE WHERE email = 'a@example.com'")
+    assert week_stats(cursor, 1) == (2, 2, 1, 1, 1)
+
+    # Re-validating with the same outcome leaves the counts alone
+    cursor.execute("UPDATE kiro_submission SET valid = TRUE, likes = 5 WHERE email = 'a@example.com'")
+    assert week_stats(cursor, 1) == (2, 2, 1, 1, 1)
+
+    cursor.execute("UPDATE kiro_submission SET week_number = 2 WHERE email = 'b@example.com'")
+    assert week_stats(cursor, 1) == (1, 1, 1, 1, 1)
+    assert week_stats(cursor, 2) == (1, 1, 0, 0, 0)
+
+    cursor.execute("DELETE FROM kiro_submission WHERE email = 'a@example.com'")
+    assert week_stats(cursor, 1) == (0, 0, 0, 0, 0)
+
+
+def test_kiro_week_stats_drop_with_cascaded_user_delete(cursor):
+    add_user(cursor, 'a@example.com')
+    cursor.execute(
+        "INSERT INTO kiro_submission (week_number, email, github_link, github_valid) "
+        "VALUES (3, 'a@example.com', 'https://github.com/a/x', TRUE)"
+    )
+    cursor.execute("DELETE FROM user_pii WHERE email = 'a@example.com'")
+    assert week_stats(cursor, 3) == (0, 0, 0, 0, 0)